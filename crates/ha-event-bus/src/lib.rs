@@ -8,7 +8,7 @@
 //! This is a significant optimization for events with large JSON payloads.
 
 use std::sync::atomic::{AtomicU64, Ordering};
-use std::sync::Arc;
+use std::sync::{Arc, RwLock};
 
 use dashmap::DashMap;
 use tokio::sync::broadcast;
@@ -46,8 +46,9 @@ pub type SyncCallback = Arc<dyn Fn(&Event<serde_json::Value>) + Send + Sync>;
 pub struct EventBus {
     /// Map of event types to their broadcast senders (Arc-wrapped events)
     listeners: DashMap<EventType, broadcast::Sender<ArcEvent>>,
-    /// Special sender for MATCH_ALL subscribers (Arc-wrapped events)
-    match_all_sender: broadcast::Sender<ArcEvent>,
+    /// Special sender for MATCH_ALL subscribers (Arc-wrapped events).
+    /// Behind a lock only so `clear()` can swap in a fresh channel.
+    match_all_sender: RwLock<broadcast::Sender<ArcEvent>>,
     /// Synchronous callbacks per event type (called inline during fire).
     /// Use EventType::match_all() as key for MATCH_ALL listeners.
     sync_listeners: DashMap<EventType, Vec<(ListenerId, SyncCallback)>>,
@@ -68,7 +69,7 @@ impl EventBus {
         let (match_all_sender, _) = broadcast::channel(capacity);
         Self {
             listeners: DashMap::new(),
-            match_all_sender,
+            match_all_sender: RwLock::new(match_all_sender),
             sync_listeners: DashMap::new(),
             next_listener_id: AtomicU64::new(1),
             capacity,
@@ -84,7 +85,7 @@ impl EventBus {
         trace!(event_type = %event_type, "Subscribing to event type");
 
         if event_type.is_match_all() {
-            return self.match_all_sender.subscribe();
+            return self.subscribe_all();
         }
 
         self.listeners
@@ -111,7 +112,7 @@ impl EventBus {
     /// Returns a receiver that will receive Arc-wrapped events.
     /// Using Arc avoids cloning the event data for each subscriber.
     pub fn subscribe_all(&self) -> broadcast::Receiver<ArcEvent> {
-        self.match_all_sender.subscribe()
+        self.match_all_sender.read().unwrap().subscribe()
     }
 
     /// Fire an event to all subscribers
@@ -153,7 +154,7 @@ impl EventBus {
 
         // Send to MATCH_ALL subscribers, unless this event type is excluded
         if !Self::is_excluded_from_match_all(&arc_event.event_type) {
-            let _ = self.match_all_sender.send(arc_event);
+            let _ = self.match_all_sender.read().unwrap().send(arc_event);
         }
     }
 
@@ -236,6 +237,18 @@ impl EventBus {
             .map(|entry| (entry.key().clone(), entry.value().len()))
             .collect()
     }
+
+    /// Drop all broadcast channels and sync listeners
+    ///
+    /// Existing receivers, including MATCH_ALL ones, see their channel close
+    /// and get no further events. Listener IDs keep counting up so stale
+    /// unsubscribes are no-ops.
+    pub fn clear(&self) {
+        self.listeners.clear();
+        self.sync_listeners.clear();
+        let (match_all_sender, _) = broadcast::channel(self.capacity);
+        *self.match_all_sender.write().unwrap() = match_all_sender;
+    }
 }
 
 impl Default for EventBus {
@@ -31,7 +31,7 @@ pub use py_config_entries::{
 };
 pub use py_device_registry::{PyDeviceEntry, PyDeviceRegistry};
 pub use py_entity_registry::{PyEntityEntry, PyEntityRegistry};
-pub use py_event_bus::{PyBusEvent, PyEventBus, PyUnsubscribe};
+pub use py_event_bus::{fire_registry_event, PyBusEvent, PyEventBus, PyUnsubscribe};
 pub use py_floor_registry::{PyFloorEntry, PyFloorRegistry};
 pub use py_home_assistant::PyHomeAssistant;
 pub use py_label_registry::{PyLabelEntry, PyLabelRegistry};
@@ -3,7 +3,7 @@
 use chrono::{DateTime, Utc};
 use ha_registries::area_registry::{AreaEntry, AreaRegistry};
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyDict, PyFrozenSet};
 use std::sync::Arc;
 use tokio::runtime::Handle;
 
@@ -84,13 +84,13 @@ impl PyAreaEntry {
     }
 
     #[getter]
-    fn aliases(&self) -> Vec<String> {
-        self.inner.aliases.clone()
+    fn aliases<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyFrozenSet>> {
+        PyFrozenSet::new_bound(py, &self.inner.aliases)
     }
 
     #[getter]
-    fn labels(&self) -> Vec<String> {
-        self.inner.labels.clone()
+    fn labels<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyFrozenSet>> {
+        PyFrozenSet::new_bound(py, &self.inner.labels)
     }
 
     #[getter]
@@ -305,7 +305,7 @@ impl PyAreaRegistry {
         self.inner.get_by_name(name).map(PyAreaEntry::from_inner)
     }
 
-    /// Get all areas on a floor
+    /// Get all areas on a floor, oldest first
     fn async_get_areas_for_floor(&self, floor_id: &str) -> Vec<PyAreaEntry> {
         self.inner
             .get_by_floor_id(floor_id)
@@ -314,7 +314,7 @@ impl PyAreaRegistry {
             .collect()
     }
 
-    /// Get all areas with a label
+    /// Get all areas with a label, oldest first
     fn async_get_areas_for_label(&self, label_id: &str) -> Vec<PyAreaEntry> {
         self.inner
             .get_by_label_id(label_id)
@@ -498,6 +498,15 @@ impl PyAreaRegistry {
         self.inner.iter().map(PyAreaEntry::from_inner).collect()
     }
 
+    /// Get areas sorted by creation time (oldest first)
+    fn sorted_by_created_at(&self) -> Vec<PyAreaEntry> {
+        self.inner
+            .sorted_by_created_at()
+            .into_iter()
+            .map(PyAreaEntry::from_inner)
+            .collect()
+    }
+
     /// Get all areas as a dict (area_id -> AreaEntry)
     #[getter]
     fn areas(&self, py: Python<'_>) -> PyResult<Py<PyDict>> {
@@ -509,6 +518,12 @@ impl PyAreaRegistry {
         Ok(dict.unbind())
     }
 
+    /// Generation counter, bumped whenever the areas change
+    #[getter]
+    fn generation(&self) -> u64 {
+        self.inner.generation()
+    }
+
     fn __len__(&self) -> usize {
         self.inner.len()
     }
@@ -517,3 +532,9 @@ impl PyAreaRegistry {
         format!("AreaRegistry(count={})", self.inner.len())
     }
 }
+
+impl PyAreaRegistry {
+    pub fn inner(&self) -> &Arc<AreaRegistry> {
+        &self.inner
+    }
+}
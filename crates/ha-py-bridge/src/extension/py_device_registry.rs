@@ -12,7 +12,7 @@ use ha_registries::device_registry::{
 };
 use ha_registries::entity_registry::DisabledBy;
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PySet, PyTuple};
+use pyo3::types::{PyDict, PyList, PySet, PyString, PyTuple};
 use tokio::runtime::Handle;
 
 /// Compare two DeviceEntry instances and return the list of field names that changed.
@@ -133,6 +133,18 @@ fn compute_changed_fields(old: &DeviceEntry, new: &DeviceEntry) -> Vec<String> {
     changed
 }
 
+/// Interned Python str for an ID shared by many devices (config entries, areas, labels)
+///
+/// Every device referencing the same ID then hands Python the same str object,
+/// so set and dict comparisons hit the identity fast path.
+fn intern_id<'py>(py: Python<'py>, id: &str) -> Bound<'py, PyString> {
+    PyString::intern_bound(py, id)
+}
+
+fn intern_ids<'py>(py: Python<'py>, ids: &[String]) -> Vec<Bound<'py, PyString>> {
+    ids.iter().map(|id| intern_id(py, id)).collect()
+}
+
 /// Python wrapper for DeviceEntry
 #[pyclass(name = "DeviceEntry")]
 #[derive(Clone)]
@@ -168,13 +180,16 @@ impl PyDeviceEntry {
     }
 
     #[getter]
-    fn config_entries(&self) -> Vec<String> {
-        self.inner.config_entries.clone()
+    fn config_entries<'py>(&self, py: Python<'py>) -> Vec<Bound<'py, PyString>> {
+        intern_ids(py, &self.inner.config_entries)
     }
 
     #[getter]
-    fn primary_config_entry(&self) -> Option<&str> {
-        self.inner.primary_config_entry.as_deref()
+    fn primary_config_entry<'py>(&self, py: Python<'py>) -> Option<Bound<'py, PyString>> {
+        self.inner
+            .primary_config_entry
+            .as_deref()
+            .map(|id| intern_id(py, id))
     }
 
     #[getter]
@@ -251,21 +266,23 @@ impl PyDeviceEntry {
     }
 
     #[getter]
-    fn area_id(&self) -> Option<&str> {
-        self.inner.area_id.as_deref()
+    fn area_id<'py>(&self, py: Python<'py>) -> Option<Bound<'py, PyString>> {
+        self.inner.area_id.as_deref().map(|id| intern_id(py, id))
     }
 
     #[getter]
-    fn labels(&self) -> Vec<String> {
-        self.inner.labels.clone()
+    fn labels<'py>(&self, py: Python<'py>) -> Vec<Bound<'py, PyString>> {
+        intern_ids(py, &self.inner.labels)
     }
 
     #[getter]
     fn config_entries_subentries(&self, py: Python<'_>) -> PyResult<Py<PyDict>> {
         let dict = PyDict::new_bound(py);
         for (config_entry_id, subentries) in &self.inner.config_entries_subentries {
-            let py_list: Vec<Option<String>> = subentries.clone();
-            dict.set_item(config_entry_id, py_list)?;
+            dict.set_item(
+                intern_id(py, config_entry_id),
+                PyList::new_bound(py, subentries),
+            )?;
         }
         Ok(dict.unbind())
     }
@@ -302,6 +319,113 @@ impl PyDeviceEntry {
         self.inner.insertion_order
     }
 
+    /// Revision of the entry, changed whenever Rust stores a new version of it
+    #[getter]
+    fn revision(&self) -> u64 {
+        self.inner.revision
+    }
+
+    /// Build the device's dict representation in a single call
+    ///
+    /// Set-like fields are emitted as lists (pairs as 2-item lists) so the dict is
+    /// JSON-ready. Enum fields are left as strings for the caller to convert.
+    fn dict_repr(&self, py: Python<'_>) -> PyResult<Py<PyDict>> {
+        let entry = &self.inner;
+        let pair_list = |pairs: Vec<[&str; 2]>| {
+            PyList::new_bound(py, pairs.into_iter().map(|p| PyList::new_bound(py, p)))
+        };
+
+        let subentries = PyDict::new_bound(py);
+        for (config_entry_id, ids) in &entry.config_entries_subentries {
+            subentries.set_item(intern_id(py, config_entry_id), PyList::new_bound(py, ids))?;
+        }
+
+        let dict = PyDict::new_bound(py);
+        dict.set_item("area_id", self.area_id(py))?;
+        dict.set_item("configuration_url", entry.configuration_url.as_deref())?;
+        dict.set_item(
+            "config_entries",
+            PyList::new_bound(py, self.config_entries(py)),
+        )?;
+        dict.set_item("config_entries_subentries", subentries)?;
+        dict.set_item(
+            "connections",
+            pair_list(
+                entry
+                    .connections
+                    .iter()
+                    .map(|c| [c.connection_type(), c.id()])
+                    .collect(),
+            ),
+        )?;
+        dict.set_item("created_at", self.created_at_timestamp())?;
+        dict.set_item("disabled_by", self.disabled_by())?;
+        dict.set_item("entry_type", self.entry_type())?;
+        dict.set_item("hw_version", entry.hw_version.as_deref())?;
+        dict.set_item("id", &entry.id)?;
+        dict.set_item(
+            "identifiers",
+            pair_list(
+                entry
+                    .identifiers
+                    .iter()
+                    .map(|i| [i.domain(), i.id()])
+                    .collect(),
+            ),
+        )?;
+        dict.set_item("labels", PyList::new_bound(py, self.labels(py)))?;
+        dict.set_item("manufacturer", entry.manufacturer.as_deref())?;
+        dict.set_item("model", entry.model.as_deref())?;
+        dict.set_item("model_id", entry.model_id.as_deref())?;
+        dict.set_item("modified_at", self.modified_at_timestamp())?;
+        dict.set_item("name_by_user", entry.name_by_user.as_deref())?;
+        dict.set_item("name", entry.name.as_deref())?;
+        dict.set_item("primary_config_entry", self.primary_config_entry(py))?;
+        dict.set_item("serial_number", entry.serial_number.as_deref())?;
+        dict.set_item("sw_version", entry.sw_version.as_deref())?;
+        dict.set_item("via_device_id", entry.via_device_id.as_deref())?;
+        Ok(dict.unbind())
+    }
+
+    /// Snapshot of the fields compared for change detection, built in one call
+    ///
+    /// Set-like fields are Python sets (pairs as tuples). Enum fields are left
+    /// as strings for the caller to convert.
+    fn snapshot(&self, py: Python<'_>) -> PyResult<Py<PyDict>> {
+        let entry = &self.inner;
+
+        let subentries = PyDict::new_bound(py);
+        for (config_entry_id, ids) in &entry.config_entries_subentries {
+            subentries.set_item(intern_id(py, config_entry_id), PySet::new_bound(py, ids)?)?;
+        }
+
+        let dict = PyDict::new_bound(py);
+        dict.set_item("area_id", self.area_id(py))?;
+        dict.set_item(
+            "config_entries",
+            PySet::new_bound(py, &self.config_entries(py))?,
+        )?;
+        dict.set_item("config_entries_subentries", subentries)?;
+        dict.set_item("configuration_url", entry.configuration_url.as_deref())?;
+        dict.set_item("connections", self.connections(py)?)?;
+        dict.set_item("disabled_by", self.disabled_by())?;
+        dict.set_item("entry_type", self.entry_type())?;
+        dict.set_item("hw_version", entry.hw_version.as_deref())?;
+        dict.set_item("identifiers", self.identifiers(py)?)?;
+        dict.set_item("labels", PySet::new_bound(py, &self.labels(py))?)?;
+        dict.set_item("manufacturer", entry.manufacturer.as_deref())?;
+        dict.set_item("model", entry.model.as_deref())?;
+        dict.set_item("model_id", entry.model_id.as_deref())?;
+        dict.set_item("name", entry.name.as_deref())?;
+        dict.set_item("name_by_user", entry.name_by_user.as_deref())?;
+        dict.set_item("primary_config_entry", self.primary_config_entry(py))?;
+        dict.set_item("serial_number", entry.serial_number.as_deref())?;
+        dict.set_item("suggested_area", entry.suggested_area.as_deref())?;
+        dict.set_item("sw_version", entry.sw_version.as_deref())?;
+        dict.set_item("via_device_id", entry.via_device_id.as_deref())?;
+        Ok(dict.unbind())
+    }
+
     fn is_disabled(&self) -> bool {
         self.inner.is_disabled()
     }
@@ -350,74 +474,54 @@ fn parse_disabled_by(s: Option<&str>) -> Option<DisabledBy> {
     })
 }
 
-fn parse_identifiers(py_set: &Bound<'_, PySet>) -> PyResult<Vec<DeviceIdentifier>> {
+/// Parse `(str, str)` pairs from any Python iterable (set, frozenset, list, ...)
+///
+/// The strings are borrowed from the Python objects, so callers can pass their
+/// sets straight through without re-boxing them into lists of tuples first.
+/// Pairs may be tuples or lists; other items are skipped.
+fn parse_pairs<T>(py_obj: &Bound<'_, PyAny>, make: impl Fn(&str, &str) -> T) -> PyResult<Vec<T>> {
     let mut result = Vec::new();
-    for item in py_set.iter() {
-        let tuple = item.downcast::<PyTuple>()?;
-        if tuple.len() == 2 {
-            let domain: String = tuple.get_item(0)?.extract()?;
-            let id: String = tuple.get_item(1)?.extract()?;
-            result.push(DeviceIdentifier::new(domain, id));
-        }
+    for item in py_obj.iter()? {
+        let item = item?;
+        let (first, second) = if let Ok(tuple) = item.downcast::<PyTuple>() {
+            if tuple.len() != 2 {
+                continue;
+            }
+            (tuple.get_item(0)?, tuple.get_item(1)?)
+        } else if let Ok(list) = item.downcast::<PyList>() {
+            if list.len() != 2 {
+                continue;
+            }
+            (list.get_item(0)?, list.get_item(1)?)
+        } else {
+            continue;
+        };
+        result.push(make(
+            first.downcast::<PyString>()?.to_str()?,
+            second.downcast::<PyString>()?.to_str()?,
+        ));
     }
     Ok(result)
 }
 
+fn parse_identifiers(py_set: &Bound<'_, PySet>) -> PyResult<Vec<DeviceIdentifier>> {
+    parse_identifiers_any(py_set.as_any())
+}
+
 fn parse_connections(py_set: &Bound<'_, PySet>) -> PyResult<Vec<DeviceConnection>> {
-    let mut result = Vec::new();
-    for item in py_set.iter() {
-        let tuple = item.downcast::<PyTuple>()?;
-        if tuple.len() == 2 {
-            let conn_type: String = tuple.get_item(0)?.extract()?;
-            let id: String = tuple.get_item(1)?.extract()?;
-            result.push(DeviceConnection::normalized(conn_type, id));
-        }
-    }
-    Ok(result)
+    parse_connections_any(py_set.as_any())
 }
 
 /// Parse identifiers from any iterable (set, list, or frozenset)
 fn parse_identifiers_any(py_obj: &Bound<'_, PyAny>) -> PyResult<Vec<DeviceIdentifier>> {
-    let mut result = Vec::new();
-    // Try as a set first
-    if let Ok(set) = py_obj.downcast::<PySet>() {
-        return parse_identifiers(set);
-    }
-    // Try as a list
-    if let Ok(list) = py_obj.downcast::<pyo3::types::PyList>() {
-        for item in list.iter() {
-            if let Ok(tuple) = item.downcast::<PyTuple>() {
-                if tuple.len() == 2 {
-                    let domain: String = tuple.get_item(0)?.extract()?;
-                    let id: String = tuple.get_item(1)?.extract()?;
-                    result.push(DeviceIdentifier::new(domain, id));
-                }
-            }
-        }
-    }
-    Ok(result)
+    parse_pairs(py_obj, |domain, id| DeviceIdentifier::new(domain, id))
 }
 
 /// Parse connections from any iterable (set, list, or frozenset)
 fn parse_connections_any(py_obj: &Bound<'_, PyAny>) -> PyResult<Vec<DeviceConnection>> {
-    let mut result = Vec::new();
-    // Try as a set first
-    if let Ok(set) = py_obj.downcast::<PySet>() {
-        return parse_connections(set);
-    }
-    // Try as a list
-    if let Ok(list) = py_obj.downcast::<pyo3::types::PyList>() {
-        for item in list.iter() {
-            if let Ok(tuple) = item.downcast::<PyTuple>() {
-                if tuple.len() == 2 {
-                    let conn_type: String = tuple.get_item(0)?.extract()?;
-                    let id: String = tuple.get_item(1)?.extract()?;
-                    result.push(DeviceConnection::normalized(conn_type, id));
-                }
-            }
-        }
-    }
-    Ok(result)
+    parse_pairs(py_obj, |conn_type, id| {
+        DeviceConnection::normalized(conn_type, id)
+    })
 }
 
 /// Python wrapper for DeviceRegistry
@@ -595,6 +699,9 @@ impl PyDeviceRegistry {
         sw_version: Option<&str>,
         hw_version: Option<&str>,
         via_device: Option<&Bound<'_, PyAny>>,
+        // None leaves the field alone and "" clears it: PyO3 folds an explicit
+        // Python None into the outer Option, so Option<Option<&str>> can't carry
+        // the three states. StrEnum members extract as their value.
         configuration_url: Option<&str>,
         entry_type: Option<&str>,
         config_subentry_id: Option<&str>,
@@ -1344,12 +1451,40 @@ impl PyDeviceRegistry {
 
     /// Clear a config entry from all devices, returning change information.
     ///
-    /// Returns (removed_device_ids, [(device_id, changed_fields)])
+    /// Returns ([(device_id, dict_repr)], [(device_id, old_values)]): the
+    /// dict_repr of each removed device as it was before removal, and for each
+    /// updated device the previous value of every changed field (snapshot
+    /// format). Everything is built in this one call.
+    #[allow(clippy::type_complexity)]
     fn async_clear_config_entry_with_changes(
         &self,
+        py: Python<'_>,
         config_entry_id: &str,
-    ) -> (Vec<String>, Vec<(String, Vec<String>)>) {
-        self.inner.clear_config_entry_with_changes(config_entry_id)
+    ) -> PyResult<(Vec<(String, Py<PyDict>)>, Vec<(String, Py<PyDict>)>)> {
+        let (removed, updated) = self.inner.clear_config_entry_with_changes(config_entry_id);
+
+        let mut changes = Vec::with_capacity(updated.len());
+        for (old_entry, changed_fields) in updated {
+            let device_id = old_entry.id.clone();
+            let snapshot = PyDeviceEntry::from_inner(old_entry).snapshot(py)?;
+            let snapshot = snapshot.bind(py);
+            let old_values = PyDict::new_bound(py);
+            for field in &changed_fields {
+                if let Some(value) = snapshot.get_item(field)? {
+                    old_values.set_item(field, value)?;
+                }
+            }
+            changes.push((device_id, old_values.unbind()));
+        }
+
+        let mut removed_reprs = Vec::with_capacity(removed.len());
+        for old_entry in removed {
+            let device_id = old_entry.id.clone();
+            let dict_repr = PyDeviceEntry::from_inner(old_entry).dict_repr(py)?;
+            removed_reprs.push((device_id, dict_repr));
+        }
+
+        Ok((removed_reprs, changes))
     }
 
     /// Clear area_id from all devices that reference it.
@@ -1384,11 +1519,25 @@ impl PyDeviceRegistry {
         self.inner.get(device_id).is_some()
     }
 
+    /// Get the IDs of all devices with a label, sorted by created_at
+    fn async_device_ids_for_label(&self, label_id: &str) -> Vec<String> {
+        self.inner.device_ids_for_label(label_id)
+    }
+
     /// Get all device IDs
     fn device_ids(&self) -> Vec<String> {
         self.inner.device_ids()
     }
 
+    /// Get all devices in insertion order
+    fn sorted_by_insertion_order(&self) -> Vec<PyDeviceEntry> {
+        self.inner
+            .sorted_by_insertion_order()
+            .into_iter()
+            .map(PyDeviceEntry::from_inner)
+            .collect()
+    }
+
     /// Get all devices as a dict (device_id -> DeviceEntry)
     #[getter]
     fn devices(&self, py: Python<'_>) -> PyResult<Py<PyDict>> {
@@ -1416,24 +1565,25 @@ impl PyDeviceRegistry {
         self.inner.deleted_len()
     }
 
-    /// Find a deleted device by identifiers or connections
+    /// Find a deleted device by identifiers or connections (any iterables of pairs)
+    #[pyo3(signature = (identifiers=None, connections=None))]
     fn async_get_deleted_by_identifiers_or_connections(
         &self,
-        identifiers: Vec<(String, String)>,
-        connections: Vec<(String, String)>,
-    ) -> Option<PyDeviceEntry> {
-        use ha_registries::device_registry::{DeviceConnection, DeviceIdentifier};
-        let idents: Vec<DeviceIdentifier> = identifiers
-            .into_iter()
-            .map(|(d, i)| DeviceIdentifier::new(d, i))
-            .collect();
-        let conns: Vec<DeviceConnection> = connections
-            .into_iter()
-            .map(|(t, i)| DeviceConnection::normalized(t, i))
-            .collect();
-        self.inner
+        identifiers: Option<&Bound<'_, PyAny>>,
+        connections: Option<&Bound<'_, PyAny>>,
+    ) -> PyResult<Option<PyDeviceEntry>> {
+        let idents = match identifiers {
+            Some(i) => parse_identifiers_any(i)?,
+            None => Vec::new(),
+        };
+        let conns = match connections {
+            Some(c) => parse_connections_any(c)?,
+            None => Vec::new(),
+        };
+        Ok(self
+            .inner
             .get_deleted_by_identifiers_or_connections(&idents, &conns)
-            .map(PyDeviceEntry::from_inner)
+            .map(PyDeviceEntry::from_inner))
     }
 
     /// Restore a deleted device back to the active registry
@@ -1451,27 +1601,27 @@ impl PyDeviceRegistry {
     fn async_restore_deleted_fresh(
         &self,
         device_id: &str,
-        identifiers: Vec<(String, String)>,
-        connections: Vec<(String, String)>,
+        identifiers: Option<&Bound<'_, PyAny>>,
+        connections: Option<&Bound<'_, PyAny>>,
         config_entry_id: &str,
         config_subentry_id: Option<&str>,
         timestamp: f64,
-    ) -> Option<PyDeviceEntry> {
-        use ha_registries::device_registry::{DeviceConnection, DeviceIdentifier};
-        let idents: Vec<DeviceIdentifier> = identifiers
-            .into_iter()
-            .map(|(d, i)| DeviceIdentifier::new(d, i))
-            .collect();
-        let conns: Vec<DeviceConnection> = connections
-            .into_iter()
-            .map(|(t, i)| DeviceConnection::normalized(t, i))
-            .collect();
+    ) -> PyResult<Option<PyDeviceEntry>> {
+        let idents = match identifiers {
+            Some(i) => parse_identifiers_any(i)?,
+            None => Vec::new(),
+        };
+        let conns = match connections {
+            Some(c) => parse_connections_any(c)?,
+            None => Vec::new(),
+        };
         let ts = chrono::DateTime::from_timestamp(
             timestamp as i64,
             ((timestamp % 1.0) * 1_000_000_000.0) as u32,
         )
         .unwrap_or_else(chrono::Utc::now);
-        self.inner
+        Ok(self
+            .inner
             .restore_deleted_fresh(
                 device_id,
                 &idents,
@@ -1480,7 +1630,7 @@ impl PyDeviceRegistry {
                 config_subentry_id,
                 ts,
             )
-            .map(PyDeviceEntry::from_inner)
+            .map(PyDeviceEntry::from_inner))
     }
 
     /// Clear config entry from all deleted devices
@@ -1520,22 +1670,29 @@ impl PyDeviceRegistry {
     }
 
     /// Remove deleted devices that have matching identifiers or connections
+    #[pyo3(signature = (identifiers=None, connections=None))]
     fn remove_deleted_by_identifiers_or_connections(
         &self,
-        identifiers: Vec<(String, String)>,
-        connections: Vec<(String, String)>,
-    ) {
-        use ha_registries::device_registry::{DeviceConnection, DeviceIdentifier};
-        let idents: Vec<DeviceIdentifier> = identifiers
-            .into_iter()
-            .map(|(d, i)| DeviceIdentifier::new(d, i))
-            .collect();
-        let conns: Vec<DeviceConnection> = connections
-            .into_iter()
-            .map(|(t, i)| DeviceConnection::normalized(t, i))
-            .collect();
+        identifiers: Option<&Bound<'_, PyAny>>,
+        connections: Option<&Bound<'_, PyAny>>,
+    ) -> PyResult<()> {
+        let idents = match identifiers {
+            Some(i) => parse_identifiers_any(i)?,
+            None => Vec::new(),
+        };
+        let conns = match connections {
+            Some(c) => parse_connections_any(c)?,
+            None => Vec::new(),
+        };
         self.inner
             .remove_deleted_by_identifiers_or_connections(&idents, &conns);
+        Ok(())
+    }
+
+    /// Generation counter, bumped whenever the active devices change
+    #[getter]
+    fn generation(&self) -> u64 {
+        self.inner.generation()
     }
 
     fn __len__(&self) -> usize {
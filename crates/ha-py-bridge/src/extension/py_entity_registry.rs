@@ -4,18 +4,22 @@ use ha_registries::entity_registry::{
     DisabledBy, EntityCategory, EntityEntry, EntityRegistry, HiddenBy,
 };
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
-use std::collections::HashSet;
-use std::sync::Arc;
+use pyo3::types::{PyDict, PyString};
+use std::collections::{HashMap, HashSet};
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::{Arc, Mutex};
 use tokio::runtime::Handle;
 
 use super::py_types::{json_to_py, py_to_json};
 
 /// Python wrapper for EntityEntry
+///
+/// Shares the registry's `Arc<EntityEntry>` instead of copying the entry, so
+/// handing entries to Python is a refcount bump.
 #[pyclass(name = "EntityEntry")]
 #[derive(Clone)]
 pub struct PyEntityEntry {
-    inner: EntityEntry,
+    inner: Arc<EntityEntry>,
 }
 
 #[pymethods]
@@ -25,9 +29,10 @@ impl PyEntityEntry {
         &self.inner.id
     }
 
+    /// Interned, so wrappers and dict keys for the same entity share one str
     #[getter]
-    fn entity_id(&self) -> &str {
-        &self.inner.entity_id
+    fn entity_id<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        PyString::intern_bound(py, &self.inner.entity_id)
     }
 
     #[getter]
@@ -210,6 +215,40 @@ impl PyEntityEntry {
         self.inner.orphaned_timestamp
     }
 
+    /// In-memory revision, bumped on every update that changes the entry
+    #[getter]
+    fn revision(&self) -> u64 {
+        self.inner.revision
+    }
+
+    /// Fields of a DeletedRegistryEntry as keyword arguments, built in one call
+    ///
+    /// Enum and timestamp fields are left as strings for the caller to convert.
+    fn deleted_entry_fields(&self, py: Python<'_>) -> PyResult<Py<PyDict>> {
+        let entry = &self.inner;
+        let dict = PyDict::new_bound(py);
+        dict.set_item("entity_id", &entry.entity_id)?;
+        dict.set_item("unique_id", entry.unique_id.as_deref().unwrap_or(""))?;
+        dict.set_item("platform", &entry.platform)?;
+        dict.set_item("aliases", &entry.aliases)?;
+        dict.set_item("area_id", entry.area_id.as_deref())?;
+        dict.set_item("categories", self.categories(py)?)?;
+        dict.set_item("config_entry_id", entry.config_entry_id.as_deref())?;
+        dict.set_item("config_subentry_id", entry.config_subentry_id.as_deref())?;
+        dict.set_item("created_at", self.created_at())?;
+        dict.set_item("device_class", entry.device_class.as_deref())?;
+        dict.set_item("disabled_by", self.disabled_by())?;
+        dict.set_item("hidden_by", self.hidden_by())?;
+        dict.set_item("icon", entry.icon.as_deref())?;
+        dict.set_item("id", &entry.id)?;
+        dict.set_item("labels", &entry.labels)?;
+        dict.set_item("modified_at", self.modified_at())?;
+        dict.set_item("name", entry.name.as_deref())?;
+        dict.set_item("options", self.options(py)?)?;
+        dict.set_item("orphaned_timestamp", entry.orphaned_timestamp)?;
+        Ok(dict.unbind())
+    }
+
     fn is_disabled(&self) -> bool {
         self.inner.is_disabled()
     }
@@ -238,11 +277,9 @@ impl PyEntityEntry {
 }
 
 impl PyEntityEntry {
-    /// Create from Arc<EntityEntry> - clones the inner value for Python ownership
+    /// Create from Arc<EntityEntry> - shares the registry's entry
     pub fn from_inner(inner: Arc<EntityEntry>) -> Self {
-        Self {
-            inner: (*inner).clone(),
-        }
+        Self { inner }
     }
 
     pub fn inner(&self) -> &EntityEntry {
@@ -250,6 +287,35 @@ impl PyEntityEntry {
     }
 }
 
+impl PyEntityRegistry {
+    /// Return the cached wrapper for `entry` or build (and cache) a new one
+    ///
+    /// Without a wrapper factory the raw entry is returned. The cache lock is not
+    /// held while the factory runs, since it calls back into Python.
+    fn wrap(&self, py: Python<'_>, entry: PyEntityEntry, force_new: bool) -> PyResult<PyObject> {
+        let Some(factory) = self.wrapper_factory.as_ref() else {
+            return Ok(entry.into_py(py));
+        };
+        let source = Arc::clone(&entry.inner);
+        if let Ok(cache) = self.wrapper_cache.lock() {
+            if let Some((cached_source, wrapper)) = cache.get(&source.entity_id) {
+                // Same Arc means the registry hasn't replaced the entry since
+                if !force_new
+                    || Arc::ptr_eq(cached_source, &source)
+                    || cached_source.revision == source.revision
+                {
+                    return Ok(wrapper.clone_ref(py));
+                }
+            }
+        }
+        let wrapper = factory.call1(py, (entry,))?;
+        if let Ok(mut cache) = self.wrapper_cache.lock() {
+            cache.insert(source.entity_id.clone(), (source, wrapper.clone_ref(py)));
+        }
+        Ok(wrapper)
+    }
+}
+
 fn parse_disabled_by(s: Option<&str>) -> Option<DisabledBy> {
     s.and_then(|s| match s {
         "config_entry" => Some(DisabledBy::ConfigEntry),
@@ -275,6 +341,12 @@ pub struct PyEntityRegistry {
     inner: Arc<EntityRegistry>,
     #[pyo3(get)]
     hass: PyObject,
+    /// Python callable that builds the HA-facing wrapper for an EntityEntry
+    wrapper_factory: Option<PyObject>,
+    /// Wrapper objects keyed by entity_id, stored next to the entry they were built from
+    wrapper_cache: Mutex<HashMap<String, (Arc<EntityEntry>, PyObject)>>,
+    /// Set by every mutation, cleared when the registry is written to storage
+    dirty: AtomicBool,
 }
 
 #[pymethods]
@@ -293,11 +365,60 @@ impl PyEntityRegistry {
         Ok(Self {
             inner: Arc::new(registry),
             hass,
+            wrapper_factory: None,
+            wrapper_cache: Mutex::new(HashMap::new()),
+            dirty: AtomicBool::new(false),
         })
     }
 
+    /// Set the Python callable used by `wrap_entry` to build wrapper objects
+    fn set_wrapper_factory(&mut self, factory: PyObject) {
+        self.wrapper_factory = Some(factory);
+        self.clear_wrappers();
+    }
+
+    /// Get the cached wrapper for an entry, building a new one when missing
+    ///
+    /// With `force_new`, the cached wrapper is only reused if it was built from
+    /// the same entry revision (i.e. the update was a no-op).
+    #[pyo3(signature = (entry, force_new=false))]
+    fn wrap_entry(
+        &self,
+        py: Python<'_>,
+        entry: PyEntityEntry,
+        force_new: bool,
+    ) -> PyResult<PyObject> {
+        self.wrap(py, entry, force_new)
+    }
+
+    /// Drop the cached wrapper for an entity
+    fn pop_wrapper(&self, entity_id: &str) {
+        if let Ok(mut cache) = self.wrapper_cache.lock() {
+            cache.remove(entity_id);
+        }
+    }
+
+    /// Drop all cached wrappers
+    fn clear_wrappers(&self) {
+        if let Ok(mut cache) = self.wrapper_cache.lock() {
+            cache.clear();
+        }
+    }
+
+    /// Flag the registry as having unsaved changes
+    fn mark_dirty(&self) {
+        self.dirty.store(true, Ordering::Relaxed);
+    }
+
+    /// Clear the unsaved-changes flag, returning whether it was set
+    fn take_dirty(&self) -> bool {
+        self.dirty.swap(false, Ordering::Relaxed)
+    }
+
     /// Load entities from storage
     fn async_load(&self) -> PyResult<()> {
+        self.clear_wrappers();
+        self.dirty.store(false, Ordering::Relaxed);
         // Try to use existing Tokio runtime, or create a new one
         let inner = self.inner.clone();
         if let Ok(handle) = Handle::try_current() {
@@ -318,6 +439,7 @@ impl PyEntityRegistry {
 
     /// Save entities to storage
     fn async_save(&self) -> PyResult<()> {
+        self.dirty.store(false, Ordering::Relaxed);
         // Try to use existing Tokio runtime, or create a new one
         let inner = self.inner.clone();
         if let Ok(handle) = Handle::try_current() {
@@ -354,25 +476,57 @@ impl PyEntityRegistry {
         self.inner.is_deleted(domain, platform, unique_id)
     }
 
+    /// Get a deleted entity by its (domain, platform, unique_id) key
+    fn async_get_deleted(
+        &self,
+        domain: &str,
+        platform: &str,
+        unique_id: &str,
+    ) -> Option<PyEntityEntry> {
+        self.inner
+            .get_deleted(domain, platform, unique_id)
+            .map(PyEntityEntry::from_inner)
+    }
+
+    /// Get deleted entity keys ((domain, platform, unique_id)) in insertion order
+    fn deleted_entity_keys(&self) -> Vec<(String, String, String)> {
+        self.inner.deleted_keys()
+    }
+
+    /// Get count of deleted entities
+    fn deleted_entities_len(&self) -> usize {
+        self.inner.deleted_len()
+    }
+
+    /// Forget all deleted entities
+    fn clear_deleted(&self) {
+        self.inner.clear_deleted();
+        self.mark_dirty();
+    }
+
     /// Clear area_id from deleted entities matching the given area_id
     fn clear_deleted_area_id(&self, area_id: &str) {
-        self.inner.clear_deleted_area_id(area_id)
+        self.inner.clear_deleted_area_id(area_id);
+        self.mark_dirty();
     }
 
     /// Clear label_id from deleted entities that have it
     fn clear_deleted_label_id(&self, label_id: &str) {
-        self.inner.clear_deleted_label_id(label_id)
+        self.inner.clear_deleted_label_id(label_id);
+        self.mark_dirty();
     }
 
     /// Clear category from deleted entities matching scope and category_id
     fn clear_deleted_category_id(&self, scope: &str, category_id: &str) {
-        self.inner.clear_deleted_category_id(scope, category_id)
+        self.inner.clear_deleted_category_id(scope, category_id);
+        self.mark_dirty();
     }
 
     /// Clear config_entry_id from deleted entities matching the given config_entry_id
     fn clear_deleted_config_entry(&self, config_entry_id: &str, orphaned_timestamp: f64) {
         self.inner
-            .clear_deleted_config_entry(config_entry_id, orphaned_timestamp)
+            .clear_deleted_config_entry(config_entry_id, orphaned_timestamp);
+        self.mark_dirty();
     }
 
     /// Clear config_subentry_id from deleted entities matching the given config_entry_id and subentry_id
@@ -386,7 +540,8 @@ impl PyEntityRegistry {
             config_entry_id,
             config_subentry_id,
             orphaned_timestamp,
-        )
+        );
+        self.mark_dirty();
     }
 
     /// Get entity by unique_id
@@ -534,6 +689,7 @@ impl PyEntityRegistry {
             config_entry_id,
             device_id,
         );
+        self.mark_dirty();
 
         // Parse timestamps if provided (ISO format strings)
         let created_timestamp = created_at.and_then(|s| {
@@ -686,10 +842,12 @@ impl PyEntityRegistry {
         original_name=None,
         supported_features=None,
         translation_key=None,
-        config_entry_is_disabled=None
+        config_entry_is_disabled=None,
+        wrap=false
     ))]
     fn async_update_entity(
         &self,
+        py: Python<'_>,
         entity_id: &str,
         name: Option<String>,
         icon: Option<String>,
@@ -717,7 +875,9 @@ impl PyEntityRegistry {
         // Whether the new config entry (if config_entry_id is changing) is disabled.
         // Used for disabled_by propagation logic.
         config_entry_is_disabled: Option<bool>,
-    ) -> PyResult<PyEntityEntry> {
+        // Return the cached/rebuilt wrapper (see `wrap_entry`) instead of the raw entry
+        wrap: bool,
+    ) -> PyResult<PyObject> {
         // Unique ID conflict detection
         if let Some(ref new_uid) = new_unique_id {
             if !new_uid.is_empty() {
@@ -875,7 +1035,19 @@ impl PyEntityRegistry {
             })
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyKeyError, _>(format!("{}", e)))?;
 
-        Ok(PyEntityEntry::from_inner(entry))
+        self.mark_dirty();
+
+        // Drop the wrapper cached under the old entity_id after a rename
+        if entry.entity_id != entity_id {
+            self.pop_wrapper(entity_id);
+        }
+
+        let py_entry = PyEntityEntry::from_inner(entry);
+        if wrap {
+            self.wrap(py, py_entry, true)
+        } else {
+            Ok(py_entry.into_py(py))
+        }
     }
 
     /// Remove an entity
@@ -883,12 +1055,66 @@ impl PyEntityRegistry {
     /// This is idempotent - removing a non-existent entity is a no-op.
     fn async_remove(&self, entity_id: &str) {
         // Ignore result - removing non-existent entity is a no-op
-        let _ = self.inner.remove(entity_id);
+        if self.inner.remove(entity_id).is_some() {
+            self.mark_dirty();
+        }
+        self.pop_wrapper(entity_id);
     }
 
     /// Remove multiple entities at once, returning the list of removed entity IDs.
     fn async_bulk_remove(&self, entity_ids: Vec<String>) -> Vec<String> {
-        self.inner.bulk_remove(&entity_ids)
+        let removed = self.inner.bulk_remove(&entity_ids);
+        if !removed.is_empty() {
+            self.mark_dirty();
+        }
+        if let Ok(mut cache) = self.wrapper_cache.lock() {
+            for entity_id in &removed {
+                cache.remove(entity_id);
+            }
+        }
+        removed
+    }
+
+    /// Clean up the entities of a removed device in one call
+    ///
+    /// Entities belonging to one of `config_entry_ids` are removed, the others
+    /// only lose their device_id. Returns `(removed_ids, detached_ids)`.
+    fn async_device_removed(
+        &self,
+        device_id: &str,
+        config_entry_ids: HashSet<String>,
+    ) -> (Vec<String>, Vec<String>) {
+        let (to_remove, to_detach): (Vec<_>, Vec<_>) = self
+            .inner
+            .get_by_device_id(device_id)
+            .into_iter()
+            .partition(|entry| {
+                entry
+                    .config_entry_id
+                    .as_ref()
+                    .is_some_and(|ce_id| config_entry_ids.contains(ce_id))
+            });
+        let to_remove: Vec<String> = to_remove.into_iter().map(|e| e.entity_id.clone()).collect();
+        let removed = self.inner.bulk_remove(&to_remove);
+        for entity_id in &removed {
+            self.pop_wrapper(entity_id);
+        }
+        let mut detached = Vec::with_capacity(to_detach.len());
+        for entry in to_detach {
+            if self
+                .inner
+                .update(&entry.entity_id, |e| e.device_id = None)
+                .is_ok()
+            {
+                // The cached wrapper still carries the old device_id
+                self.pop_wrapper(&entry.entity_id);
+                detached.push(entry.entity_id.clone());
+            }
+        }
+        if !removed.is_empty() || !detached.is_empty() {
+            self.mark_dirty();
+        }
+        (removed, detached)
     }
 
     /// Check if an entity is registered
@@ -918,8 +1144,12 @@ impl PyEntityRegistry {
     }
 
     /// Get all entity IDs
-    fn entity_ids(&self) -> Vec<String> {
-        self.inner.entity_ids()
+    fn entity_ids<'py>(&self, py: Python<'py>) -> Vec<Bound<'py, PyString>> {
+        self.inner
+            .entity_ids()
+            .iter()
+            .map(|entity_id| PyString::intern_bound(py, entity_id))
+            .collect()
     }
 
     /// Get all entities as a dict (entity_id -> EntityEntry)
@@ -927,8 +1157,38 @@ impl PyEntityRegistry {
     fn entities(&self, py: Python<'_>) -> PyResult<Py<PyDict>> {
         let dict = PyDict::new_bound(py);
         for entry in self.inner.iter() {
-            let entity_id = entry.entity_id.clone();
-            dict.set_item(&entity_id, PyEntityEntry::from_inner(entry).into_py(py))?;
+            let entity_id = PyString::intern_bound(py, &entry.entity_id);
+            dict.set_item(entity_id, PyEntityEntry::from_inner(entry).into_py(py))?;
+        }
+        Ok(dict.unbind())
+    }
+
+    /// Get all entities as a dict (entity_id -> wrapper) in one call
+    ///
+    /// Cached wrappers are looked up under a single lock; the wrapper factory
+    /// is only called for entries that have no wrapper yet.
+    fn entities_as_wrapper_dict(&self, py: Python<'_>) -> PyResult<Py<PyDict>> {
+        let entries = self.inner.iter();
+        let cached: Vec<Option<PyObject>> = match self.wrapper_cache.lock() {
+            Ok(cache) if self.wrapper_factory.is_some() => entries
+                .iter()
+                .map(|entry| {
+                    cache
+                        .get(&entry.entity_id)
+                        .map(|(_, wrapper)| wrapper.clone_ref(py))
+                })
+                .collect(),
+            _ => entries.iter().map(|_| None).collect(),
+        };
+
+        let dict = PyDict::new_bound(py);
+        for (entry, wrapper) in entries.into_iter().zip(cached) {
+            let entity_id = PyString::intern_bound(py, &entry.entity_id);
+            let wrapper = match wrapper {
+                Some(wrapper) => wrapper,
+                None => self.wrap(py, PyEntityEntry::from_inner(entry), false)?,
+            };
+            dict.set_item(entity_id, wrapper)?;
         }
         Ok(dict.unbind())
     }
@@ -999,6 +1259,7 @@ impl PyEntityRegistry {
                 }
             })
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyKeyError, _>(format!("{}", e)))?;
+        self.mark_dirty();
 
         Ok(PyEntityEntry::from_inner(entry))
     }
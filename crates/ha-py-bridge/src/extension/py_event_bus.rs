@@ -4,8 +4,9 @@ use std::sync::Arc;
 
 use ha_core::{Event, State};
 use ha_event_bus::{EventBus, ListenerId, SyncCallback};
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyDict, PyString};
 
 use super::py_types::{json_to_py, py_to_json, PyContext, PyState};
 
@@ -371,6 +372,27 @@ impl PyUnsubscribe {
     }
 }
 
+/// Fire a registry updated event with payload `{"action": action, key: value}`
+///
+/// Shared by the registry wrappers: the payload is built here with an interned
+/// "action" key and `bus.async_fire` is looked up through an interned name, so
+/// a fire allocates nothing but the dict.
+#[pyfunction]
+pub fn fire_registry_event(
+    bus: &Bound<'_, PyAny>,
+    event_type: &Bound<'_, PyString>,
+    action: &Bound<'_, PyString>,
+    key: &Bound<'_, PyString>,
+    value: &Bound<'_, PyString>,
+) -> PyResult<()> {
+    let py = bus.py();
+    let data = PyDict::new_bound(py);
+    data.set_item(intern!(py, "action"), action)?;
+    data.set_item(key, value)?;
+    bus.call_method1(intern!(py, "async_fire"), (event_type, data))?;
+    Ok(())
+}
+
 impl PyEventBus {
     pub fn from_arc(inner: Arc<EventBus>) -> Self {
         Self { inner }
@@ -3,7 +3,7 @@
 use chrono::{DateTime, Utc};
 use ha_registries::floor_registry::{FloorEntry, FloorRegistry};
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyDict, PyFrozenSet};
 use std::sync::Arc;
 use tokio::runtime::Handle;
 
@@ -74,8 +74,8 @@ impl PyFloorEntry {
     }
 
     #[getter]
-    fn aliases(&self) -> Vec<String> {
-        self.inner.aliases.clone()
+    fn aliases<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyFrozenSet>> {
+        PyFrozenSet::new_bound(py, &self.inner.aliases)
     }
 
     #[getter]
@@ -95,8 +95,9 @@ impl PyFloorEntry {
         )
     }
 
+    /// Compare all fields, like HA's FloorEntry dataclass
     fn __eq__(&self, other: &Self) -> bool {
-        self.inner.id == other.inner.id
+        self.inner == other.inner
     }
 
     fn __hash__(&self) -> u64 {
@@ -320,6 +321,15 @@ impl PyFloorRegistry {
             .collect()
     }
 
+    /// Get floors sorted by creation time (oldest first)
+    fn sorted_by_created_at(&self) -> Vec<PyFloorEntry> {
+        self.inner
+            .sorted_by_created_at()
+            .into_iter()
+            .map(PyFloorEntry::from_inner)
+            .collect()
+    }
+
     /// Get all floors as a dict (floor_id -> FloorEntry)
     #[getter]
     fn floors(&self, py: Python<'_>) -> PyResult<Py<PyDict>> {
@@ -331,6 +341,12 @@ impl PyFloorRegistry {
         Ok(dict.unbind())
     }
 
+    /// Generation counter, bumped whenever the floors change
+    #[getter]
+    fn generation(&self) -> u64 {
+        self.inner.generation()
+    }
+
     fn __len__(&self) -> usize {
         self.inner.len()
     }
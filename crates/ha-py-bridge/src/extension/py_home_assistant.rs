@@ -2,7 +2,7 @@
 
 use std::sync::{
     atomic::{AtomicUsize, Ordering},
-    Arc,
+    Arc, RwLock,
 };
 
 use ha_automation::{ConditionEvaluator, TriggerEvaluator};
@@ -82,7 +82,7 @@ impl TaskTracker {
 /// - template_engine: Template rendering engine
 /// - condition_evaluator: For evaluating conditions
 /// - trigger_evaluator: For evaluating triggers
-#[pyclass(name = "HomeAssistant")]
+#[pyclass(name = "HomeAssistant", weakref)]
 pub struct PyHomeAssistant {
     bus: Arc<EventBus>,
     states: Arc<StateStore>,
@@ -90,7 +90,9 @@ pub struct PyHomeAssistant {
     template_engine: Arc<TemplateEngine>,
     condition_evaluator: Arc<ConditionEvaluator>,
     trigger_evaluator: Arc<TriggerEvaluator>,
-    task_tracker: Arc<TaskTracker>,
+    /// Swapped for a fresh tracker on `reset()`, so tasks still running from
+    /// before the reset decrement the old count instead of the new one
+    task_tracker: RwLock<Arc<TaskTracker>>,
 }
 
 #[pymethods]
@@ -118,7 +120,7 @@ impl PyHomeAssistant {
             template_engine,
             condition_evaluator,
             trigger_evaluator,
-            task_tracker,
+            task_tracker: RwLock::new(task_tracker),
         }
     }
 
@@ -180,7 +182,7 @@ impl PyHomeAssistant {
             ))
         })?;
 
-        let task_tracker = self.task_tracker.clone();
+        let task_tracker = self.task_tracker();
 
         // Block on waiting for tasks to complete
         tokio::task::block_in_place(|| {
@@ -226,9 +228,22 @@ impl PyHomeAssistant {
         false
     }
 
+    /// Clear all states, services, event listeners and pending tasks in place
+    ///
+    /// Lets a test harness reuse one instance instead of rebuilding every
+    /// component. Handles previously returned by `bus`, `states`, etc. stay
+    /// valid and see the cleared state; event receivers opened before the
+    /// reset are closed.
+    fn reset(&self) {
+        self.states.clear();
+        self.services.clear();
+        self.bus.clear();
+        *self.task_tracker.write().unwrap() = Arc::new(TaskTracker::new());
+    }
+
     /// Get the number of pending background tasks
     fn pending_task_count(&self) -> usize {
-        self.task_tracker.pending_count()
+        self.task_tracker().pending_count()
     }
 
     fn __repr__(&self) -> String {
@@ -236,7 +251,7 @@ impl PyHomeAssistant {
             "HomeAssistant(entities={}, services={}, pending_tasks={})",
             self.states.entity_count(),
             self.services.service_count(),
-            self.task_tracker.pending_count()
+            self.task_tracker().pending_count()
         )
     }
 }
@@ -254,7 +269,7 @@ impl PyHomeAssistant {
         &self.services
     }
 
-    pub fn task_tracker(&self) -> &Arc<TaskTracker> {
-        &self.task_tracker
+    pub fn task_tracker(&self) -> Arc<TaskTracker> {
+        self.task_tracker.read().unwrap().clone()
     }
 }
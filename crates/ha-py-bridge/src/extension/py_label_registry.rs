@@ -7,6 +7,8 @@ use pyo3::types::PyDict;
 use std::sync::Arc;
 use tokio::runtime::Handle;
 
+use super::py_area_registry::PyAreaRegistry;
+
 /// Get the current time from Python's datetime.now(UTC) (respects freezer in tests)
 fn py_utc_now(py: Python<'_>) -> DateTime<Utc> {
     let datetime_mod = py
@@ -78,14 +80,40 @@ impl PyLabelEntry {
         self.inner.description.as_deref()
     }
 
+    /// Returned as an aware `datetime`, so Python needs no ISO parsing
     #[getter]
-    fn created_at(&self) -> String {
-        self.inner.created_at.to_rfc3339()
+    fn created_at(&self) -> DateTime<Utc> {
+        self.inner.created_at
     }
 
     #[getter]
-    fn modified_at(&self) -> String {
-        self.inner.modified_at.to_rfc3339()
+    fn modified_at(&self) -> DateTime<Utc> {
+        self.inner.modified_at
+    }
+
+    /// All compared fields in one call, in LabelEntry dataclass order:
+    /// `(label_id, name, icon, color, description, created_at, modified_at)`
+    #[allow(clippy::type_complexity)]
+    fn snapshot(
+        &self,
+    ) -> (
+        &str,
+        &str,
+        Option<&str>,
+        Option<&str>,
+        Option<&str>,
+        DateTime<Utc>,
+        DateTime<Utc>,
+    ) {
+        (
+            &self.inner.id,
+            &self.inner.name,
+            self.inner.icon.as_deref(),
+            self.inner.color.as_deref(),
+            self.inner.description.as_deref(),
+            self.inner.created_at,
+            self.inner.modified_at,
+        )
     }
 
     fn __repr__(&self) -> String {
@@ -295,6 +323,23 @@ impl PyLabelRegistry {
         Ok(())
     }
 
+    /// Delete a label and clear it from the areas of `area_registry`
+    ///
+    /// The label delete cascade in one call instead of a delete here plus an
+    /// `async_clear_label_id` on the area registry.
+    #[pyo3(signature = (label_id, area_registry=None))]
+    fn async_delete_cascade(
+        &self,
+        label_id: &str,
+        area_registry: Option<PyRef<'_, PyAreaRegistry>>,
+    ) -> PyResult<()> {
+        self.async_delete(label_id)?;
+        if let Some(area_registry) = area_registry {
+            area_registry.inner().clear_label_id(label_id);
+        }
+        Ok(())
+    }
+
     /// List all labels
     fn async_list_labels(&self) -> Vec<PyLabelEntry> {
         self.inner.iter().map(PyLabelEntry::from_inner).collect()
@@ -309,6 +354,15 @@ impl PyLabelRegistry {
             .collect()
     }
 
+    /// Get labels sorted by creation time (oldest first)
+    fn sorted_by_created_at(&self) -> Vec<PyLabelEntry> {
+        self.inner
+            .sorted_by_created_at()
+            .into_iter()
+            .map(PyLabelEntry::from_inner)
+            .collect()
+    }
+
     /// Get all labels as a dict (label_id -> LabelEntry)
     #[getter]
     fn labels(&self, py: Python<'_>) -> PyResult<Py<PyDict>> {
@@ -320,6 +374,12 @@ impl PyLabelRegistry {
         Ok(dict.unbind())
     }
 
+    /// Generation counter, bumped whenever the labels change
+    #[getter]
+    fn generation(&self) -> u64 {
+        self.inner.generation()
+    }
+
     fn __len__(&self) -> usize {
         self.inner.len()
     }
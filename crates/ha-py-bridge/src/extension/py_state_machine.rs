@@ -52,6 +52,32 @@ impl PyStateStore {
         Ok(PyState::from_inner(state))
     }
 
+    /// Set the states of many entities in one call
+    ///
+    /// Args:
+    ///     states: Iterable of (entity_id, state, attributes) tuples, where
+    ///         attributes is a dict (subclasses such as ReadOnlyDict work) or None
+    ///
+    /// Returns:
+    ///     The number of states set
+    fn bulk_set(&self, states: &Bound<'_, PyAny>) -> PyResult<usize> {
+        let mut count = 0;
+        for item in states.iter()? {
+            let (entity_id, state, attributes): (String, String, Option<Bound<'_, PyDict>>) =
+                item?.extract()?;
+            let entity_id: EntityId = entity_id
+                .parse()
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("{}", e)))?;
+            let attrs = match attributes {
+                Some(dict) => py_dict_to_hashmap(&dict)?,
+                None => std::collections::HashMap::new(),
+            };
+            self.inner.set(entity_id, state, attrs, Default::default());
+            count += 1;
+        }
+        Ok(count)
+    }
+
     /// Get the current state of an entity
     ///
     /// Args:
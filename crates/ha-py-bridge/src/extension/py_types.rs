@@ -2,7 +2,7 @@
 
 use ha_core::{Context, EntityId, State};
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyBool, PyDict, PyFloat, PyLong, PyString};
 use std::collections::HashMap;
 
 /// Python wrapper for EntityId
@@ -331,9 +331,41 @@ pub fn json_to_py(py: Python<'_>, value: &serde_json::Value) -> PyResult<PyObjec
 
 /// Convert Python object to serde_json::Value
 pub fn py_to_json(obj: &Bound<'_, PyAny>) -> PyResult<serde_json::Value> {
+    // Builtin types are dispatched by type check first: every failed extract()
+    // in the fallback chain below builds a PyErr, which dominated converting
+    // template variables and attribute dicts
     if obj.is_none() {
-        Ok(serde_json::Value::Null)
-    } else if let Ok(b) = obj.extract::<bool>() {
+        return Ok(serde_json::Value::Null);
+    }
+    if let Ok(s) = obj.downcast_exact::<PyString>() {
+        return Ok(serde_json::Value::String(s.to_str()?.to_owned()));
+    }
+    if let Ok(b) = obj.downcast_exact::<PyBool>() {
+        return Ok(serde_json::Value::Bool(b.is_true()));
+    }
+    if let Ok(f) = obj.downcast_exact::<PyFloat>() {
+        return Ok(serde_json::json!(f.value()));
+    }
+    if obj.is_exact_instance_of::<PyLong>() {
+        if let Ok(i) = obj.extract::<i64>() {
+            return Ok(serde_json::json!(i));
+        }
+    }
+    if let Ok(list) = obj.downcast::<pyo3::types::PyList>() {
+        let arr: Result<Vec<_>, _> = list.iter().map(|item| py_to_json(&item)).collect();
+        return Ok(serde_json::Value::Array(arr?));
+    }
+    if let Ok(dict) = obj.downcast::<PyDict>() {
+        let mut map = serde_json::Map::new();
+        for (k, v) in dict.iter() {
+            let key: String = k.extract()?;
+            map.insert(key, py_to_json(&v)?);
+        }
+        return Ok(serde_json::Value::Object(map));
+    }
+
+    // Subclasses (e.g. StrEnum members) and other number-likes
+    if let Ok(b) = obj.extract::<bool>() {
         Ok(serde_json::Value::Bool(b))
     } else if let Ok(i) = obj.extract::<i64>() {
         Ok(serde_json::json!(i))
@@ -341,16 +373,6 @@ pub fn py_to_json(obj: &Bound<'_, PyAny>) -> PyResult<serde_json::Value> {
         Ok(serde_json::json!(f))
     } else if let Ok(s) = obj.extract::<String>() {
         Ok(serde_json::Value::String(s))
-    } else if let Ok(list) = obj.downcast::<pyo3::types::PyList>() {
-        let arr: Result<Vec<_>, _> = list.iter().map(|item| py_to_json(&item)).collect();
-        Ok(serde_json::Value::Array(arr?))
-    } else if let Ok(dict) = obj.downcast::<PyDict>() {
-        let mut map = serde_json::Map::new();
-        for (k, v) in dict.iter() {
-            let key: String = k.extract()?;
-            map.insert(key, py_to_json(&v)?);
-        }
-        Ok(serde_json::Value::Object(map))
     } else if let Ok(set) = obj.downcast::<pyo3::types::PySet>() {
         // Convert Python set to JSON array
         let arr: Result<Vec<_>, _> = set.iter().map(|item| py_to_json(&item)).collect();
@@ -73,6 +73,7 @@ fn ha_core_rs(py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PyAreaRegistry>()?;
     m.add_class::<PyFloorRegistry>()?;
     m.add_class::<PyLabelRegistry>()?;
+    m.add_function(wrap_pyfunction!(fire_registry_event, m)?)?;
 
     // Registry entries (also available via helpers submodules)
     m.add_class::<PyEntityEntry>()?;
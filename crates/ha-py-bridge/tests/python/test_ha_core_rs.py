@@ -17,6 +17,8 @@ from ha_core_rs import (
     EntityId,
     State,
     Event,
+    LabelRegistry,
+    fire_registry_event,
 )
 
 
@@ -127,6 +129,27 @@ class TestStateMachine:
         state = hass.states.get("sensor.temp")
         assert state.state == "22"
 
+    def test_bulk_set(self) -> None:
+        """Test bulk_set sets every state and fires one state_changed each."""
+        hass = HomeAssistant()
+        events = []
+        hass.bus.listen("state_changed", events.append)
+
+        count = hass.states.bulk_set([
+            ("light.kitchen", "on", {"brightness": 255}),
+            ("light.hall", "off", None),
+            ("sensor.temp", "21", {"unit": "°C"}),
+        ])
+
+        assert count == 3
+        assert hass.states.get("light.kitchen").attributes == {"brightness": 255}
+        assert hass.states.get("light.hall").attributes == {}
+        assert [event.data["entity_id"] for event in events] == [
+            "light.kitchen",
+            "light.hall",
+            "sensor.temp",
+        ]
+
     def test_entity_ids_by_domain(self) -> None:
         """Test getting entity IDs filtered by domain."""
         hass = HomeAssistant()
@@ -387,6 +410,53 @@ class TestHomeAssistant:
         hass = HomeAssistant()
         assert hass.pending_task_count() == 0
 
+    def test_reset_clears_states_and_services(self) -> None:
+        """Test reset() empties the state machine and service registry."""
+        hass = HomeAssistant()
+        hass.states.set("light.test", "on", {})
+        hass.services.register("test", "svc", lambda c: None)
+
+        hass.reset()
+
+        assert hass.states.get("light.test") is None
+        assert hass.services.has_service("test", "svc") is False
+
+    def test_reset_removes_listeners(self) -> None:
+        """Test listeners registered before reset() no longer receive events."""
+        hass = HomeAssistant()
+        events = []
+        all_events = []
+        hass.bus.listen("test_event", events.append)
+        hass.bus.listen("*", all_events.append)
+
+        hass.reset()
+        hass.bus.fire("test_event", {})
+
+        assert events == []
+        assert all_events == []
+        assert hass.bus.async_listeners() == {}
+
+    def test_reset_keeps_handles_valid(self) -> None:
+        """Test bus and states handles taken before reset() keep working."""
+        hass = HomeAssistant()
+        bus = hass.bus
+        states = hass.states
+
+        hass.reset()
+        events = []
+        bus.listen("test_event", events.append)
+        hass.bus.fire("test_event", {"key": "value"})
+        states.set("light.test", "on", {})
+
+        assert len(events) == 1
+        assert hass.states.get("light.test").state == "on"
+
+    def test_reset_pending_task_count(self) -> None:
+        """Test reset() starts from a fresh task tracker."""
+        hass = HomeAssistant()
+        hass.reset()
+        assert hass.pending_task_count() == 0
+
     def test_homeassistant_repr(self) -> None:
         """Test HomeAssistant repr."""
         hass = HomeAssistant()
@@ -399,6 +469,46 @@ class TestHomeAssistant:
         assert "services=1" in repr_str
 
 
+class _StorageOnlyHass:
+    """Minimal hass with config.path() and no bus, as registries are built with."""
+
+    class _Config:
+        def __init__(self, base_path: str) -> None:
+            self._base_path = base_path
+
+        def path(self, *args: str) -> str:
+            import os
+
+            return os.path.join(self._base_path, *args)
+
+    def __init__(self, base_path: str) -> None:
+        self.config = self._Config(base_path)
+        self.data: dict = {}
+
+
+class TestRegistryEvents:
+    """Test firing registry updated events."""
+
+    def test_label_create_event(self, tmp_path) -> None:
+        """Test label_registry_updated reaches the bus after async_create.
+
+        The registry is built on a hass without a bus, so the event must be
+        fired on the bus passed in rather than one captured by the registry.
+        """
+        registry = LabelRegistry(_StorageOnlyHass(str(tmp_path)))
+        hass = HomeAssistant()
+        events = []
+        hass.bus.listen("label_registry_updated", events.append)
+
+        label = registry.async_create("Kitchen")
+        fire_registry_event(
+            hass.bus, "label_registry_updated", "create", "label_id", label.label_id
+        )
+
+        assert len(events) == 1
+        assert events[0].data == {"action": "create", "label_id": label.label_id}
+
+
 class TestState:
     """Test State object properties."""
 
@@ -3,14 +3,15 @@
 //! Tracks all registered areas (rooms, zones) in the home.
 
 use std::collections::HashSet;
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::Arc;
 
 use chrono::{DateTime, Utc};
-use dashmap::DashMap;
 use serde::{Deserialize, Serialize};
 use tracing::{debug, info};
 
 use crate::storage::{Storable, Storage, StorageFile, StorageResult};
+use crate::FastDashMap;
 
 /// Storage key for area registry
 pub const STORAGE_KEY: &str = "core.area_registry";
@@ -130,16 +131,20 @@ pub struct AreaRegistry {
     storage: Arc<Storage>,
 
     /// Primary index: area_id -> AreaEntry (Arc-wrapped)
-    by_id: DashMap<String, Arc<AreaEntry>>,
+    by_id: FastDashMap<String, Arc<AreaEntry>>,
 
     /// Index: normalized_name -> area_id
-    by_name: DashMap<String, String>,
+    by_name: FastDashMap<String, String>,
 
     /// Index: floor_id -> set of area_ids
-    by_floor_id: DashMap<String, HashSet<String>>,
+    by_floor_id: FastDashMap<String, HashSet<String>>,
 
     /// Index: label_id -> set of area_ids
-    by_label_id: DashMap<String, HashSet<String>>,
+    by_label_id: FastDashMap<String, HashSet<String>>,
+
+    /// Bumped on every change to the stored entries, so wrappers can tell
+    /// whether a cached view is still current
+    generation: AtomicU64,
 }
 
 impl AreaRegistry {
@@ -147,10 +152,11 @@ impl AreaRegistry {
     pub fn new(storage: Arc<Storage>) -> Self {
         Self {
             storage,
-            by_id: DashMap::new(),
-            by_name: DashMap::new(),
-            by_floor_id: DashMap::new(),
-            by_label_id: DashMap::new(),
+            by_id: FastDashMap::default(),
+            by_name: FastDashMap::default(),
+            by_floor_id: FastDashMap::default(),
+            by_label_id: FastDashMap::default(),
+            generation: AtomicU64::new(0),
         }
     }
 
@@ -208,6 +214,7 @@ impl AreaRegistry {
         }
 
         self.by_id.insert(area_id, entry);
+        self.generation.fetch_add(1, Ordering::Relaxed);
     }
 
     /// Remove an entry from indexes
@@ -229,6 +236,7 @@ impl AreaRegistry {
         }
 
         self.by_id.remove(&entry.id);
+        self.generation.fetch_add(1, Ordering::Relaxed);
     }
 
     /// Get area by ID
@@ -246,20 +254,26 @@ impl AreaRegistry {
             .and_then(|area_id| self.get(&area_id))
     }
 
-    /// Get all areas on a floor
+    /// Get all areas on a floor, oldest first
     pub fn get_by_floor_id(&self, floor_id: &str) -> Vec<Arc<AreaEntry>> {
-        self.by_floor_id
+        let mut areas: Vec<_> = self
+            .by_floor_id
             .get(floor_id)
             .map(|ids| ids.iter().filter_map(|id| self.get(id)).collect())
-            .unwrap_or_default()
+            .unwrap_or_default();
+        areas.sort_by_key(|a| a.created_at);
+        areas
     }
 
-    /// Get all areas with a given label
+    /// Get all areas with a given label, oldest first
     pub fn get_by_label_id(&self, label_id: &str) -> Vec<Arc<AreaEntry>> {
-        self.by_label_id
+        let mut areas: Vec<_> = self
+            .by_label_id
             .get(label_id)
             .map(|ids| ids.iter().filter_map(|id| self.get(id)).collect())
-            .unwrap_or_default()
+            .unwrap_or_default();
+        areas.sort_by_key(|a| a.created_at);
+        areas
     }
 
     /// Create a new area
@@ -406,6 +420,7 @@ impl AreaRegistry {
                 entry.modified_at = Utc::now();
                 let new_arc = Arc::new(entry);
                 self.by_id.insert(area_id.clone(), new_arc);
+                self.generation.fetch_add(1, Ordering::Relaxed);
             }
         }
 
@@ -430,6 +445,7 @@ impl AreaRegistry {
                 entry.modified_at = Utc::now();
                 let new_arc = Arc::new(entry);
                 self.by_id.insert(area_id.clone(), new_arc);
+                self.generation.fetch_add(1, Ordering::Relaxed);
             }
         }
 
@@ -437,6 +453,11 @@ impl AreaRegistry {
         self.by_label_id.remove(label_id);
     }
 
+    /// Generation counter, bumped whenever any entry is stored or removed
+    pub fn generation(&self) -> u64 {
+        self.generation.load(Ordering::Relaxed)
+    }
+
     /// Get count of areas
     pub fn len(&self) -> usize {
         self.by_id.len()
@@ -453,6 +474,15 @@ impl AreaRegistry {
     pub fn iter(&self) -> impl Iterator<Item = Arc<AreaEntry>> + '_ {
         self.by_id.iter().map(|r| Arc::clone(r.value()))
     }
+
+    /// Get all areas sorted by creation time (oldest first)
+    ///
+    /// Returns `Arc<AreaEntry>` references - cheap to clone.
+    pub fn sorted_by_created_at(&self) -> Vec<Arc<AreaEntry>> {
+        let mut areas: Vec<_> = self.iter().collect();
+        areas.sort_by_key(|a| a.created_at);
+        areas
+    }
 }
 
 // Unit tests removed - covered by HA native tests via `make ha-compat-test`
@@ -8,12 +8,12 @@ use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::Arc;
 
 use chrono::{DateTime, Utc};
-use dashmap::DashMap;
 use serde::{Deserialize, Serialize};
 use tracing::{debug, info};
 
 use crate::entity_registry::DisabledBy;
 use crate::storage::{Storable, Storage, StorageFile, StorageResult};
+use crate::FastDashMap;
 
 /// Storage key for device registry
 pub const STORAGE_KEY: &str = "core.device_registry";
@@ -284,6 +284,12 @@ pub struct DeviceEntry {
     /// Insertion order (for stable iteration when timestamps are equal)
     #[serde(skip)]
     pub insertion_order: u64,
+
+    /// In-memory revision, unique across the registry and reassigned whenever
+    /// the entry is stored (active or deleted). Lets wrappers detect changes
+    /// without comparing fields.
+    #[serde(skip)]
+    pub revision: u64,
 }
 
 impl DeviceEntry {
@@ -320,6 +326,7 @@ impl DeviceEntry {
             modified_at: now,
             orphaned_timestamp: None,
             insertion_order: 0,
+            revision: 0,
         }
     }
 
@@ -351,6 +358,7 @@ impl DeviceEntry {
             modified_at,
             orphaned_timestamp: None,
             insertion_order: 0,
+            revision: 0,
         }
     }
 
@@ -424,28 +432,35 @@ pub struct DeviceRegistry {
     storage: Arc<Storage>,
 
     /// Primary index: device_id -> DeviceEntry (Arc-wrapped)
-    by_id: DashMap<String, Arc<DeviceEntry>>,
+    by_id: FastDashMap<String, Arc<DeviceEntry>>,
 
     /// Index: identifier key -> device_id
-    by_identifier: DashMap<String, String>,
+    by_identifier: FastDashMap<String, String>,
 
     /// Index: connection key -> device_id
-    by_connection: DashMap<String, String>,
+    by_connection: FastDashMap<String, String>,
 
     /// Index: config_entry_id -> set of device_ids
-    by_config_entry_id: DashMap<String, HashSet<String>>,
+    by_config_entry_id: FastDashMap<String, HashSet<String>>,
 
     /// Index: area_id -> set of device_ids
-    by_area_id: DashMap<String, HashSet<String>>,
+    by_area_id: FastDashMap<String, HashSet<String>>,
 
     /// Index: via_device_id -> set of device_ids (child devices)
-    by_via_device_id: DashMap<String, HashSet<String>>,
+    by_via_device_id: FastDashMap<String, HashSet<String>>,
 
     /// Deleted devices (soft delete, Arc-wrapped)
-    deleted: DashMap<String, Arc<DeviceEntry>>,
+    deleted: FastDashMap<String, Arc<DeviceEntry>>,
 
     /// Counter for insertion ordering
     insertion_counter: AtomicU64,
+
+    /// Counter for entry revisions
+    revision_counter: AtomicU64,
+
+    /// Bumped on every change to the active devices, so wrappers can tell
+    /// whether a cached view is still current
+    generation: AtomicU64,
 }
 
 impl DeviceRegistry {
@@ -453,14 +468,16 @@ impl DeviceRegistry {
     pub fn new(storage: Arc<Storage>) -> Self {
         Self {
             storage,
-            by_id: DashMap::new(),
-            by_identifier: DashMap::new(),
-            by_connection: DashMap::new(),
-            by_config_entry_id: DashMap::new(),
-            by_area_id: DashMap::new(),
-            by_via_device_id: DashMap::new(),
-            deleted: DashMap::new(),
+            by_id: FastDashMap::default(),
+            by_identifier: FastDashMap::default(),
+            by_connection: FastDashMap::default(),
+            by_config_entry_id: FastDashMap::default(),
+            by_area_id: FastDashMap::default(),
+            by_via_device_id: FastDashMap::default(),
+            deleted: FastDashMap::default(),
             insertion_counter: AtomicU64::new(0),
+            revision_counter: AtomicU64::new(0),
+            generation: AtomicU64::new(0),
         }
     }
 
@@ -479,11 +496,11 @@ impl DeviceRegistry {
             devices.sort_by_key(|e| e.created_at);
             for mut entry in devices {
                 entry.insertion_order = self.insertion_counter.fetch_add(1, Ordering::Relaxed);
-                self.index_entry(Arc::new(entry));
+                self.index_entry(entry);
             }
 
             for entry in storage_file.data.deleted_devices {
-                self.deleted.insert(entry.id.clone(), Arc::new(entry));
+                self.insert_deleted(entry);
             }
         }
         Ok(())
@@ -504,10 +521,12 @@ impl DeviceRegistry {
         Ok(())
     }
 
-    /// Index an entry in all indexes
+    /// Index an entry in all indexes under a fresh revision
     ///
-    /// Takes an `Arc<DeviceEntry>` to avoid cloning.
-    fn index_entry(&self, entry: Arc<DeviceEntry>) {
+    /// Returns the stored `Arc<DeviceEntry>` so callers don't need to clone.
+    fn index_entry(&self, mut entry: DeviceEntry) -> Arc<DeviceEntry> {
+        entry.revision = self.revision_counter.fetch_add(1, Ordering::Relaxed);
+        let entry = Arc::new(entry);
         let device_id = entry.id.clone();
 
         // Identifier indexes
@@ -547,7 +566,9 @@ impl DeviceRegistry {
         }
 
         // Primary index (insert Arc directly)
-        self.by_id.insert(device_id, entry);
+        self.by_id.insert(device_id, Arc::clone(&entry));
+        self.generation.fetch_add(1, Ordering::Relaxed);
+        entry
     }
 
     /// Remove an entry from all indexes
@@ -587,6 +608,7 @@ impl DeviceRegistry {
 
         // Remove from primary index
         self.by_id.remove(device_id);
+        self.generation.fetch_add(1, Ordering::Relaxed);
     }
 
     /// Get device by ID
@@ -655,6 +677,18 @@ impl DeviceRegistry {
             .unwrap_or_default()
     }
 
+    /// Get the IDs of all devices with the given label, oldest first
+    pub fn device_ids_for_label(&self, label_id: &str) -> Vec<String> {
+        let mut matching: Vec<(DateTime<Utc>, String)> = self
+            .by_id
+            .iter()
+            .filter(|r| r.value().labels.iter().any(|l| l == label_id))
+            .map(|r| (r.value().created_at, r.key().clone()))
+            .collect();
+        matching.sort_by_key(|(created_at, _)| *created_at);
+        matching.into_iter().map(|(_, id)| id).collect()
+    }
+
     /// Get all child devices (connected via this device)
     pub fn get_children(&self, device_id: &str) -> Vec<Arc<DeviceEntry>> {
         self.by_via_device_id
@@ -786,8 +820,7 @@ impl DeviceRegistry {
                 .insert(config_id.to_string(), vec![subentry_val.clone()]);
         }
 
-        let arc_entry = Arc::new(entry);
-        self.index_entry(Arc::clone(&arc_entry));
+        let arc_entry = self.index_entry(entry);
 
         info!("Registered new device: {:?} ({})", name, arc_entry.id);
         arc_entry
@@ -936,8 +969,7 @@ impl DeviceRegistry {
             }
 
             // Re-index with new Arc
-            let new_arc = Arc::new(entry);
-            self.index_entry(Arc::clone(&new_arc));
+            let new_arc = self.index_entry(entry);
 
             Some(new_arc)
         } else {
@@ -960,8 +992,7 @@ impl DeviceRegistry {
         if let Some((_, arc_entry)) = self.by_id.remove(device_id) {
             self.unindex_entry(&arc_entry);
             // Add to deleted for tracking
-            self.deleted
-                .insert(device_id.to_string(), Arc::clone(&arc_entry));
+            self.insert_deleted((*arc_entry).clone());
             info!("Removed device: {}", device_id);
             Some(arc_entry)
         } else {
@@ -1050,13 +1081,14 @@ impl DeviceRegistry {
 
     /// Clear a config entry from all devices, returning change info.
     ///
-    /// Returns `(removed_device_ids, updated_devices)` where:
-    /// - `removed_device_ids`: devices that were deleted (had only this config entry)
-    /// - `updated_devices`: `Vec<(device_id, changed_fields)>` for devices that were modified
+    /// Returns `(removed_devices, updated_devices)` where:
+    /// - `removed_devices`: the last entries of devices that were deleted (had only this config entry)
+    /// - `updated_devices`: `Vec<(old_entry, changed_fields)>` for devices that were modified
+    #[allow(clippy::type_complexity)]
     pub fn clear_config_entry_with_changes(
         &self,
         config_entry_id: &str,
-    ) -> (Vec<String>, Vec<(String, Vec<String>)>) {
+    ) -> (Vec<Arc<DeviceEntry>>, Vec<(Arc<DeviceEntry>, Vec<String>)>) {
         let device_ids: Vec<String> = self
             .get_by_config_entry_id(config_entry_id)
             .iter()
@@ -1076,9 +1108,8 @@ impl DeviceRegistry {
 
             if should_remove {
                 self.remove(&device_id);
-                removed.push(device_id);
+                removed.push(old_entry);
             } else {
-                let old = (*old_entry).clone();
                 let ce_id = config_entry_id.to_string();
                 self.update(&device_id, |entry| {
                     entry.config_entries.retain(|id| id != &ce_id);
@@ -1090,9 +1121,9 @@ impl DeviceRegistry {
 
                 // Compute changed fields
                 if let Some(new_entry) = self.get(&device_id) {
-                    let changed = compute_device_changed_fields(&old, &new_entry);
+                    let changed = compute_device_changed_fields(&old_entry, &new_entry);
                     if !changed.is_empty() {
-                        updated.push((device_id, changed));
+                        updated.push((old_entry, changed));
                     }
                 }
             }
@@ -1153,8 +1184,7 @@ impl DeviceRegistry {
             let mut entry = (*arc_entry).clone();
             entry.insertion_order = self.insertion_counter.fetch_add(1, Ordering::Relaxed);
             entry.orphaned_timestamp = None;
-            let new_arc = Arc::new(entry);
-            self.index_entry(Arc::clone(&new_arc));
+            let new_arc = self.index_entry(entry);
             info!("Restored deleted device: {}", device_id);
             Some(new_arc)
         } else {
@@ -1217,8 +1247,7 @@ impl DeviceRegistry {
                 .config_entries_subentries
                 .insert(config_entry_id.to_string(), vec![subentry_val]);
 
-            let new_arc = Arc::new(entry);
-            self.index_entry(Arc::clone(&new_arc));
+            let new_arc = self.index_entry(entry);
             info!("Restored deleted device as fresh: {}", device_id);
             Some(new_arc)
         } else {
@@ -1249,7 +1278,7 @@ impl DeviceRegistry {
                 if entry.config_entries.is_empty() {
                     entry.orphaned_timestamp = Some(now_time);
                 }
-                self.deleted.insert(device_id, Arc::new(entry));
+                self.insert_deleted(entry);
             }
         }
     }
@@ -1297,7 +1326,7 @@ impl DeviceRegistry {
                     entry.orphaned_timestamp = Some(now_time);
                 }
 
-                self.deleted.insert(device_id, Arc::new(entry));
+                self.insert_deleted(entry);
             }
         }
     }
@@ -1315,7 +1344,7 @@ impl DeviceRegistry {
             if let Some((_, arc_entry)) = self.deleted.remove(&device_id) {
                 let mut entry = (*arc_entry).clone();
                 entry.area_id = None;
-                self.deleted.insert(device_id, Arc::new(entry));
+                self.insert_deleted(entry);
             }
         }
     }
@@ -1333,11 +1362,17 @@ impl DeviceRegistry {
             if let Some((_, arc_entry)) = self.deleted.remove(&device_id) {
                 let mut entry = (*arc_entry).clone();
                 entry.labels.retain(|l| l != label_id);
-                self.deleted.insert(device_id, Arc::new(entry));
+                self.insert_deleted(entry);
             }
         }
     }
 
+    /// Store a deleted entry under a fresh revision
+    fn insert_deleted(&self, mut entry: DeviceEntry) {
+        entry.revision = self.revision_counter.fetch_add(1, Ordering::Relaxed);
+        self.deleted.insert(entry.id.clone(), Arc::new(entry));
+    }
+
     /// Purge deleted devices whose orphaned_timestamp has expired.
     pub fn purge_expired_orphaned(&self, now_time: f64, keep_seconds: f64) {
         let expired: Vec<String> = self
@@ -1420,6 +1455,11 @@ impl DeviceRegistry {
         self.by_id.iter().map(|r| r.key().clone()).collect()
     }
 
+    /// Generation counter, bumped whenever an active device is stored or removed
+    pub fn generation(&self) -> u64 {
+        self.generation.load(Ordering::Relaxed)
+    }
+
     /// Get count of registered devices
     pub fn len(&self) -> usize {
         self.by_id.len()
@@ -1436,6 +1476,15 @@ impl DeviceRegistry {
     pub fn iter(&self) -> impl Iterator<Item = Arc<DeviceEntry>> + '_ {
         self.by_id.iter().map(|r| Arc::clone(r.value()))
     }
+
+    /// Get all devices in insertion order
+    ///
+    /// Returns `Arc<DeviceEntry>` references - cheap to clone.
+    pub fn sorted_by_insertion_order(&self) -> Vec<Arc<DeviceEntry>> {
+        let mut devices: Vec<_> = self.iter().collect();
+        devices.sort_unstable_by_key(|d| d.insertion_order);
+        devices
+    }
 }
 
 /// Compare two DeviceEntry instances and return the list of field names that changed.
@@ -7,13 +7,13 @@ use std::collections::HashSet;
 use std::sync::{Arc, RwLock};
 
 use chrono::{DateTime, Utc};
-use dashmap::DashMap;
 use indexmap::IndexMap;
 use serde::{Deserialize, Serialize};
 use thiserror::Error;
 use tracing::{debug, info};
 
 use crate::storage::{Storable, Storage, StorageFile, StorageResult};
+use crate::FastDashMap;
 
 /// Errors that can occur in the entity registry
 #[derive(Debug, Error, Clone)]
@@ -67,7 +67,7 @@ pub enum EntityCategory {
 }
 
 /// A registered entity entry
-#[derive(Debug, Clone, Serialize, Deserialize)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct EntityEntry {
     /// Internal UUID
     pub id: String,
@@ -171,6 +171,11 @@ pub struct EntityEntry {
     /// Only used for deleted entities
     #[serde(default, skip_serializing_if = "Option::is_none")]
     pub orphaned_timestamp: Option<f64>,
+
+    /// In-memory revision, bumped by `EntityRegistry::update` when the entry
+    /// actually changes. Lets wrappers detect no-op updates cheaply.
+    #[serde(skip)]
+    pub revision: u64,
 }
 
 impl EntityEntry {
@@ -213,6 +218,7 @@ impl EntityEntry {
             created_at: now,
             modified_at: now,
             orphaned_timestamp: None,
+            revision: 0,
         }
     }
 
@@ -396,22 +402,22 @@ pub struct EntityRegistry {
     by_entity_id: RwLock<IndexMap<String, Arc<EntityEntry>>>,
 
     /// Index: unique_id -> entity_id
-    by_unique_id: DashMap<String, String>,
+    by_unique_id: FastDashMap<String, String>,
 
     /// Index: device_id -> set of entity_ids
-    by_device_id: DashMap<String, HashSet<String>>,
+    by_device_id: FastDashMap<String, HashSet<String>>,
 
     /// Index: config_entry_id -> set of entity_ids
-    by_config_entry_id: DashMap<String, HashSet<String>>,
+    by_config_entry_id: FastDashMap<String, HashSet<String>>,
 
     /// Index: area_id -> set of entity_ids
-    by_area_id: DashMap<String, HashSet<String>>,
+    by_area_id: FastDashMap<String, HashSet<String>>,
 
     /// Index: label_id -> set of entity_ids
-    by_label_id: DashMap<String, HashSet<String>>,
+    by_label_id: FastDashMap<String, HashSet<String>>,
 
     /// Index: platform -> set of entity_ids
-    by_platform: DashMap<String, HashSet<String>>,
+    by_platform: FastDashMap<String, HashSet<String>>,
 
     /// Deleted entities (soft delete, Arc-wrapped)
     /// Keyed by (domain, platform, unique_id) to match native HA semantics
@@ -425,12 +431,12 @@ impl EntityRegistry {
         Self {
             storage,
             by_entity_id: RwLock::new(IndexMap::new()),
-            by_unique_id: DashMap::new(),
-            by_device_id: DashMap::new(),
-            by_config_entry_id: DashMap::new(),
-            by_area_id: DashMap::new(),
-            by_label_id: DashMap::new(),
-            by_platform: DashMap::new(),
+            by_unique_id: FastDashMap::default(),
+            by_device_id: FastDashMap::default(),
+            by_config_entry_id: FastDashMap::default(),
+            by_area_id: FastDashMap::default(),
+            by_label_id: FastDashMap::default(),
+            by_platform: FastDashMap::default(),
             deleted: RwLock::new(IndexMap::new()),
         }
     }
@@ -799,6 +805,9 @@ impl EntityRegistry {
             // Apply update
             f(&mut entry);
             // Note: modified_at should be set by the caller in the closure if needed
+            if entry != *arc_entry {
+                entry.revision = arc_entry.revision.wrapping_add(1);
+            }
 
             // Re-index with new Arc
             let new_arc = Arc::new(entry);
@@ -1062,6 +1071,36 @@ impl EntityRegistry {
             .unwrap_or(false)
     }
 
+    /// Get a deleted entry by its (domain, platform, unique_id) key
+    pub fn get_deleted(
+        &self,
+        domain: &str,
+        platform: &str,
+        unique_id: &str,
+    ) -> Option<Arc<EntityEntry>> {
+        let key = (
+            domain.to_string(),
+            platform.to_string(),
+            unique_id.to_string(),
+        );
+        self.deleted.read().ok().and_then(|d| d.get(&key).cloned())
+    }
+
+    /// Get all deleted entry keys (preserves insertion order)
+    pub fn deleted_keys(&self) -> Vec<(String, String, String)> {
+        self.deleted
+            .read()
+            .map(|d| d.keys().cloned().collect())
+            .unwrap_or_default()
+    }
+
+    /// Forget all deleted entities
+    pub fn clear_deleted(&self) {
+        if let Ok(mut deleted) = self.deleted.write() {
+            deleted.clear();
+        }
+    }
+
     /// Clear config_entry_id from deleted entities that match the given config_entry_id.
     /// Sets orphaned_timestamp to the provided timestamp.
     pub fn clear_deleted_config_entry(&self, config_entry_id: &str, orphaned_timestamp: f64) {
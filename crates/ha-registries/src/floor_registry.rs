@@ -2,14 +2,15 @@
 //!
 //! Tracks all registered floors in the home.
 
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::Arc;
 
 use chrono::{DateTime, Utc};
-use dashmap::DashMap;
 use serde::{Deserialize, Serialize};
 use tracing::{debug, info};
 
 use crate::storage::{Storable, Storage, StorageFile, StorageResult};
+use crate::FastDashMap;
 
 /// Storage key for floor registry
 pub const STORAGE_KEY: &str = "core.floor_registry";
@@ -115,13 +116,17 @@ pub struct FloorRegistry {
     storage: Arc<Storage>,
 
     /// Primary index: floor_id -> FloorEntry (Arc-wrapped)
-    by_id: DashMap<String, Arc<FloorEntry>>,
+    by_id: FastDashMap<String, Arc<FloorEntry>>,
 
     /// Index: normalized_name -> floor_id
-    by_name: DashMap<String, String>,
+    by_name: FastDashMap<String, String>,
 
     /// Index: level -> floor_id
-    by_level: DashMap<i32, String>,
+    by_level: FastDashMap<i32, String>,
+
+    /// Bumped on every change to the stored entries, so wrappers can tell
+    /// whether a cached view is still current
+    generation: AtomicU64,
 }
 
 impl FloorRegistry {
@@ -129,9 +134,10 @@ impl FloorRegistry {
     pub fn new(storage: Arc<Storage>) -> Self {
         Self {
             storage,
-            by_id: DashMap::new(),
-            by_name: DashMap::new(),
-            by_level: DashMap::new(),
+            by_id: FastDashMap::default(),
+            by_name: FastDashMap::default(),
+            by_level: FastDashMap::default(),
+            generation: AtomicU64::new(0),
         }
     }
 
@@ -178,6 +184,7 @@ impl FloorRegistry {
             self.by_level.insert(level, floor_id.clone());
         }
         self.by_id.insert(floor_id, entry);
+        self.generation.fetch_add(1, Ordering::Relaxed);
     }
 
     /// Remove an entry from indexes
@@ -189,6 +196,7 @@ impl FloorRegistry {
             self.by_level.remove(&level);
         }
         self.by_id.remove(&entry.id);
+        self.generation.fetch_add(1, Ordering::Relaxed);
     }
 
     /// Get floor by ID
@@ -337,6 +345,11 @@ impl FloorRegistry {
         }
     }
 
+    /// Generation counter, bumped whenever any entry is stored or removed
+    pub fn generation(&self) -> u64 {
+        self.generation.load(Ordering::Relaxed)
+    }
+
     /// Get count of floors
     pub fn len(&self) -> usize {
         self.by_id.len()
@@ -362,6 +375,15 @@ impl FloorRegistry {
         floors.sort_by_key(|f| f.level);
         floors
     }
+
+    /// Get all floors sorted by creation time (oldest first)
+    ///
+    /// Returns `Arc<FloorEntry>` references - cheap to clone.
+    pub fn sorted_by_created_at(&self) -> Vec<Arc<FloorEntry>> {
+        let mut floors: Vec<_> = self.iter().collect();
+        floors.sort_by_key(|f| f.created_at);
+        floors
+    }
 }
 
 // Unit tests removed - covered by HA native tests via `make ha-compat-test`
@@ -2,14 +2,15 @@
 //!
 //! Tracks all registered labels for organizing entities and devices.
 
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::Arc;
 
 use chrono::{DateTime, Utc};
-use dashmap::DashMap;
 use serde::{Deserialize, Serialize};
 use tracing::{debug, info};
 
 use crate::storage::{Storable, Storage, StorageFile, StorageResult};
+use crate::FastDashMap;
 
 /// Storage key for label registry
 pub const STORAGE_KEY: &str = "core.label_registry";
@@ -128,10 +129,13 @@ pub struct LabelRegistry {
     storage: Arc<Storage>,
 
     /// Primary index: label_id -> LabelEntry (Arc-wrapped)
-    by_id: DashMap<String, Arc<LabelEntry>>,
+    by_id: FastDashMap<String, Arc<LabelEntry>>,
 
     /// Index: normalized_name -> label_id
-    by_name: DashMap<String, String>,
+    by_name: FastDashMap<String, String>,
+
+    /// Bumped on every index change so callers can cache derived views
+    generation: AtomicU64,
 }
 
 impl LabelRegistry {
@@ -139,8 +143,9 @@ impl LabelRegistry {
     pub fn new(storage: Arc<Storage>) -> Self {
         Self {
             storage,
-            by_id: DashMap::new(),
-            by_name: DashMap::new(),
+            by_id: FastDashMap::default(),
+            by_name: FastDashMap::default(),
+            generation: AtomicU64::new(0),
         }
     }
 
@@ -184,6 +189,18 @@ impl LabelRegistry {
         }
 
         self.by_id.insert(label_id, entry);
+        self.generation.fetch_add(1, Ordering::Relaxed);
+    }
+
+    /// Put back an entry taken out for an update that turned out a no-op
+    ///
+    /// Unlike `index_entry` this leaves the generation alone, so views cached
+    /// against it stay valid.
+    fn restore_entry(&self, entry: Arc<LabelEntry>) {
+        if let Some(ref normalized) = entry.normalized_name {
+            self.by_name.insert(normalized.clone(), entry.id.clone());
+        }
+        self.by_id.insert(entry.id.clone(), entry);
     }
 
     /// Remove an entry from indexes
@@ -192,6 +209,7 @@ impl LabelRegistry {
             self.by_name.remove(normalized);
         }
         self.by_id.remove(&entry.id);
+        self.generation.fetch_add(1, Ordering::Relaxed);
     }
 
     /// Get label by ID
@@ -274,7 +292,8 @@ impl LabelRegistry {
     ///
     /// Returns the updated entry as `Arc<LabelEntry>`.
     /// Returns `Err` if the new name conflicts with another label.
-    /// Only updates `modified_at` if the entry actually changed.
+    /// Only updates `modified_at` if the entry actually changed; a no-op keeps
+    /// the stored Arc and does not bump the generation.
     /// If `now` is None, uses the current system time for modified_at.
     pub fn update<F>(
         &self,
@@ -304,8 +323,8 @@ impl LabelRegistry {
             if entry.name != old_entry.name {
                 let new_normalized = normalize_name(&entry.name);
                 if self.by_name.contains_key(&new_normalized) {
-                    // Name conflict - re-index the old entry and return error
-                    self.index_entry(arc_entry);
+                    // Name conflict - restore the old entry and return error
+                    self.restore_entry(arc_entry);
                     return Err(format!(
                         "The name {} ({}) is already in use",
                         entry.name, new_normalized
@@ -318,9 +337,12 @@ impl LabelRegistry {
                 || entry.icon != old_entry.icon
                 || entry.color != old_entry.color
                 || entry.description != old_entry.description;
-            if changed {
-                entry.modified_at = now.unwrap_or_else(Utc::now);
+            if !changed {
+                // Keep the stored Arc (and the generation) for a no-op
+                self.restore_entry(Arc::clone(&arc_entry));
+                return Ok(arc_entry);
             }
+            entry.modified_at = now.unwrap_or_else(Utc::now);
 
             // Re-index with new Arc
             let new_arc = Arc::new(entry);
@@ -345,6 +367,11 @@ impl LabelRegistry {
         }
     }
 
+    /// Generation counter, bumped whenever any entry is stored or removed
+    pub fn generation(&self) -> u64 {
+        self.generation.load(Ordering::Relaxed)
+    }
+
     /// Get count of labels
     pub fn len(&self) -> usize {
         self.by_id.len()
@@ -370,6 +397,15 @@ impl LabelRegistry {
         labels.sort_by(|a, b| a.name.cmp(&b.name));
         labels
     }
+
+    /// Get all labels sorted by creation time (oldest first)
+    ///
+    /// Returns `Arc<LabelEntry>` references - cheap to clone.
+    pub fn sorted_by_created_at(&self) -> Vec<Arc<LabelEntry>> {
+        let mut labels: Vec<_> = self.iter().collect();
+        labels.sort_by_key(|l| l.created_at);
+        labels
+    }
 }
 
 // Unit tests removed - covered by HA native tests via `make ha-compat-test`
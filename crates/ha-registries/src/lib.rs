@@ -39,6 +39,12 @@ pub use label_registry::{LabelEntry, LabelRegistry, LabelRegistryData};
 
 use std::sync::Arc;
 
+/// DashMap hashed with aHash instead of the default SipHash
+///
+/// Registry indexes are keyed by short IDs and hit on every lookup, so the
+/// cheaper hasher pays off; aHash still randomizes its keys per process.
+pub(crate) type FastDashMap<K, V> = dashmap::DashMap<K, V, ahash::RandomState>;
+
 /// All registries bundled together
 pub struct Registries {
     pub storage: Arc<Storage>,
@@ -297,6 +297,11 @@ impl ServiceRegistry {
     pub fn service_count(&self) -> usize {
         self.services.len()
     }
+
+    /// Unregister all services
+    pub fn clear(&self) {
+        self.services.clear();
+    }
 }
 
 impl Default for ServiceRegistry {
@@ -260,6 +260,14 @@ impl StateStore {
     pub fn entity_count(&self) -> usize {
         self.states.len()
     }
+
+    /// Remove all states without firing any events
+    ///
+    /// Keeps the allocated maps so the store can be reused.
+    pub fn clear(&self) {
+        self.states.clear();
+        self.domain_index.clear();
+    }
 }
 
 /// Thread-safe wrapper for StateStore
@@ -13,13 +13,38 @@ Usage:
 """
 
 import asyncio
+import logging
+import operator
 import os
+import sys
 import time
 from collections import defaultdict
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping
 from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 from unittest.mock import patch
+from weakref import WeakKeyDictionary, WeakValueDictionary
+
+# orjson is a Home Assistant requirement, so it is always available here
+import orjson
+
+# Loggers named after the HA modules the registry wrappers stand in for
+_ER_LOGGER = logging.getLogger("homeassistant.helpers.entity_registry")
+_DR_LOGGER = logging.getLogger("homeassistant.helpers.device_registry")
+
+# Value of er.EVENT_ENTITY_REGISTRY_UPDATED, kept here so firing an event
+# doesn't import the HA module on every call
+_EVENT_ENTITY_REGISTRY_UPDATED = "entity_registry_updated"
+
+
+# The Rust server only reads text frames, so orjson bytes go out as str
+def _ws_dumps(data: Any) -> str:
+    return orjson.dumps(data).decode()
+
+
+_ws_loads = orjson.loads
 
 # Import UNDEFINED sentinel for distinguishing "not passed" from "None"
 try:
@@ -40,6 +65,7 @@ try:
     from homeassistant.exceptions import InvalidEntityFormatError
     from homeassistant.util.read_only_dict import ReadOnlyDict
     from homeassistant.core import EventOrigin, State as NativeState
+    from homeassistant.helpers.json import json_bytes
     from homeassistant.util import dt as dt_util
     from homeassistant.util.ulid import ulid_at_time
 except ImportError:
@@ -55,6 +81,10 @@ except ImportError:
         remote = "REMOTE"
 
     NativeState = object
+
+    def json_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
     dt_util = None
     ulid_at_time = None
 
@@ -83,11 +113,26 @@ def _get_rust_hass():
     return _rust_hass
 
 
-def _parse_iso_datetime(iso_str: str) -> datetime:
-    """Parse ISO format datetime string to datetime object."""
-    if iso_str.endswith('Z'):
-        iso_str = iso_str[:-1] + '+00:00'
-    return datetime.fromisoformat(iso_str)
+if sys.version_info >= (3, 11):
+    # The C parser accepts a trailing 'Z' itself, so no Python frame is needed
+    _parse_iso_datetime = datetime.fromisoformat
+else:
+    def _parse_iso_datetime(iso_str: str) -> datetime:
+        """Parse ISO format datetime string to datetime object."""
+        if iso_str.endswith('Z'):
+            iso_str = iso_str[:-1] + '+00:00'
+        return datetime.fromisoformat(iso_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_state_timestamp(iso_str: str) -> tuple[datetime, float]:
+    """Parse a state timestamp, memoized with its POSIX value.
+
+    State timestamps repeat across entities and updates, unlike registry
+    created_at/modified_at values, so only state conversion goes through here.
+    """
+    parsed = _parse_iso_datetime(iso_str)
+    return parsed, parsed.timestamp()
 
 
 # =============================================================================
@@ -130,20 +175,16 @@ class RustState(NativeState):
         else:
             self.attributes = ReadOnlyDict(attributes)
 
-        now = datetime.now(timezone.utc)
-        self.last_reported = last_reported or now
-        self.last_updated = last_updated or self.last_reported
+        if last_reported is None:
+            last_reported = datetime.now(timezone.utc)
+        self.last_reported = last_reported
+        self.last_updated = last_updated or last_reported
         self.last_changed = last_changed or self.last_updated
 
         if last_updated_timestamp is None:
             last_updated_timestamp = self.last_updated.timestamp()
         self.last_updated_timestamp = last_updated_timestamp
 
-        if self.last_changed == self.last_updated:
-            self._cache["last_changed_timestamp"] = last_updated_timestamp
-        if self.last_reported is self.last_updated:
-            self._cache["last_reported_timestamp"] = last_updated_timestamp
-
         self.context = context or RustContext()
         self.state_info = state_info
         self.domain, self.object_id = entity_id.split('.', 1)
@@ -157,9 +198,15 @@ class RustState(NativeState):
         state.state = rust_state.state
         # Convert Rust attributes dict to ReadOnlyDict
         state.attributes = ReadOnlyDict(dict(rust_state.attributes))
-        state.last_changed = _parse_iso_datetime(rust_state.last_changed)
-        state.last_updated = _parse_iso_datetime(rust_state.last_updated)
-        state.last_updated_timestamp = state.last_updated.timestamp()
+        last_changed = rust_state.last_changed
+        last_updated = rust_state.last_updated
+        state.last_updated, state.last_updated_timestamp = _parse_state_timestamp(
+            last_updated
+        )
+        if last_changed == last_updated:
+            state.last_changed = state.last_updated
+        else:
+            state.last_changed = _parse_state_timestamp(last_changed)[0]
         state.last_reported = state.last_updated
         state.context = context or RustContext()
         state.state_info = None
@@ -177,15 +224,15 @@ class RustState(NativeState):
 
         last_changed = json_dict.get("last_changed")
         if isinstance(last_changed, str):
-            last_changed = _parse_iso_datetime(last_changed)
+            last_changed = _parse_state_timestamp(last_changed)[0]
 
         last_updated = json_dict.get("last_updated")
         if isinstance(last_updated, str):
-            last_updated = _parse_iso_datetime(last_updated)
+            last_updated = _parse_state_timestamp(last_updated)[0]
 
         last_reported = json_dict.get("last_reported")
         if isinstance(last_reported, str):
-            last_reported = _parse_iso_datetime(last_reported)
+            last_reported = _parse_state_timestamp(last_reported)[0]
 
         context_dict = json_dict.get("context")
         context = None
@@ -221,7 +268,6 @@ class RustState(NativeState):
 
     @property
     def as_compressed_state_json(self) -> bytes:
-        import orjson
         if "as_compressed_state_json" not in self._cache:
             compressed = self.as_compressed_state
             self._cache["as_compressed_state_json"] = (
@@ -231,25 +277,15 @@ class RustState(NativeState):
 
     @property
     def as_dict_json(self) -> bytes:
-        import orjson
+        # Serializes the cached as_dict() so the timestamps are formatted once
         if "as_dict_json" not in self._cache:
-            d = {
-                "entity_id": self.entity_id,
-                "state": self.state,
-                "attributes": self.attributes,
-                "last_changed": self.last_changed.isoformat(),
-                "last_reported": self.last_reported.isoformat(),
-                "last_updated": self.last_updated.isoformat(),
-                "context": self.context.as_dict(),
-            }
-            self._cache["as_dict_json"] = orjson.dumps(d)
+            self._cache["as_dict_json"] = json_bytes(self.as_dict())
         return self._cache["as_dict_json"]
 
     @property
     def json_fragment(self) -> Any:
-        import orjson
         if "json_fragment" not in self._cache:
-            self._cache["json_fragment"] = orjson.Fragment(orjson.dumps(self.as_dict()))
+            self._cache["json_fragment"] = orjson.Fragment(self.as_dict_json)
         return self._cache["json_fragment"]
 
     @property
@@ -264,7 +300,10 @@ class RustState(NativeState):
     @property
     def last_reported_timestamp(self) -> float:
         if "last_reported_timestamp" not in self._cache:
-            self._cache["last_reported_timestamp"] = self.last_reported.timestamp()
+            if self.last_reported is self.last_updated:
+                self._cache["last_reported_timestamp"] = self.last_updated_timestamp
+            else:
+                self._cache["last_reported_timestamp"] = self.last_reported.timestamp()
         return self._cache["last_reported_timestamp"]
 
     @property
@@ -345,7 +384,6 @@ class RustContext:
 
     @property
     def json_fragment(self) -> Any:
-        import orjson
         if "json_fragment" not in self._cache:
             self._cache["json_fragment"] = orjson.Fragment(orjson.dumps(self.as_dict()))
         return self._cache["json_fragment"]
@@ -367,11 +405,13 @@ class RustContext:
         return self._user_id
 
     def as_dict(self) -> ReadOnlyDict:
-        return ReadOnlyDict({
-            "id": self._id,
-            "parent_id": self._parent_id,
-            "user_id": self._user_id,
-        })
+        if "as_dict" not in self._cache:
+            self._cache["as_dict"] = ReadOnlyDict({
+                "id": self._id,
+                "parent_id": self._parent_id,
+                "user_id": self._user_id,
+            })
+        return self._cache["as_dict"]
 
     def __eq__(self, other: object) -> bool:
         # Duck-type: compare with any Context-like object (native HA or RustContext)
@@ -712,7 +752,6 @@ class RustEvent:
 
     @property
     def json_fragment(self) -> Any:
-        import orjson
         from homeassistant.helpers.json import json_encoder_default
         if "json_fragment" not in self._cache:
             self._cache["json_fragment"] = orjson.Fragment(
@@ -867,6 +906,20 @@ def _convert_categories(categories):
     return {}
 
 
+def _to_rust(value, _undefined=UNDEFINED):
+    """Convert UNDEFINED to None for Rust."""
+    return None if value is _undefined else value
+
+
+def _to_rust_string(value, _undefined=UNDEFINED):
+    """Convert UNDEFINED to None, Python None to "" (clear marker) for Rust."""
+    if value is _undefined:
+        return None
+    if value is None:
+        return ""  # Empty string = clear in Rust
+    return value
+
+
 def _rust_entry_to_registry_entry(rust_entry):
     """Convert a Rust EntityEntry to HA's RegistryEntry.
 
@@ -934,48 +987,20 @@ def _rust_entry_to_registry_entry(rust_entry):
 def _rust_entry_to_deleted_registry_entry(rust_entry):
     """Convert a Rust EntityEntry to HA's DeletedRegistryEntry.
 
-    Used for entries in deleted_entities.
+    Used for entries in deleted_entities. All fields come from Rust in a single
+    call; only enums, timestamps and categories need converting here.
     """
     from homeassistant.helpers import entity_registry as er
-    from homeassistant.helpers.entity import EntityCategory
-
-    # Convert string enums to HA enum types
-    disabled_by = None
-    if rust_entry.disabled_by:
-        disabled_by = er.RegistryEntryDisabler(rust_entry.disabled_by)
-
-    hidden_by = None
-    if rust_entry.hidden_by:
-        hidden_by = er.RegistryEntryHider(rust_entry.hidden_by)
 
-    # Parse timestamps
-    created_at = _parse_iso_datetime(rust_entry.created_at)
-    modified_at = _parse_iso_datetime(rust_entry.modified_at)
-
-    # Get orphaned_timestamp from Rust entry
-    orphaned_timestamp = rust_entry.orphaned_timestamp
-
-    return er.DeletedRegistryEntry(
-        entity_id=rust_entry.entity_id,
-        unique_id=rust_entry.unique_id or "",
-        platform=rust_entry.platform,
-        aliases=set(rust_entry.aliases),
-        area_id=rust_entry.area_id,
-        categories=_convert_categories(rust_entry.categories),
-        config_entry_id=rust_entry.config_entry_id,
-        config_subentry_id=rust_entry.config_subentry_id,
-        created_at=created_at,
-        device_class=rust_entry.device_class,
-        disabled_by=disabled_by,
-        hidden_by=hidden_by,
-        icon=rust_entry.icon,
-        id=rust_entry.id,
-        labels=set(rust_entry.labels),
-        modified_at=modified_at,
-        name=rust_entry.name,
-        options=rust_entry.options,
-        orphaned_timestamp=orphaned_timestamp,
-    )
+    fields = rust_entry.deleted_entry_fields()
+    if fields["disabled_by"]:
+        fields["disabled_by"] = er.RegistryEntryDisabler(fields["disabled_by"])
+    if fields["hidden_by"]:
+        fields["hidden_by"] = er.RegistryEntryHider(fields["hidden_by"])
+    fields["created_at"] = _parse_iso_datetime(fields["created_at"])
+    fields["modified_at"] = _parse_iso_datetime(fields["modified_at"])
+    fields["categories"] = _convert_categories(fields["categories"])
+    return er.DeletedRegistryEntry(**fields)
 
 
 class _MockStore:
@@ -994,21 +1019,46 @@ class _MockStore:
         pass
 
     async def _async_handle_write_data(self):
-        # Actually save the registry to storage
-        self._registry._rust_registry.async_save()
+        # Save only if something changed since the last write; Rust tracks
+        # the dirty flag so mutations never touch a Python timer
+        rust_registry = self._registry._rust_registry
+        if rust_registry.take_dirty():
+            rust_registry.async_save()
 
 
-class RustEntityRegistryItems(dict):
-    """Dict subclass that provides extra lookup methods like HA's EntityRegistryItems.
+class RustEntityRegistryItems(Mapping):
+    """Lazy mapping view that provides extra lookup methods like HA's EntityRegistryItems.
 
-    Filter methods delegate to Rust indices for O(1) lookups instead of O(n) iteration.
+    Nothing is materialized up front: entries are fetched from Rust and wrapped
+    on demand, so point lookups and `len()` never build the full dict. Filter
+    methods delegate to Rust indices for O(1) lookups instead of O(n) iteration.
     """
 
-    def __init__(self, data, rust_registry=None, wrapper_fn=None):
-        super().__init__(data)
+    def __init__(self, rust_registry, wrapper_fn):
         self._rust_registry = rust_registry
         self._wrapper_fn = wrapper_fn
 
+    def __contains__(self, entity_id) -> bool:
+        try:
+            return self._rust_registry.async_is_registered(entity_id)
+        except TypeError:
+            return False
+
+    def __getitem__(self, entity_id: str):
+        try:
+            rust_entry = self._rust_registry.async_get(entity_id)
+        except TypeError:
+            rust_entry = None
+        if rust_entry is None:
+            raise KeyError(entity_id)
+        return self._wrapper_fn(rust_entry)
+
+    def __iter__(self):
+        return iter(self._rust_registry.entity_ids())
+
+    def __len__(self) -> int:
+        return len(self._rust_registry)
+
     def get_device_ids(self):
         """Return device ids."""
         return {entry.device_id for entry in self.values() if entry.device_id is not None}
@@ -1046,45 +1096,180 @@ class RustEntityRegistryItems(dict):
     def get_entry(self, entity_id_or_uuid: str) -> object | None:
         """Get entry by entity_id or UUID."""
         # Try direct entity_id lookup first
-        if entity_id_or_uuid in self:
-            return self[entity_id_or_uuid]
-        # Try UUID lookup via Rust
+        entry = self.get(entity_id_or_uuid)
+        if entry is not None:
+            return entry
+        # Fall back to UUID scan
         for entry in self.values():
             if entry.id == entity_id_or_uuid:
                 return entry
         return None
 
+    def items(self):
+        """Return (entity_id, entry) pairs wrapped in a single Rust call."""
+        return self._rust_registry.entities_as_wrapper_dict().items()
+
+    def values(self):
+        """Return entries wrapped in a single Rust call."""
+        return self._rust_registry.entities_as_wrapper_dict().values()
+
+
+class DeletedEntityRegistryItems(Mapping):
+    """Lazy mapping of (domain, platform, unique_id) to DeletedRegistryEntry.
+
+    Entries are converted on demand, so point lookups and `len()` don't pay
+    for converting every deleted entity. Converted entries are shared through
+    the registry's weak cache while any caller still holds them.
+    """
+
+    def __init__(self, rust_registry, entry_cache):
+        self._rust_registry = rust_registry
+        self._entry_cache = entry_cache
+
+    def _wrap(self, key, rust_entry):
+        entry = self._entry_cache.get(key)
+        if entry is None:
+            entry = _rust_entry_to_deleted_registry_entry(rust_entry)
+            self._entry_cache[key] = entry
+        return entry
+
+    def __contains__(self, key) -> bool:
+        try:
+            domain, platform, unique_id = key
+            return self._rust_registry.is_deleted(domain, platform, unique_id)
+        except (TypeError, ValueError):
+            return False
+
+    def __getitem__(self, key):
+        try:
+            entry = self._entry_cache.get(key)
+            if entry is not None:
+                return entry
+            domain, platform, unique_id = key
+            rust_entry = self._rust_registry.async_get_deleted(domain, platform, unique_id)
+        except (TypeError, ValueError):
+            rust_entry = None
+        if rust_entry is None:
+            raise KeyError(key)
+        return self._wrap(key, rust_entry)
+
+    def __iter__(self):
+        return iter(self._rust_registry.deleted_entity_keys())
+
+    def __len__(self) -> int:
+        return self._rust_registry.deleted_entities_len()
+
+    def _snapshot(self) -> dict:
+        """Wrap every entry from a single Rust snapshot."""
+        wrap = self._wrap
+        return {
+            key: wrap(key, rust_entry)
+            for key, rust_entry in self._rust_registry.deleted_entities.items()
+        }
+
+    def items(self):
+        """Return (key, entry) pairs from a single Rust snapshot."""
+        return self._snapshot().items()
+
+    def values(self):
+        """Return entries from a single Rust snapshot."""
+        return self._snapshot().values()
+
+
+# Optional string fields where Python None means "clear" (sent to Rust as "")
+_ER_CLEAR_STRING_FIELDS = frozenset({
+    'disabled_by', 'hidden_by', 'area_id', 'device_class',
+    'unit_of_measurement', 'config_entry_id', 'config_subentry_id',
+    'device_id', 'entity_category', 'original_device_class',
+    'original_icon', 'original_name', 'translation_key', 'name', 'icon',
+})
+# Enum fields sent to Rust as their string value
+_ER_ENUM_STRING_FIELDS = frozenset({'entity_category', 'disabled_by', 'hidden_by'})
+
 
 class RustEntityRegistry:
     """Wrapper that provides HA-compatible EntityRegistry API backed by Rust."""
 
+    # __dict__ stays so tests can patch.object() methods such as
+    # async_schedule_save on the shared instance returned by er.async_get
+    __slots__ = (
+        "_rust_registry", "_hass", "_entities_override", "_entities_view",
+        "_deleted_entry_cache", "_deleted_entities_view", "_store", "__dict__",
+    )
+
     def __init__(self, hass):
         if not _rust_available:
             raise RuntimeError("ha_core_rs not available")
         self._rust_registry = ha_core_rs.EntityRegistry(hass)
+        # Rust caches the RegistryEntry built for each entity (keyed by entity_id and
+        # entry revision) to maintain identity for `is` checks in tests
+        self._rust_registry.set_wrapper_factory(_rust_entry_to_registry_entry)
         self._hass = hass
-        # Cache wrapper objects to maintain identity (for `is` checks in tests)
-        self._entry_cache: dict[str, RustEntityEntry] = {}
         # Allow mock_registry to override entities with a native EntityRegistryItems
         self._entities_override = None
+        # Lazy view is stateless beyond its Rust handle, so build it once
+        self._entities_view = RustEntityRegistryItems(
+            rust_registry=self._rust_registry,
+            wrapper_fn=self._rust_registry.wrap_entry,
+        )
+        # Converted DeletedRegistryEntry objects, shared while referenced elsewhere.
+        # Cleared whenever Rust mutates, adds or restores deleted entries.
+        self._deleted_entry_cache = WeakValueDictionary()
+        self._deleted_entities_view = DeletedEntityRegistryItems(
+            self._rust_registry, self._deleted_entry_cache
+        )
         # Mock store for flush_store compatibility - references this registry
         self._store = _MockStore(self)
 
-    def _fire_event(self, action: str, entity_id: str, changes: dict | None = None, old_entity_id: str | None = None) -> None:
-        """Fire entity registry updated event."""
+    # One method per event shape, so each call builds its payload directly
+    # instead of going through a generic optional-argument forwarder
+
+    def _fire_create(self, entity_id: str) -> None:
+        """Fire entity registry updated event for a new entity."""
         if self._hass is None:
             return
-        from homeassistant.helpers import entity_registry as er
-        data: dict = {"action": action, "entity_id": entity_id}
-        if changes:
-            data["changes"] = changes
-        if old_entity_id:
+        ha_core_rs.fire_registry_event(
+            self._hass.bus, _EVENT_ENTITY_REGISTRY_UPDATED, "create", "entity_id", entity_id
+        )
+
+    def _fire_update(self, entity_id: str, changes: dict, old_entity_id: str | None = None) -> None:
+        """Fire entity registry updated event for an update, carrying the old id on rename."""
+        if self._hass is None:
+            return
+        data = {"action": "update", "entity_id": entity_id, "changes": changes}
+        if old_entity_id is not None:
             data["old_entity_id"] = old_entity_id
-        self._hass.bus.async_fire(er.EVENT_ENTITY_REGISTRY_UPDATED, data)
+        self._hass.bus.async_fire(_EVENT_ENTITY_REGISTRY_UPDATED, data)
+
+    def _fire_remove(self, entity_id: str) -> None:
+        """Fire entity registry updated event for a removed entity."""
+        if self._hass is None:
+            return
+        ha_core_rs.fire_registry_event(
+            self._hass.bus, _EVENT_ENTITY_REGISTRY_UPDATED, "remove", "entity_id", entity_id
+        )
+
+    def _has_update_listeners(self) -> bool:
+        """Return whether an entity registry updated event would reach anyone.
+
+        Only returns False when the bus is known to have no listeners for the
+        event (including match-all listeners); unknown bus types always fire.
+        """
+        if self._hass is None:
+            return False
+        bus = self._hass.bus
+        listeners = getattr(bus, "_listeners", None)
+        if listeners is None:
+            return True
+        return bool(
+            listeners.get(_EVENT_ENTITY_REGISTRY_UPDATED)
+            or getattr(bus, "_match_all_listeners", None)
+        )
 
     async def async_load(self) -> None:
         """Load entities from storage."""
         self._rust_registry.async_load()
+        self._deleted_entry_cache.clear()
 
     async def async_save(self) -> None:
         """Save entities to storage."""
@@ -1094,16 +1279,11 @@ class RustEntityRegistry:
         """Get cached wrapper or create and cache a new one.
 
         Returns actual HA RegistryEntry objects to ensure equality checks work correctly.
-        The force_new parameter is used when data has been updated and we need a new instance.
+        The force_new parameter is used when data may have been updated; the cached
+        wrapper is still reused if the Rust revision shows the update was a no-op.
+        The cache itself lives on the Rust registry.
         """
-        entity_id = rust_entry.entity_id
-        # Return cached entry for identity checks (is)
-        if not force_new and entity_id in self._entry_cache:
-            return self._entry_cache[entity_id]
-        # Create new RegistryEntry from current Rust state
-        entry = _rust_entry_to_registry_entry(rust_entry)
-        self._entry_cache[entity_id] = entry
-        return entry
+        return self._rust_registry.wrap_entry(rust_entry, force_new)
 
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
@@ -1113,6 +1293,7 @@ class RustEntityRegistry:
             self.async_update_entity(entry.entity_id, area_id="")
         # Clear from deleted entities
         self._rust_registry.clear_deleted_area_id(area_id)
+        self._deleted_entry_cache.clear()
 
     def async_clear_category_id(self, scope: str, category_id: str) -> None:
         """Clear a category from registry entries matching scope and category_id."""
@@ -1123,11 +1304,10 @@ class RustEntityRegistry:
                 self.async_update_entity(entry.entity_id, categories=new_categories)
         # Clear from deleted entities
         self._rust_registry.clear_deleted_category_id(scope, category_id)
+        self._deleted_entry_cache.clear()
 
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
-        import time
-
         # Get all entity IDs for this config entry via Rust index
         entity_ids = [
             entry.entity_id
@@ -1136,18 +1316,40 @@ class RustEntityRegistry:
         # Bulk remove all entities at once in Rust, then fire events
         removed = self._rust_registry.async_bulk_remove(entity_ids)
         for entity_id in removed:
-            self._entry_cache.pop(entity_id, None)
-            self._fire_event("remove", entity_id)
+            self._fire_remove(entity_id)
         # Also clear config_entry_id from deleted entities and mark orphaned
         now_time = time.time()
         self._rust_registry.clear_deleted_config_entry(config_entry_id, now_time)
+        self._deleted_entry_cache.clear()
+
+    def _async_device_removed(self, device_id: str, config_entry_ids: set[str]) -> None:
+        """Remove or detach the entities of a removed device.
+
+        Entities of the device's config entries are removed and the rest lose
+        their device_id, both in a single Rust call. Detaching fires no event,
+        as a device_id=None update carries no changes.
+        """
+        if self._entities_override is not None:
+            for entity in self._entities_override.get_entries_for_device_id(
+                device_id, include_disabled_entities=True
+            ):
+                if entity.config_entry_id in config_entry_ids:
+                    self.async_remove(entity.entity_id)
+                else:
+                    self.async_update_entity(entity.entity_id, device_id=None)
+            return
+        removed, _detached = self._rust_registry.async_device_removed(
+            device_id, config_entry_ids
+        )
+        if removed:
+            self._deleted_entry_cache.clear()
+            for entity_id in removed:
+                self._fire_remove(entity_id)
 
     def async_clear_config_subentry(
         self, config_entry_id: str, config_subentry_id: str
     ) -> None:
         """Clear config subentry from registry entries."""
-        import time
-
         # Get entities for config entry and filter by subentry
         entity_ids = [
             entry.entity_id
@@ -1162,6 +1364,7 @@ class RustEntityRegistry:
         self._rust_registry.clear_deleted_config_subentry(
             config_entry_id, config_subentry_id, now_time
         )
+        self._deleted_entry_cache.clear()
 
     def async_clear_label_id(self, label_id: str) -> None:
         """Clear label from registry entries."""
@@ -1171,6 +1374,7 @@ class RustEntityRegistry:
             self.async_update_entity(entry.entity_id, labels=new_labels)
         # Clear from deleted entities
         self._rust_registry.clear_deleted_label_id(label_id)
+        self._deleted_entry_cache.clear()
 
     def async_device_ids(self) -> set[str]:
         """Return set of device IDs that have registered entities."""
@@ -1308,9 +1512,7 @@ class RustEntityRegistry:
 
         # Convert unique_id to string if not already (native HA does this with a warning)
         if not isinstance(unique_id, str):
-            import logging
-            _LOGGER = logging.getLogger("homeassistant.helpers.entity_registry")
-            _LOGGER.error(
+            _ER_LOGGER.error(
                 "'%s' from integration %s has a non string unique_id '%s', "
                 "please create a bug report",
                 domain,
@@ -1323,6 +1525,8 @@ class RustEntityRegistry:
         existing_entity_id = self._rust_registry.async_get_entity_id(domain, platform, unique_id)
         is_restoring_deleted = self._rust_registry.is_deleted(domain, platform, unique_id)
         is_new = existing_entity_id is None and not is_restoring_deleted
+        if is_restoring_deleted:
+            self._deleted_entry_cache.pop((domain, platform, unique_id), None)
 
         # Apply config entry preference for disabling new entities (only for new registrations)
         if (
@@ -1344,18 +1548,6 @@ class RustEntityRegistry:
         # Pass current Python time as timestamp (respects freezer in tests)
         timestamp_iso = datetime.now(timezone.utc).isoformat()
 
-        # Helper: convert UNDEFINED to None for Rust
-        def to_rust(value):
-            return None if value is UNDEFINED else value
-
-        # Helper: convert UNDEFINED to None, Python None to "" (clear marker)
-        def to_rust_string(value):
-            if value is UNDEFINED:
-                return None
-            if value is None:
-                return ""  # Empty string = clear in Rust
-            return value
-
         # Call Rust - all business logic is handled there
         # Pass state machine entity IDs as reserved IDs for conflict resolution
         reserved_ids = self._get_state_machine_entity_ids()
@@ -1363,22 +1555,22 @@ class RustEntityRegistry:
             domain=domain,
             platform=platform,
             unique_id=unique_id,
-            config_entry_id=to_rust_string(config_entry_id),
-            config_subentry_id=to_rust_string(config_subentry_id),
-            device_id=to_rust_string(device_id),
+            config_entry_id=_to_rust_string(config_entry_id),
+            config_subentry_id=_to_rust_string(config_subentry_id),
+            device_id=_to_rust_string(device_id),
             suggested_object_id=calculated_object_id or suggested_object_id,
             disabled_by=disabled_by,
             hidden_by=hidden_by,
-            has_entity_name=to_rust(has_entity_name),
-            capabilities=to_rust(capabilities),
-            supported_features=to_rust(supported_features),
-            device_class=to_rust_string(device_class),
-            unit_of_measurement=to_rust_string(unit_of_measurement),
-            original_name=to_rust_string(original_name),
-            original_icon=to_rust_string(original_icon),
-            original_device_class=to_rust_string(original_device_class),
-            entity_category=to_rust(entity_category),
-            translation_key=to_rust_string(translation_key),
+            has_entity_name=_to_rust(has_entity_name),
+            capabilities=_to_rust(capabilities),
+            supported_features=_to_rust(supported_features),
+            device_class=_to_rust_string(device_class),
+            unit_of_measurement=_to_rust_string(unit_of_measurement),
+            original_name=_to_rust_string(original_name),
+            original_icon=_to_rust_string(original_icon),
+            original_device_class=_to_rust_string(original_device_class),
+            entity_category=_to_rust(entity_category),
+            translation_key=_to_rust_string(translation_key),
             reserved_ids=reserved_ids,
             created_at=timestamp_iso if is_new else None,
             modified_at=timestamp_iso,
@@ -1394,27 +1586,29 @@ class RustEntityRegistry:
                     )
 
         # Check if we need to force a new RegistryEntry wrapper
-        has_update_params = any(v is not UNDEFINED for v in [
-            config_entry_id, config_subentry_id, device_id, has_entity_name,
-            capabilities, supported_features, device_class, unit_of_measurement,
-            original_name, original_icon, original_device_class, entity_category,
-            translation_key
-        ])
+        _U = UNDEFINED
+        has_update_params = (
+            config_entry_id is not _U or config_subentry_id is not _U
+            or device_id is not _U or has_entity_name is not _U
+            or capabilities is not _U or supported_features is not _U
+            or device_class is not _U or unit_of_measurement is not _U
+            or original_name is not _U or original_icon is not _U
+            or original_device_class is not _U or entity_category is not _U
+            or translation_key is not _U
+        )
         force_new = is_new or has_update_params
         wrapped = self._get_or_create_wrapper(entry, force_new=force_new)
 
         # Fire create event if this was a new entity
         if is_new:
-            self._fire_event("create", wrapped.entity_id)
+            self._fire_create(wrapped.entity_id)
         else:
             # Check if config_entry_id changed and fire update event
             if config_entry_id is not UNDEFINED:
                 new_config_entry_id = wrapped.config_entry_id
                 if old_config_entry_id != new_config_entry_id:
-                    self._fire_event(
-                        "update",
-                        wrapped.entity_id,
-                        changes={"config_entry_id": old_config_entry_id},
+                    self._fire_update(
+                        wrapped.entity_id, {"config_entry_id": old_config_entry_id}
                     )
 
         return wrapped
@@ -1424,131 +1618,131 @@ class RustEntityRegistry:
 
     def async_remove(self, entity_id: str) -> None:
         self._rust_registry.async_remove(entity_id)
-        # Remove from cache
-        self._entry_cache.pop(entity_id, None)
+        self._deleted_entry_cache.clear()
         # Remove from override if set (mock_registry scenario)
         if self._entities_override is not None and entity_id in self._entities_override:
             del self._entities_override[entity_id]
         # Fire remove event
-        self._fire_event("remove", entity_id)
+        self._fire_remove(entity_id)
 
     def async_schedule_save(self) -> None:
-        """Schedule saving to storage (stub for HA API compatibility)."""
-        pass
+        """Mark the registry dirty; the write is coalesced by the store."""
+        self._rust_registry.mark_dirty()
 
     def async_update_entity(
         self,
         entity_id: str,
         **kwargs,
     ):
+        # Bind hot attributes once; this runs for every entity update
+        rust_registry = self._rust_registry
+        hass = self._hass
+        get_kwarg = kwargs.get
+
         # Validate config_entry_id exists if being updated
-        if 'config_entry_id' in kwargs and kwargs['config_entry_id'] is not None and self._hass is not None:
-            if self._hass.config_entries.async_get_entry(kwargs['config_entry_id']) is None:
+        config_entry_id = get_kwarg('config_entry_id')
+        if config_entry_id is not None and hass is not None:
+            if hass.config_entries.async_get_entry(config_entry_id) is None:
                 raise ValueError(
-                    f"Config entry {kwargs['config_entry_id']} does not exist"
+                    f"Config entry {config_entry_id} does not exist"
                 )
 
         # Validate device_id exists if being updated
-        if 'device_id' in kwargs and kwargs['device_id'] is not None and self._hass is not None:
+        device_id = get_kwarg('device_id')
+        if device_id is not None and hass is not None:
             from homeassistant.helpers import device_registry as dr
-            if dr.DATA_REGISTRY in self._hass.data:
-                dev_reg = self._hass.data[dr.DATA_REGISTRY]
-                if dev_reg.async_get(kwargs['device_id']) is None:
+            if dr.DATA_REGISTRY in hass.data:
+                dev_reg = hass.data[dr.DATA_REGISTRY]
+                if dev_reg.async_get(device_id) is None:
                     raise ValueError(
-                        f"Device {kwargs['device_id']} does not exist"
+                        f"Device {device_id} does not exist"
                     )
 
         # Validate disabled_by is not a raw string (must be enum)
-        if 'disabled_by' in kwargs and kwargs['disabled_by'] is not None and isinstance(kwargs['disabled_by'], str) and not hasattr(kwargs['disabled_by'], 'name'):
+        disabled_by = get_kwarg('disabled_by')
+        if disabled_by is not None and isinstance(disabled_by, str) and not hasattr(disabled_by, 'name'):
             raise ValueError(
-                f"disabled_by must be a RegistryEntryDisabler instance, got {kwargs['disabled_by']!r}"
+                f"disabled_by must be a RegistryEntryDisabler instance, got {disabled_by!r}"
             )
 
         # Validate entity_category is not a raw string (must be enum)
-        if 'entity_category' in kwargs and kwargs['entity_category'] is not None and isinstance(kwargs['entity_category'], str) and not hasattr(kwargs['entity_category'], 'name'):
+        entity_category = get_kwarg('entity_category')
+        if entity_category is not None and isinstance(entity_category, str) and not hasattr(entity_category, 'name'):
             raise ValueError(
-                f"entity_category must be an EntityCategory instance, got {kwargs['entity_category']!r}"
+                f"entity_category must be an EntityCategory instance, got {entity_category!r}"
             )
 
         # Validate hidden_by is not a raw string (must be enum)
-        if 'hidden_by' in kwargs and kwargs['hidden_by'] is not None and isinstance(kwargs['hidden_by'], str) and not hasattr(kwargs['hidden_by'], 'name'):
+        hidden_by = get_kwarg('hidden_by')
+        if hidden_by is not None and isinstance(hidden_by, str) and not hasattr(hidden_by, 'name'):
             raise ValueError(
-                f"hidden_by must be a RegistryEntryHider instance, got {kwargs['hidden_by']!r}"
+                f"hidden_by must be a RegistryEntryHider instance, got {hidden_by!r}"
             )
 
         # Validate new_unique_id is hashable
-        if 'new_unique_id' in kwargs and kwargs['new_unique_id'] is not None:
+        new_unique_id = get_kwarg('new_unique_id')
+        if new_unique_id is not None:
             try:
-                hash(kwargs['new_unique_id'])
+                hash(new_unique_id)
             except TypeError as err:
                 raise TypeError(
-                    f"unique_id must be hashable, got {type(kwargs['new_unique_id']).__name__}"
+                    f"unique_id must be hashable, got {type(new_unique_id).__name__}"
                 ) from err
             # Convert non-string unique_id with warning
-            if not isinstance(kwargs['new_unique_id'], str):
-                import logging
-                _LOGGER = logging.getLogger("homeassistant.helpers.entity_registry")
-                old_entry_for_log = self._rust_registry.async_get(entity_id)
+            if not isinstance(new_unique_id, str):
+                old_entry_for_log = rust_registry.async_get(entity_id)
                 domain = old_entry_for_log.domain if old_entry_for_log else "unknown"
                 platform = old_entry_for_log.platform if old_entry_for_log else "unknown"
-                _LOGGER.error(
+                _ER_LOGGER.error(
                     "'%s' from integration %s has a non string unique_id '%s', "
                     "please create a bug report",
                     domain,
                     platform,
-                    kwargs['new_unique_id'],
+                    new_unique_id,
                 )
-                kwargs['new_unique_id'] = str(kwargs['new_unique_id'])
-
-        # Get old entry to track changes
-        old_entry = self._rust_registry.async_get(entity_id)
-        old_entity_id = old_entry.entity_id if old_entry else None
+                kwargs['new_unique_id'] = str(new_unique_id)
 
         # Compute config_entry_is_disabled for Rust disabled_by propagation
         config_entry_is_disabled = None
-        if 'config_entry_id' in kwargs and 'disabled_by' not in kwargs:
-            new_ce_id = kwargs['config_entry_id']
-            if new_ce_id is not None and self._hass is not None:
-                new_ce = self._hass.config_entries.async_get_entry(new_ce_id)
-                if new_ce is not None:
-                    config_entry_is_disabled = bool(new_ce.disabled_by)
+        if config_entry_id is not None and 'disabled_by' not in kwargs and hass is not None:
+            new_ce = hass.config_entries.async_get_entry(config_entry_id)
+            if new_ce is not None:
+                config_entry_is_disabled = bool(new_ce.disabled_by)
 
         # Transform kwargs for Rust: None means "clear" for optional string fields
         rust_kwargs = {}
-        clear_string_fields = {
-            'disabled_by', 'hidden_by', 'area_id', 'device_class',
-            'unit_of_measurement', 'config_entry_id', 'config_subentry_id',
-            'device_id', 'entity_category', 'original_device_class',
-            'original_icon', 'original_name', 'translation_key', 'name', 'icon',
-        }
-        enum_string_fields = {'entity_category', 'disabled_by', 'hidden_by'}
         for key, value in kwargs.items():
-            if key in clear_string_fields and value is None:
+            if key in _ER_CLEAR_STRING_FIELDS and value is None:
                 rust_kwargs[key] = ""  # Empty string = clear in Rust
-            elif key in enum_string_fields and value is not None:
+            elif key in _ER_ENUM_STRING_FIELDS and value is not None:
                 rust_kwargs[key] = str(value.value) if hasattr(value, 'value') else str(value)
             else:
                 rust_kwargs[key] = value
 
         if config_entry_is_disabled is not None:
             rust_kwargs['config_entry_is_disabled'] = config_entry_is_disabled
-        entry = self._rust_registry.async_update_entity(entity_id, **rust_kwargs)
-        # Force new RegistryEntry since data was updated (RegistryEntry is frozen)
-        wrapped = self._get_or_create_wrapper(entry, force_new=True)
-
-        # Update cache if entity_id changed
-        if old_entity_id and old_entity_id != wrapped.entity_id:
-            self._entry_cache.pop(old_entity_id, None)
-
-        # Fire update event with changes
-        changes = {k: v for k, v in kwargs.items() if v is not None}
-        if changes:
-            self._fire_event(
-                "update",
-                wrapped.entity_id,
-                changes=changes,
-                old_entity_id=old_entity_id if old_entity_id != wrapped.entity_id else None,
-            )
+        # Rust updates the entry and returns its RegistryEntry in one call, rebuilding
+        # the wrapper only if the data changed (RegistryEntry is frozen) and dropping
+        # the cached wrapper for the old entity_id on rename
+        wrapped = rust_registry.async_update_entity(entity_id, wrap=True, **rust_kwargs)
+        # Rust raises KeyError for unknown entities, so entity_id is the old id here
+        new_entity_id = wrapped.entity_id
+        id_changed = new_entity_id != entity_id
+
+        # Fire update event with changes (skip building the payload if nobody listens)
+        if kwargs and self._has_update_listeners():
+            # kwargs is our own dict and unused afterwards, so reuse it as the
+            # payload unless None values need filtering out
+            if None in kwargs.values():
+                changes = {k: v for k, v in kwargs.items() if v is not None}
+            else:
+                changes = kwargs
+            if changes:
+                if id_changed:
+                    # Rename: the event carries old_entity_id
+                    self._fire_update(new_entity_id, changes, entity_id)
+                else:
+                    self._fire_update(new_entity_id, changes)
 
         self.async_schedule_save()
         return wrapped
@@ -1560,44 +1754,45 @@ class RustEntityRegistry:
         options: dict | None,
     ):
         """Update entity options for a specific domain."""
-        entry = self._rust_registry.async_update_entity_options(entity_id, domain, options)
+        rust_registry = self._rust_registry
+        # HA often writes back the options it already has; skip the Rust update then
+        current = rust_registry.async_get(entity_id)
+        if current is not None and (current.options or {}).get(domain) == options:
+            return rust_registry.wrap_entry(current)
+        entry = rust_registry.async_update_entity_options(entity_id, domain, options)
         # Force new RegistryEntry since data was updated
-        return self._get_or_create_wrapper(entry, force_new=True)
+        return rust_registry.wrap_entry(entry, True)
 
     @property
     def deleted_entities(self):
-        """Return dict of (domain, platform, unique_id) to deleted DeletedRegistryEntry."""
-        return {
-            key: _rust_entry_to_deleted_registry_entry(entry)
-            for key, entry in self._rust_registry.deleted_entities.items()
-        }
+        """Return mapping of (domain, platform, unique_id) to DeletedRegistryEntry."""
+        return self._deleted_entities_view
 
     @deleted_entities.setter
     def deleted_entities(self, value):
-        """Allow setting deleted_entities (used in test setup)."""
-        # No-op for Rust backend - tests that set this to {} are clearing it
-        pass
+        """Allow clearing deleted_entities (used in test setup)."""
+        if value:
+            raise AttributeError("deleted_entities is managed by the Rust backend")
+        self._rust_registry.clear_deleted()
+        self._deleted_entry_cache.clear()
 
     @property
     def entities(self):
         """Return dict of entity_id to RegistryEntry."""
         if self._entities_override is not None:
             return self._entities_override
-        data = {
-            entity_id: self._get_or_create_wrapper(entry)
-            for entity_id, entry in self._rust_registry.entities.items()
-        }
-        return RustEntityRegistryItems(
-            data,
-            rust_registry=self._rust_registry,
-            wrapper_fn=self._get_or_create_wrapper,
-        )
+        return self._entities_view
 
     @entities.setter
     def entities(self, value):
         """Allow mock_registry to replace entities with a native EntityRegistryItems."""
         self._entities_override = value
 
+    def __contains__(self, entity_id) -> bool:
+        if self._entities_override is not None:
+            return entity_id in self._entities_override
+        return entity_id in self._entities_view
+
     def __iter__(self):
         return iter(self.entities.values())
 
@@ -1612,23 +1807,108 @@ class RustEntityRegistry:
 # Sentinel to distinguish "not passed" from "passed as None"
 _GOC_UNSET = object()
 
+# Shared by every device wrapper without field overrides
+_EMPTY_OVERRIDES: Mapping[str, Any] = MappingProxyType({})
+
+# homeassistant.helpers.device_registry, imported on first use
+_dr = None
+
+
+def _get_dr():
+    """Return the HA device_registry module without re-importing it on hot paths."""
+    global _dr
+    if _dr is None:
+        from homeassistant.helpers import device_registry
+        _dr = device_registry
+    return _dr
+
+
+def _clear_if_none(value):
+    """Map None to the "" sentinel the Rust update bindings read as "clear"."""
+    return "" if value is None else value
+
+
+def _labels_to_list(value):
+    # Rust wants a sequence; accept any iterable (set, frozenset, tuple, list)
+    return None if value is None else list(value)
+
+
+# Per-kwarg conversions for RustDeviceRegistry.async_update_device. Enum
+# members are str subclasses, so Rust extracts them as their value directly.
+_DEVICE_UPDATE_NORMALIZERS: dict[str, Callable[[Any], Any]] = {
+    "area_id": _clear_if_none,
+    "configuration_url": _clear_if_none,
+    "disabled_by": _clear_if_none,
+    "entry_type": _clear_if_none,
+    "labels": _labels_to_list,
+    "name_by_user": _clear_if_none,
+    "suggested_area": _clear_if_none,
+    "via_device_id": _clear_if_none,
+}
+
+
 class RustDeviceEntry:
     """Wrapper for DeviceEntry compatible with homeassistant.helpers.device_registry."""
 
-    __slots__ = ("_rust_entry", "_field_overrides")
+    __slots__ = (
+        "_rust_entry",
+        "_field_overrides",
+        "_cached_repr",
+        "_cached_repr_key",
+        "_cached_json",
+        "_cached_json_source",
+        "_created_at",
+        "_modified_at",
+        "_sets_cache",
+    )
 
-    _DISABLED_BY_MAP = None  # Lazy-loaded
+    # Enum value -> member maps, lazy-loaded; these are the enums' own lookup tables
+    _DISABLED_BY_MAP = None
+    _ENTRY_TYPE_MAP = None
 
     @classmethod
     def _get_disabled_by_map(cls):
         if cls._DISABLED_BY_MAP is None:
-            from homeassistant.helpers.device_registry import DeviceEntryDisabler
-            cls._DISABLED_BY_MAP = {e.value: e for e in DeviceEntryDisabler}
+            cls._DISABLED_BY_MAP = _get_dr().DeviceEntryDisabler._value2member_map_
         return cls._DISABLED_BY_MAP
 
+    @classmethod
+    def _get_entry_type_map(cls):
+        if cls._ENTRY_TYPE_MAP is None:
+            cls._ENTRY_TYPE_MAP = _get_dr().DeviceEntryType._value2member_map_
+        return cls._ENTRY_TYPE_MAP
+
+    @classmethod
+    def _to_entry_type(cls, val):
+        entry_type = cls._get_entry_type_map().get(val)
+        if entry_type is None:
+            entry_type = _get_dr().DeviceEntryType(val)
+        return entry_type
+
     def __init__(self, rust_entry, field_overrides=None):
         self._rust_entry = rust_entry
-        self._field_overrides = field_overrides or {}
+        self._field_overrides = field_overrides if field_overrides else _EMPTY_OVERRIDES
+        self._cached_repr = None
+        self._cached_repr_key = None
+        self._cached_json = None
+        self._cached_json_source = None
+        self._created_at = None
+        self._modified_at = None
+        self._sets_cache = None
+
+    def _cached_set(self, name: str) -> set:
+        """Return the set built from a Rust list field, building it on first access.
+
+        The Rust entry is an immutable snapshot, so each set is built at most once
+        per wrapper. The cached set is shared between reads and must not be mutated.
+        """
+        cache = self._sets_cache
+        if cache is None:
+            cache = self._sets_cache = {}
+        value = cache.get(name)
+        if value is None:
+            value = cache[name] = set(getattr(self._rust_entry, name))
+        return value
 
     @property
     def area_id(self) -> str | None:
@@ -1636,7 +1916,7 @@ class RustDeviceEntry:
 
     @property
     def config_entries(self) -> set[str]:
-        return set(self._rust_entry.config_entries)
+        return self._cached_set("config_entries")
 
     @property
     def config_entries_subentries(self) -> dict[str, set[str | None]]:
@@ -1649,43 +1929,50 @@ class RustDeviceEntry:
 
     @property
     def connections(self) -> set[tuple[str, str]]:
-        return set(self._rust_entry.connections)
+        return self._cached_set("connections")
 
     @property
     def created_at(self) -> datetime:
-        from datetime import timezone
-        return datetime.fromtimestamp(self._rust_entry.created_at_timestamp, tz=timezone.utc)
+        # The Rust entry is an immutable snapshot, so the datetime is built once
+        if self._created_at is None:
+            self._created_at = datetime.fromtimestamp(
+                self._rust_entry.created_at_timestamp, timezone.utc
+            )
+        return self._created_at
 
     @property
     def dict_repr(self) -> dict:
-        """Return a dict representation of the entry."""
-        return {
-            "area_id": self.area_id,
-            "configuration_url": self.configuration_url,
-            "config_entries": list(self.config_entries),
-            "config_entries_subentries": {
-                config_entry_id: list(subentries)
-                for config_entry_id, subentries in self.config_entries_subentries.items()
-            },
-            "connections": [list(c) for c in self.connections],
-            "created_at": self._rust_entry.created_at_timestamp,
-            "disabled_by": self.disabled_by,
-            "entry_type": self.entry_type,
-            "hw_version": self.hw_version,
-            "id": self.id,
-            "identifiers": [list(i) for i in self.identifiers],
-            "labels": list(self.labels),
-            "manufacturer": self.manufacturer,
-            "model": self.model,
-            "model_id": self.model_id,
-            "modified_at": self._rust_entry.modified_at_timestamp,
-            "name_by_user": self.name_by_user,
-            "name": self._field_overrides.get('name', self.name),
-            "primary_config_entry": self.primary_config_entry,
-            "serial_number": self.serial_number,
-            "sw_version": self.sw_version,
-            "via_device_id": self.via_device_id,
-        }
+        """Return a cached dict representation of the entry.
+
+        Rebuilt only when the Rust entry's modified_at or the name override changes.
+        """
+        key = (
+            self._rust_entry.modified_at_timestamp,
+            self._field_overrides.get('name', _UNDEFINED),
+        )
+        if self._cached_repr is not None and self._cached_repr_key == key:
+            return self._cached_repr
+        self._cached_repr = self._finish_dict_repr(
+            self._rust_entry.dict_repr(), self._field_overrides
+        )
+        self._cached_repr_key = key
+        return self._cached_repr
+
+    @classmethod
+    def _finish_dict_repr(cls, dict_repr: dict, field_overrides) -> dict:
+        """Apply enums and the name override to a dict_repr built by Rust, in place.
+
+        Rust builds the whole dict in one call; only these fields need Python.
+        """
+        if dict_repr["disabled_by"]:
+            dict_repr["disabled_by"] = cls._get_disabled_by_map().get(
+                dict_repr["disabled_by"], dict_repr["disabled_by"]
+            )
+        if dict_repr["entry_type"]:
+            dict_repr["entry_type"] = cls._to_entry_type(dict_repr["entry_type"])
+        if field_overrides and 'name' in field_overrides:
+            dict_repr["name"] = field_overrides['name']
+        return dict_repr
 
     @property
     def disabled(self) -> bool:
@@ -1702,8 +1989,7 @@ class RustDeviceEntry:
     def entry_type(self):
         val = self._rust_entry.entry_type
         if val:
-            from homeassistant.helpers.device_registry import DeviceEntryType
-            return DeviceEntryType(val)
+            return self._to_entry_type(val)
         return None
 
     @property
@@ -1716,20 +2002,26 @@ class RustDeviceEntry:
 
     @property
     def identifiers(self) -> set[tuple[str, str]]:
-        return set(self._rust_entry.identifiers)
+        return self._cached_set("identifiers")
 
     @property
     def json_repr(self) -> bytes | None:
         """Return a cached JSON representation of the entry."""
-        import orjson
+        dict_repr = self.dict_repr
+        if self._cached_json_source is dict_repr:
+            return self._cached_json
+        # dict_repr holds only lists, strs, numbers and str enums, so orjson encodes
+        # it natively; only an unserializable name override can fail
         try:
-            return orjson.dumps(self.dict_repr)
-        except (ValueError, TypeError):
-            return None
+            self._cached_json = orjson.dumps(dict_repr)
+        except orjson.JSONEncodeError:
+            self._cached_json = None
+        self._cached_json_source = dict_repr
+        return self._cached_json
 
     @property
     def labels(self) -> set[str]:
-        return set(self._rust_entry.labels)
+        return self._cached_set("labels")
 
     @property
     def manufacturer(self) -> str | None:
@@ -1745,8 +2037,11 @@ class RustDeviceEntry:
 
     @property
     def modified_at(self) -> datetime:
-        from datetime import timezone
-        return datetime.fromtimestamp(self._rust_entry.modified_at_timestamp, tz=timezone.utc)
+        if self._modified_at is None:
+            self._modified_at = datetime.fromtimestamp(
+                self._rust_entry.modified_at_timestamp, timezone.utc
+            )
+        return self._modified_at
 
     @property
     def name(self) -> str | None:
@@ -1782,12 +2077,23 @@ class RustDeviceEntry:
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, RustDeviceEntry):
+            # Rust bumps the revision every time it stores a device, so the
+            # same id and revision (with the same name override) means the
+            # same data; modified_at can repeat under a frozen clock
+            rust_entry = self._rust_entry
+            other_entry = other._rust_entry
+            if (
+                rust_entry.id == other_entry.id
+                and rust_entry.revision == other_entry.revision
+                and self._field_overrides.get('name', _UNDEFINED)
+                == other._field_overrides.get('name', _UNDEFINED)
+            ):
+                return True
             return (
                 self.dict_repr == other.dict_repr
                 and self.suggested_area == other.suggested_area
             )
-        from homeassistant.helpers import device_registry as dr
-        if isinstance(other, dr.DeviceEntry):
+        if isinstance(other, _get_dr().DeviceEntry):
             # Compare timestamps with second precision to avoid float issues
             created_match = (
                 abs(self.created_at.timestamp() - other.created_at.timestamp()) < 1.0
@@ -1847,13 +2153,9 @@ class RustDeviceRegistryItems(dict):
         return self._registry.async_entries_for_config_entry(config_entry_id)
 
     def get_devices_for_label(self, label: str) -> list:
-        """Get devices that have the specified label."""
-        result = [
-            entry for entry in self.values()
-            if label in entry.labels
-        ]
-        result.sort(key=lambda e: e.created_at)
-        return result
+        """Get devices that have the specified label, oldest first (filtered in Rust)."""
+        device_ids = self._registry._rust_registry.async_device_ids_for_label(label)
+        return [self[device_id] for device_id in device_ids if device_id in self]
 
 
 class DeletedDeviceRegistryItems(dict):
@@ -1865,30 +2167,22 @@ class DeletedDeviceRegistryItems(dict):
         raw = rust_registry.deleted_devices
         entries = {}
         for k, v in raw.items():
-            # Build a fingerprint from the mutable fields to detect changes
-            fingerprint = (
-                tuple(sorted(v.config_entries)),
-                tuple(sorted(
-                    (ce_id, tuple(sorted(str(s) for s in subs)))
-                    for ce_id, subs in v.config_entries_subentries.items()
-                )),
-                v.orphaned_timestamp,
-            )
+            # Rust gives every stored deleted entry a fresh revision
+            revision = v.revision
             cached = entry_cache.get(k)
-            if cached is not None and cached[0] == fingerprint:
+            if cached is not None and cached[0] == revision:
                 entries[k] = cached[1]
             else:
                 wrapper = RustDeviceEntry(v)
-                entry_cache[k] = (fingerprint, wrapper)
+                entry_cache[k] = (revision, wrapper)
                 entries[k] = wrapper
         super().__init__(entries)
 
     def get_entry(self, identifiers=None, connections=None):
         """Find a deleted device by identifiers or connections."""
-        ident_list = [tuple(i) for i in identifiers] if identifiers else []
-        conn_list = [tuple(c) for c in connections] if connections else []
+        # Rust reads the pairs straight from the caller's iterables
         result = self._rust_registry.async_get_deleted_by_identifiers_or_connections(
-            ident_list, conn_list
+            identifiers, connections
         )
         if result is None:
             return None
@@ -1913,6 +2207,9 @@ class RustDeviceRegistry:
         self._device_entries: dict[str, "RustDeviceEntry"] = {}
         # Cache for deleted device entries (identity stability for `is` checks)
         self._deleted_entry_cache: dict[str, tuple] = {}
+        # Built `devices` view, reused until the Rust generation moves on
+        self._devices_cache = None
+        self._devices_cache_gen = -1
 
     async def async_load(self) -> None:
         # No-op for testing - Rust registries start empty in test context
@@ -1932,37 +2229,29 @@ class RustDeviceRegistry:
 
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear a config entry from all devices (active and deleted)."""
-        # Capture old snapshots and dict_reprs before clearing (needed for events)
-        affected = {}
-        for dev in self._rust_registry.async_entries_for_config_entry(config_entry_id):
-            affected[dev.id] = (
-                self._get_device_snapshot(dev),
-                RustDeviceEntry(dev, self._field_overrides.get(dev.id, {})).dict_repr,
-            )
-
-        # Clear in Rust - returns (removed_ids, [(dev_id, changed_fields)])
-        removed_ids, updated = self._rust_registry.async_clear_config_entry_with_changes(
+        # Clear in Rust - returns the removed devices' last dict_reprs and the old
+        # values of every changed field in one call, so nothing is captured up front
+        removed, updated = self._rust_registry.async_clear_config_entry_with_changes(
             config_entry_id
         )
 
-        # Fire update events first (with old values from snapshots)
-        for dev_id, changed_fields in updated:
-            old_snapshot = affected.get(dev_id, ({},))[0]
+        # Fire update events first (with old values)
+        runtime_only = self.RUNTIME_ONLY_ATTRS
+        for dev_id, old_values in updated:
             changes = {
-                field: old_snapshot.get(field)
-                for field in changed_fields
-                if field not in self.RUNTIME_ONLY_ATTRS
+                field: value
+                for field, value in self._convert_snapshot_enums(old_values).items()
+                if field not in runtime_only
             }
             if changes:
                 self._fire_event("update", dev_id, changes=changes)
 
         # Fire remove events
-        for dev_id in removed_ids:
-            old_dict_repr = affected.get(dev_id, (None, None))[1]
+        for dev_id, old_dict_repr in removed:
+            RustDeviceEntry._finish_dict_repr(old_dict_repr, self._field_overrides.get(dev_id))
             self._fire_event("remove", dev_id, device=old_dict_repr)
 
         # Also clear from deleted devices (sets orphaned_timestamp when empty)
-        import time
         self._rust_registry.async_clear_config_entry_from_deleted(
             config_entry_id, time.time()
         )
@@ -1979,7 +2268,6 @@ class RustDeviceRegistry:
                 remove_config_subentry_id=config_subentry_id,
             )
         # For deleted devices, clear the subentry directly
-        import time
         self._rust_registry.async_clear_config_subentry_from_deleted(
             config_entry_id, config_subentry_id, time.time()
         )
@@ -1992,17 +2280,29 @@ class RustDeviceRegistry:
         # Also clear from deleted devices
         self._rust_registry.async_clear_label_id_from_deleted(label_id)
 
+    def _wrap(self, entry) -> RustDeviceEntry:
+        """Return the cached wrapper for a Rust entry, re-wrapping only when it changed."""
+        # Rust stamps a fresh revision on every stored version of an entry
+        cached = self._device_entries.get(entry.id)
+        if cached is not None and cached._rust_entry.revision == entry.revision:
+            return cached
+        wrapper = RustDeviceEntry(entry, self._field_overrides.get(entry.id))
+        self._device_entries[entry.id] = wrapper
+        return wrapper
+
     def async_entries_for_area(self, area_id: str) -> list[RustDeviceEntry]:
+        wrap = self._wrap
         return [
-            RustDeviceEntry(entry)
+            wrap(entry)
             for entry in self._rust_registry.async_entries_for_area(area_id)
         ]
 
     def async_entries_for_config_entry(
         self, config_entry_id: str
     ) -> list[RustDeviceEntry]:
+        wrap = self._wrap
         return [
-            RustDeviceEntry(entry)
+            wrap(entry)
             for entry in self._rust_registry.async_entries_for_config_entry(
                 config_entry_id
             )
@@ -2010,71 +2310,50 @@ class RustDeviceRegistry:
 
     def _fire_event(self, action: str, device_id: str, changes: dict | None = None, device: dict | None = None) -> None:
         """Fire device registry updated event."""
-        from homeassistant.helpers import device_registry as dr
         data: dict = {"action": action, "device_id": device_id}
         if changes is not None:
             data["changes"] = changes
         if device is not None:
             data["device"] = device
-        self.hass.bus.async_fire(dr.EVENT_DEVICE_REGISTRY_UPDATED, data)
+        self.hass.bus.async_fire(_get_dr().EVENT_DEVICE_REGISTRY_UPDATED, data)
+
+    def _has_update_listeners(self) -> bool:
+        """Return whether a device registry updated event would reach anyone.
+
+        Only returns False when the bus is known to have no listeners for the
+        event (including match-all listeners); unknown bus types always fire.
+        """
+        bus = self.hass.bus
+        listeners = getattr(bus, "_listeners", None)
+        if listeners is None:
+            return True
+        return bool(
+            listeners.get(_get_dr().EVENT_DEVICE_REGISTRY_UPDATED)
+            or getattr(bus, "_match_all_listeners", None)
+        )
 
     # Runtime-only attributes - don't trigger events/persistence when changed alone
     RUNTIME_ONLY_ATTRS = {"suggested_area"}
 
     def _get_device_snapshot(self, raw_entry) -> dict:
         """Get a snapshot of device entry fields for change detection."""
-        from homeassistant.helpers import device_registry as dr
-        disabled_by = None
-        if raw_entry.disabled_by:
-            disabled_by = dr.DeviceEntryDisabler(raw_entry.disabled_by)
-        entry_type = None
-        if raw_entry.entry_type:
-            entry_type = dr.DeviceEntryType(raw_entry.entry_type)
-        # Get config_entries_subentries as dict of sets
-        config_entries_subentries = {}
-        try:
-            raw_subentries = raw_entry.config_entries_subentries
-            if isinstance(raw_subentries, dict):
-                config_entries_subentries = {
-                    k: set(v) for k, v in raw_subentries.items()
-                }
-        except Exception:
-            pass
-        return {
-            "area_id": raw_entry.area_id,
-            "config_entries": set(raw_entry.config_entries) if raw_entry.config_entries else set(),
-            "config_entries_subentries": config_entries_subentries,
-            "configuration_url": raw_entry.configuration_url,
-            "connections": set((c[0], c[1]) for c in raw_entry.connections) if raw_entry.connections else set(),
-            "disabled_by": disabled_by,
-            "entry_type": entry_type,
-            "hw_version": raw_entry.hw_version,
-            "identifiers": set((i[0], i[1]) for i in raw_entry.identifiers) if raw_entry.identifiers else set(),
-            "labels": set(raw_entry.labels) if raw_entry.labels else set(),
-            "manufacturer": raw_entry.manufacturer,
-            "model": raw_entry.model,
-            "model_id": raw_entry.model_id,
-            "name": raw_entry.name,
-            "name_by_user": raw_entry.name_by_user,
-            "primary_config_entry": raw_entry.primary_config_entry,
-            "serial_number": raw_entry.serial_number,
-            "suggested_area": raw_entry.suggested_area,
-            "sw_version": raw_entry.sw_version,
-            "via_device_id": raw_entry.via_device_id,
-        }
+        # All fields come from Rust in one call; only the enums are converted here
+        return self._convert_snapshot_enums(raw_entry.snapshot())
 
-    def _compute_changes(self, old_snapshot: dict, new_snapshot: dict) -> dict:
-        """Compute changes between old and new device snapshots."""
-        changes = {}
-        for key, old_val in old_snapshot.items():
-            new_val = new_snapshot.get(key)
-            if old_val != new_val:
-                changes[key] = old_val
-        return changes
+    @staticmethod
+    def _convert_snapshot_enums(values: dict) -> dict:
+        """Convert enum fields of a Rust snapshot dict from strings, in place."""
+        if values.get("disabled_by"):
+            values["disabled_by"] = RustDeviceEntry._get_disabled_by_map()[
+                values["disabled_by"]
+            ]
+        if values.get("entry_type"):
+            values["entry_type"] = RustDeviceEntry._to_entry_type(values["entry_type"])
+        return values
 
     def async_get(self, device_id: str) -> RustDeviceEntry | None:
         entry = self._rust_registry.async_get(device_id)
-        return RustDeviceEntry(entry) if entry else None
+        return self._wrap(entry) if entry else None
 
     def async_get_device(
         self,
@@ -2126,18 +2405,16 @@ class RustDeviceRegistry:
         # If no existing device, check if there's a matching deleted device to restore
         was_restored = False
         if existing is None:
-            ident_list = [tuple(i) for i in identifiers] if identifiers else []
-            conn_list = [tuple(c) for c in connections] if connections else []
             deleted = self._rust_registry.async_get_deleted_by_identifiers_or_connections(
-                ident_list, conn_list
+                identifiers, connections
             )
             if deleted is not None:
                 # Restore as a fresh entry preserving only user customizations
-                now_ts = datetime.now(timezone.utc).timestamp()
+                now_ts = time.time()
                 self._rust_registry.async_restore_deleted_fresh(
                     deleted.id,
-                    ident_list,
-                    conn_list,
+                    identifiers,
+                    connections,
                     config_entry_id,
                     config_subentry_id,
                     now_ts,
@@ -2154,35 +2431,25 @@ class RustDeviceRegistry:
             if primary_entry is not None:
                 current_primary_domain = primary_entry.domain
 
-        # Compute initial_disabled_by (only for new devices)
-        initial_disabled_by = None
-        if disabled_by is not None and existing is None:
-            initial_disabled_by = str(disabled_by.value) if hasattr(disabled_by, 'value') else str(disabled_by)
-
-        # Convert entry_type: _GOC_UNSET=don't set, None=clear, enum=set
-        rust_entry_type = None
-        if entry_type is not _GOC_UNSET:
-            if entry_type is None:
-                rust_entry_type = ""  # Empty string = clear
-            elif hasattr(entry_type, 'value'):
-                rust_entry_type = str(entry_type.value)
-            else:
-                rust_entry_type = str(entry_type)
-
-        # Convert configuration_url: _GOC_UNSET=don't set, None=clear, str=set
-        rust_config_url = None
-        if configuration_url is not _GOC_UNSET:
-            if configuration_url is None:
-                rust_config_url = ""  # Empty string = clear
-            else:
-                rust_config_url = str(configuration_url)
+        # initial_disabled_by only applies to new devices; the StrEnum member
+        # extracts as its value in Rust
+        initial_disabled_by = disabled_by if existing is None else None
+
+        # Three-state fields cross the FFI as None=don't set, ""=clear, str=set.
+        # DeviceEntryType is a StrEnum, so Rust extracts the member as its value.
+        rust_entry_type = None if entry_type is _GOC_UNSET else entry_type or ""
+        rust_config_url = (
+            None
+            if configuration_url is _GOC_UNSET
+            else "" if configuration_url is None else str(configuration_url)
+        )
 
-        now_ts = datetime.now(timezone.utc).timestamp()
+        now_ts = time.time()
         entry, changed_fields = self._rust_registry.async_get_or_create(
             config_entry_id=config_entry_id,
             config_subentry_id=config_subentry_id,
-            identifiers=list(identifiers) if identifiers else None,
-            connections=list(connections) if connections else None,
+            identifiers=identifiers if identifiers else None,
+            connections=connections if connections else None,
             manufacturer=manufacturer,
             model=model,
             model_id=model_id,
@@ -2204,9 +2471,7 @@ class RustDeviceRegistry:
 
         # Log warning if via_device references a non-existing device
         if via_device and not entry.via_device_id:
-            import logging
-            _LOGGER = logging.getLogger("homeassistant.helpers.device_registry")
-            _LOGGER.error(
+            _DR_LOGGER.error(
                 'calls `device_registry.async_get_or_create` '
                 'referencing a non existing `via_device` '
                 '("%s","%s")',
@@ -2227,24 +2492,28 @@ class RustDeviceRegistry:
                 entry, area_changes = self._rust_registry.async_update_device(
                     entry.id, area_id=area.id, modified_at=now_ts
                 )
-                changed_fields = list(set(changed_fields) | set(area_changes))
+                if existing is not None:
+                    # Rust field lists are already deduplicated
+                    changed_fields.extend(
+                        [field for field in area_changes if field not in changed_fields]
+                    )
 
-        # Fire device registry events
+        # Fire device registry events; every changed field is a snapshot key
         if existing is None:
             self._fire_event("create", entry.id)
         elif changed_fields:
-            changes = {field: old_snapshot[field] for field in changed_fields if field in old_snapshot}
-            if changes:
-                self._fire_event("update", entry.id, changes=changes)
+            self._fire_event(
+                "update",
+                entry.id,
+                changes={field: old_snapshot.get(field) for field in changed_fields},
+            )
 
         return RustDeviceEntry(entry)
 
     def async_purge_expired_orphaned_devices(self) -> None:
         """Purge expired orphaned deleted devices."""
-        import time
-        from homeassistant.helpers.device_registry import ORPHANED_DEVICE_KEEP_SECONDS
         self._rust_registry.async_purge_expired_orphaned_devices(
-            time.time(), float(ORPHANED_DEVICE_KEEP_SECONDS)
+            time.time(), float(_get_dr().ORPHANED_DEVICE_KEEP_SECONDS)
         )
 
     def async_remove_device(self, device_id: str) -> None:
@@ -2255,29 +2524,20 @@ class RustDeviceRegistry:
         device_entry = self._rust_registry.async_get(device_id)
         device_config_entries = set(device_entry.config_entries) if device_entry else set()
 
-        # Build dict_repr before removal for the event
-        device_dict_repr = None
-        if device_entry:
-            device_dict_repr = RustDeviceEntry(device_entry, self._field_overrides.get(device_id, {})).dict_repr
-
         # Rust handles removal AND via_device_id cleanup on other devices
         self._rust_registry.async_remove_device(device_id)
 
-        # Fire remove event
-        if device_dict_repr is not None:
+        # Fire remove event; the Rust entry is an immutable snapshot, so its
+        # dict_repr is only built once we know someone listens
+        if device_entry and self._has_update_listeners():
+            device_dict_repr = RustDeviceEntry(device_entry, self._field_overrides.get(device_id, {})).dict_repr
             self._fire_event("remove", device_id, device=device_dict_repr)
 
         # Clean up entities associated with this device (cross-registry coordination)
         if er.DATA_REGISTRY in self.hass.data:
-            entity_reg = self.hass.data[er.DATA_REGISTRY]
-            entities = entity_reg.entities.get_entries_for_device_id(
-                device_id, include_disabled_entities=True
+            self.hass.data[er.DATA_REGISTRY]._async_device_removed(
+                device_id, device_config_entries
             )
-            for entity in entities:
-                if entity.config_entry_id in device_config_entries:
-                    entity_reg.async_remove(entity.entity_id)
-                else:
-                    entity_reg.async_update_entity(entity.entity_id, device_id=None)
 
     def async_schedule_save(self) -> None:
         """Schedule a save - no-op for testing."""
@@ -2309,16 +2569,21 @@ class RustDeviceRegistry:
                 "Can't remove config subentry without specifying config entry"
             )
 
+        # Config entries don't change during this call, so each one is looked up once
+        get_entry = self.hass.config_entries.async_get_entry
+        add_ce = None
+
         # Validate add_config_entry_id
         if add_config_entry_id is not None:
-            if self.hass.config_entries.async_get_entry(add_config_entry_id) is None:
+            add_ce = get_entry(add_config_entry_id)
+            if add_ce is None:
                 raise HomeAssistantError(
                     f"Can't link device to unknown config entry {add_config_entry_id}"
                 )
 
         # Validate add_config_subentry_id references a real subentry
         if add_config_subentry_id is not _UNSET and add_config_subentry_id is not None:
-            config_entry = self.hass.config_entries.async_get_entry(add_config_entry_id)
+            config_entry = add_ce
             if config_entry is not None:
                 valid_subentry_ids = set()
                 if hasattr(config_entry, 'subentries') and config_entry.subentries:
@@ -2353,7 +2618,6 @@ class RustDeviceRegistry:
         if add_config_entry_id is not None:
             rust_add_ce_id = add_config_entry_id
             rust_add_sub_id = add_config_subentry_id if add_config_subentry_id is not _UNSET else None
-            add_ce = self.hass.config_entries.async_get_entry(add_config_entry_id)
             rust_add_ce_disabled = bool(add_ce.disabled_by) if add_ce else False
 
         if remove_config_entry_id is not None:
@@ -2364,45 +2628,29 @@ class RustDeviceRegistry:
             else:
                 rust_remove_sub_only = False
             if old_device:
-                rust_ce_disabled_map = {}
-                for ce_id in old_device.config_entries:
-                    ce = self.hass.config_entries.async_get_entry(ce_id)
-                    rust_ce_disabled_map[ce_id] = bool(ce.disabled_by) if ce else True
-
-        # Enum conversions for Rust
-        if 'disabled_by' in kwargs:
-            db = kwargs['disabled_by']
-            if db is not None and hasattr(db, 'value'):
-                kwargs['disabled_by'] = str(db.value)
-            elif db is None:
-                kwargs['disabled_by'] = ""  # Empty string = clear
-
-        if 'entry_type' in kwargs:
-            et = kwargs['entry_type']
-            if et is not None and hasattr(et, 'value'):
-                kwargs['entry_type'] = str(et.value)
-            elif et is None:
-                kwargs['entry_type'] = ""  # Empty string = clear
-
-        # Clearable fields: None means "clear", convert to "" for Rust
-        for field in ('area_id', 'via_device_id', 'name_by_user',
-                      'configuration_url', 'suggested_area'):
-            if field in kwargs and kwargs[field] is None:
-                kwargs[field] = ""
+                # Unknown config entries count as disabled
+                rust_ce_disabled_map = {
+                    ce_id: (ce := get_entry(ce_id)) is None or bool(ce.disabled_by)
+                    for ce_id in old_device.config_entries
+                }
 
-        # Convert labels set to list for Rust
-        if 'labels' in kwargs and isinstance(kwargs['labels'], set):
-            kwargs['labels'] = list(kwargs['labels'])
+        # Convert only the fields actually passed (clearable None -> "", sets -> lists)
+        normalizers = _DEVICE_UPDATE_NORMALIZERS
+        for key, value in kwargs.items():
+            normalize = normalizers.get(key)
+            if normalize is not None:
+                kwargs[key] = normalize(value)
 
         # Handle non-string field values that Rust can't accept
         if 'name' in kwargs and kwargs['name'] is not None and not isinstance(kwargs['name'], str):
             if device_id not in self._field_overrides:
                 self._field_overrides[device_id] = {}
             self._field_overrides[device_id]['name'] = kwargs.pop('name')
+            self._devices_cache = None
 
         # Build the Rust call kwargs
         rust_kwargs = dict(kwargs)
-        rust_kwargs['modified_at'] = datetime.now(timezone.utc).timestamp()
+        rust_kwargs['modified_at'] = time.time()
 
         # Pass merge/new connections/identifiers directly to Rust
         if merge_connections is not None:
@@ -2445,73 +2693,81 @@ class RustDeviceRegistry:
             self._device_entries.pop(device_id, None)
             device_config_entries = set(old_device.config_entries) if old_device else set()
 
-            # Fire remove event
-            if old_device:
-                device_dict_repr = RustDeviceEntry(old_device, self._field_overrides.get(device_id, {})).dict_repr
-                self._fire_event("remove", device_id, device=device_dict_repr)
-            else:
-                self._fire_event("remove", device_id)
+            # Fire remove event, building dict_repr only if someone listens
+            if self._has_update_listeners():
+                if old_device:
+                    device_dict_repr = RustDeviceEntry(old_device, self._field_overrides.get(device_id, {})).dict_repr
+                    self._fire_event("remove", device_id, device=device_dict_repr)
+                else:
+                    self._fire_event("remove", device_id)
 
             # Clean up entities associated with this device (cross-registry)
             if er.DATA_REGISTRY in self.hass.data:
-                entity_reg = self.hass.data[er.DATA_REGISTRY]
-                entities = entity_reg.entities.get_entries_for_device_id(
-                    device_id, include_disabled_entities=True
+                self.hass.data[er.DATA_REGISTRY]._async_device_removed(
+                    device_id, device_config_entries
                 )
-                for entity in entities:
-                    if entity.config_entry_id in device_config_entries:
-                        entity_reg.async_remove(entity.entity_id)
-                    else:
-                        entity_reg.async_update_entity(entity.entity_id, device_id=None)
             return None
 
-        # Clean up entities when a config entry is removed from the device (device still exists)
-        if remove_config_entry_id and er.DATA_REGISTRY in self.hass.data:
-            # Check if the config entry was actually removed from the device
-            if remove_config_entry_id not in entry.config_entries:
-                entity_reg = self.hass.data[er.DATA_REGISTRY]
-                entities = entity_reg.entities.get_entries_for_device_id(
-                    device_id, include_disabled_entities=True
-                )
-                for entity in entities:
-                    if entity.config_entry_id == remove_config_entry_id:
-                        entity_reg.async_remove(entity.entity_id)
-
-        # Fire event if there are changes
-        new_device = RustDeviceEntry(entry, self._field_overrides.get(device_id, {}))
+        # Nothing changed (so no config entry was actually removed either)
         if not changed_fields:
-            # No-op: return cached entry for identity semantics
-            if device_id in self._device_entries:
-                return self._device_entries[device_id]
+            # No-op: return cached entry for identity semantics, wrapping only on a miss
+            cached = self._device_entries.get(device_id)
+            if cached is not None:
+                return cached
+            new_device = RustDeviceEntry(entry, self._field_overrides.get(device_id))
             self._device_entries[device_id] = new_device
             return new_device
+
+        # The device's entities (disabled included) are scanned for at most once
+        # below and shared by the config entry cleanup and disabled_by handling
+        entity_reg = self.hass.data.get(er.DATA_REGISTRY)
+        device_entities = None
+
+        # Clean up entities when a config entry is removed from the device (device still exists)
+        if (
+            remove_config_entry_id
+            and entity_reg is not None
+            and remove_config_entry_id not in entry.config_entries
+        ):
+            device_entities = entity_reg.entities.get_entries_for_device_id(
+                device_id, include_disabled_entities=True
+            )
+            remaining = []
+            for entity in device_entities:
+                if entity.config_entry_id == remove_config_entry_id:
+                    entity_reg.async_remove(entity.entity_id)
+                else:
+                    remaining.append(entity)
+            device_entities = remaining
+
+        # Fire event if there are changes
+        new_device = RustDeviceEntry(entry, self._field_overrides.get(device_id))
         # Build changes dict from old_snapshot and changed field names
         changes = {field: old_snapshot[field] for field in changed_fields if field in old_snapshot} if old_snapshot else {}
-        if changes:
-            # Only fire event and save if there are non-runtime-only changes
-            if changes.keys() - self.RUNTIME_ONLY_ATTRS:
-                self._fire_event("update", device_id, changes=changes)
-                self.async_schedule_save()
+        # Only fire event and save if there are non-runtime-only changes
+        if changes and not self.RUNTIME_ONLY_ATTRS.issuperset(changes):
+            self._fire_event("update", device_id, changes=changes)
+            self.async_schedule_save()
 
         # Handle device disabled_by changes → update entities
-        if er.DATA_REGISTRY in self.hass.data and old_disabled_by != new_device.disabled_by:
-            entity_reg = self.hass.data[er.DATA_REGISTRY]
-            if not new_device.disabled_by:
-                # Device re-enabled - re-enable entities that were disabled by DEVICE
-                entities = entity_reg.entities.get_entries_for_device_id(
+        if entity_reg is not None and old_disabled_by != new_device.disabled_by:
+            if device_entities is None:
+                device_entities = entity_reg.entities.get_entries_for_device_id(
                     device_id, include_disabled_entities=True
                 )
-                for entity in entities:
+            if not new_device.disabled_by:
+                # Device re-enabled - re-enable entities that were disabled by DEVICE
+                for entity in device_entities:
                     if entity.disabled_by and entity.disabled_by.value == "device":
                         entity_reg.async_update_entity(entity.entity_id, disabled_by=None)
             elif str(new_device.disabled_by) != "config_entry":
-                # Device disabled (not by config entry) - disable entities
-                entities = entity_reg.entities.get_entries_for_device_id(device_id)
-                for entity in entities:
-                    entity_reg.async_update_entity(
-                        entity.entity_id,
-                        disabled_by=er.RegistryEntryDisabler.DEVICE,
-                    )
+                # Device disabled (not by config entry) - disable enabled entities
+                for entity in device_entities:
+                    if not entity.disabled_by:
+                        entity_reg.async_update_entity(
+                            entity.entity_id,
+                            disabled_by=er.RegistryEntryDisabler.DEVICE,
+                        )
 
         self._device_entries[device_id] = new_device
         return new_device
@@ -2526,14 +2782,19 @@ class RustDeviceRegistry:
 
     @property
     def devices(self) -> RustDeviceRegistryItems:
-        entries = [
-            RustDeviceEntry(entry, self._field_overrides.get(entry.id, {}))
-            for entry in self._rust_registry.devices.values()
-        ]
-        # Sort by insertion_order to match native HA's insertion-order dict behavior
-        entries.sort(key=lambda e: e._rust_entry.insertion_order)
-        data = {entry.id: entry for entry in entries}
-        return RustDeviceRegistryItems(self, data)
+        generation = self._rust_registry.generation
+        if self._devices_cache is not None and self._devices_cache_gen == generation:
+            return self._devices_cache
+        # Rust sorts by insertion_order to match native HA's insertion-order dict
+        # behavior; unchanged devices keep their cached wrappers
+        wrap = self._wrap
+        data = {
+            entry.id: wrap(entry)
+            for entry in self._rust_registry.sorted_by_insertion_order()
+        }
+        self._devices_cache = RustDeviceRegistryItems(self, data)
+        self._devices_cache_gen = generation
+        return self._devices_cache
 
     def __iter__(self):
         return iter(self.devices.values())
@@ -2549,18 +2810,35 @@ class RustDeviceRegistry:
 class RustAreaEntry:
     """Wrapper for AreaEntry compatible with homeassistant.helpers.area_registry."""
 
-    __slots__ = ("_rust_entry",)
+    __slots__ = (
+        "_rust_entry",
+        "_json_fragment",
+        "_created_at",
+        "_modified_at",
+        "_aliases",
+        "_labels",
+    )
 
     def __init__(self, rust_entry):
         self._rust_entry = rust_entry
+        self._created_at = None
+        self._modified_at = None
+        self._aliases = None
+        self._labels = None
+        self._json_fragment = None
 
     @property
     def aliases(self) -> set[str]:
-        return set(self._rust_entry.aliases)
+        if self._aliases is None:
+            # Rust hands over a frozenset; copying it into a set reuses its hashes
+            self._aliases = set(self._rust_entry.aliases)
+        return self._aliases
 
     @property
     def created_at(self) -> datetime:
-        return _parse_iso_datetime(self._rust_entry.created_at)
+        if self._created_at is None:
+            self._created_at = _parse_iso_datetime(self._rust_entry.created_at)
+        return self._created_at
 
     @property
     def floor_id(self) -> str | None:
@@ -2581,10 +2859,9 @@ class RustAreaEntry:
     @property
     def json_fragment(self):
         """Return a pre-serialized JSON fragment for this area entry."""
-        import orjson
-        from homeassistant.helpers.json import json_fragment
-        return json_fragment(
-            orjson.dumps({
+        # The wrapped Rust entry is an immutable snapshot, so serialize it once
+        if self._json_fragment is None:
+            self._json_fragment = orjson.Fragment(orjson.dumps({
                 "aliases": list(self.aliases),
                 "area_id": self.id,
                 "floor_id": self.floor_id,
@@ -2596,16 +2873,20 @@ class RustAreaEntry:
                 "temperature_entity_id": self.temperature_entity_id,
                 "created_at": self.created_at.timestamp(),
                 "modified_at": self.modified_at.timestamp(),
-            })
-        )
+            }))
+        return self._json_fragment
 
     @property
     def labels(self) -> set[str]:
-        return set(self._rust_entry.labels)
+        if self._labels is None:
+            self._labels = set(self._rust_entry.labels)
+        return self._labels
 
     @property
     def modified_at(self) -> datetime:
-        return _parse_iso_datetime(self._rust_entry.modified_at)
+        if self._modified_at is None:
+            self._modified_at = _parse_iso_datetime(self._rust_entry.modified_at)
+        return self._modified_at
 
     @property
     def name(self) -> str:
@@ -2664,22 +2945,18 @@ class RustAreaRegistryItems(dict):
         self._rust_registry = rust_registry
 
     def get_areas_for_floor(self, floor_id: str) -> list:
-        """Get areas for a given floor, sorted by creation time."""
-        entries = [
+        """Get areas for a given floor, sorted by creation time (in Rust)."""
+        return [
             RustAreaEntry(entry)
             for entry in self._rust_registry.async_get_areas_for_floor(floor_id)
         ]
-        entries.sort(key=lambda e: e.created_at)
-        return entries
 
     def get_areas_for_label(self, label_id: str) -> list:
-        """Get areas for a given label, sorted by creation time."""
-        entries = [
+        """Get areas for a given label, sorted by creation time (in Rust)."""
+        return [
             RustAreaEntry(entry)
             for entry in self._rust_registry.async_get_areas_for_label(label_id)
         ]
-        entries.sort(key=lambda e: e.created_at)
-        return entries
 
 
 class RustAreaRegistry:
@@ -2691,6 +2968,9 @@ class RustAreaRegistry:
         self._rust_registry = ha_core_rs.AreaRegistry(hass)
         self._hass = hass
         self._ordered_ids = None
+        # Built `areas` view, reused until the Rust generation moves on
+        self._areas_cache = None
+        self._areas_cache_gen = -1
 
     async def async_load(self) -> None:
         # No-op for testing - Rust registries start empty in test context
@@ -2701,11 +2981,23 @@ class RustAreaRegistry:
         pass
 
     def _fire_event(self, action: str, area_id: str) -> None:
-        self._hass.bus.async_fire(
-            "area_registry_updated",
-            {"action": action, "area_id": area_id},
+        ha_core_rs.fire_registry_event(
+            self._hass.bus, "area_registry_updated", action, "area_id", area_id
         )
 
+    def _patch_areas_cache(self, generation: int, area_id: str, area=None) -> None:
+        """Apply one change to the cached `areas` view if it was current before it."""
+        # Cascades from other registries change areas behind our back; those
+        # leave the generation mismatched and force a rebuild instead
+        items = self._areas_cache
+        if items is None or self._areas_cache_gen != generation:
+            return
+        if area is None:
+            items.pop(area_id, None)
+        else:
+            items[area_id] = area
+        self._areas_cache_gen = self._rust_registry.generation
+
     def async_create(
         self,
         name: str,
@@ -2718,6 +3010,7 @@ class RustAreaRegistry:
         picture: str | None = None,
         temperature_entity_id: str | None = None,
     ) -> RustAreaEntry:
+        generation = self._rust_registry.generation
         entry = self._rust_registry.async_create(
             name=name,
             aliases=list(aliases) if aliases else None,
@@ -2729,11 +3022,16 @@ class RustAreaRegistry:
             temperature_entity_id=temperature_entity_id,
         )
         area = RustAreaEntry(entry)
+        if self._ordered_ids is not None:
+            self._ordered_ids.append(area.id)
+        self._patch_areas_cache(generation, area.id, area)
         self._fire_event("create", area.id)
         return area
 
     def async_delete(self, area_id: str) -> None:
+        generation = self._rust_registry.generation
         self._rust_registry.async_delete(area_id)
+        self._patch_areas_cache(generation, area_id)
         self._fire_event("remove", area_id)
 
     def async_get(self, area_id: str) -> RustAreaEntry | None:
@@ -2766,6 +3064,7 @@ class RustAreaRegistry:
                 "The area_ids list must contain all existing area IDs exactly once"
             )
         self._ordered_ids = list(area_ids)
+        self._areas_cache = None
         self._fire_event("reorder", "")
 
     def async_update(
@@ -2773,35 +3072,44 @@ class RustAreaRegistry:
         area_id: str,
         **kwargs,
     ) -> RustAreaEntry:
-        # Convert set types to list for Rust
-        if 'aliases' in kwargs and isinstance(kwargs['aliases'], set):
-            kwargs['aliases'] = list(kwargs['aliases'])
-        if 'labels' in kwargs and isinstance(kwargs['labels'], set):
-            kwargs['labels'] = list(kwargs['labels'])
+        # Rust wants lists; accept any iterable
+        for field in ('aliases', 'labels'):
+            if kwargs.get(field) is not None:
+                kwargs[field] = list(kwargs[field])
         # Convert None to empty string for clearable fields (Rust uses "" as sentinel)
         for field in ('floor_id', 'humidity_entity_id', 'icon', 'picture', 'temperature_entity_id'):
             if field in kwargs and kwargs[field] is None:
                 kwargs[field] = ""
+        generation = self._rust_registry.generation
         entry = self._rust_registry.async_update(area_id, **kwargs)
         area = RustAreaEntry(entry)
+        self._patch_areas_cache(generation, area_id, area)
         self._fire_event("update", area_id)
         return area
 
     @property
     def areas(self):
+        generation = self._rust_registry.generation
+        if self._areas_cache is not None and self._areas_cache_gen == generation:
+            return self._areas_cache
         # Return a dict subclass that provides get_areas_for_floor/get_areas_for_label
-        all_areas = {entry.id: entry for entry in self._rust_registry.areas.values()}
         if self._ordered_ids is not None:
-            # Use explicit ordering from async_reorder
-            entries = [all_areas[aid] for aid in self._ordered_ids if aid in all_areas]
+            # Use explicit ordering from async_reorder; wrap while picking
+            all_areas = self._rust_registry.areas
+            data = {
+                aid: RustAreaEntry(all_areas[aid])
+                for aid in self._ordered_ids
+                if aid in all_areas
+            }
         else:
-            # Sort by created_at for deterministic order (DashMap doesn't preserve insertion order)
-            entries = sorted(all_areas.values(), key=lambda e: e.created_at)
-        data = {
-            entry.id: RustAreaEntry(entry)
-            for entry in entries
-        }
-        return RustAreaRegistryItems(data, self._rust_registry)
+            # Rust sorts by created_at (DashMap doesn't preserve insertion order)
+            data = {
+                entry.id: RustAreaEntry(entry)
+                for entry in self._rust_registry.sorted_by_created_at()
+            }
+        self._areas_cache = RustAreaRegistryItems(data, self._rust_registry)
+        self._areas_cache_gen = generation
+        return self._areas_cache
 
     def __iter__(self):
         return iter(self.areas.values())
@@ -2817,18 +3125,25 @@ class RustAreaRegistry:
 class RustFloorEntry:
     """Wrapper for FloorEntry compatible with homeassistant.helpers.floor_registry."""
 
-    __slots__ = ("_rust_entry",)
+    __slots__ = ("_rust_entry", "_created_at", "_modified_at", "_aliases")
 
     def __init__(self, rust_entry):
         self._rust_entry = rust_entry
+        self._created_at = None
+        self._modified_at = None
+        self._aliases = None
 
     @property
     def aliases(self) -> set[str]:
-        return set(self._rust_entry.aliases)
+        if self._aliases is None:
+            self._aliases = set(self._rust_entry.aliases)
+        return self._aliases
 
     @property
     def created_at(self) -> datetime:
-        return _parse_iso_datetime(self._rust_entry.created_at)
+        if self._created_at is None:
+            self._created_at = _parse_iso_datetime(self._rust_entry.created_at)
+        return self._created_at
 
     @property
     def floor_id(self) -> str:
@@ -2844,7 +3159,9 @@ class RustFloorEntry:
 
     @property
     def modified_at(self) -> datetime:
-        return _parse_iso_datetime(self._rust_entry.modified_at)
+        if self._modified_at is None:
+            self._modified_at = _parse_iso_datetime(self._rust_entry.modified_at)
+        return self._modified_at
 
     @property
     def name(self) -> str:
@@ -2856,7 +3173,8 @@ class RustFloorEntry:
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, RustFloorEntry):
-            return self.floor_id == other.floor_id and self.name == other.name
+            # Delegate to underlying Rust __eq__ which compares all fields
+            return self._rust_entry == other._rust_entry
         # Cross-type comparison with HA's FloorEntry dataclass
         if hasattr(other, 'floor_id') and hasattr(other, 'name'):
             return (
@@ -2886,6 +3204,9 @@ class RustFloorRegistry:
         self._rust_registry = ha_core_rs.FloorRegistry(hass)
         self._hass = hass
         self._ordered_ids = []  # Track insertion/reorder order
+        # Built `floors` view, reused until the Rust generation moves on
+        self._floors_cache = None
+        self._floors_cache_gen = -1
 
     async def async_load(self) -> None:
         # No-op for testing - Rust registries start empty in test context
@@ -2896,9 +3217,8 @@ class RustFloorRegistry:
         pass
 
     def _fire_event(self, action: str, floor_id: str) -> None:
-        self._hass.bus.async_fire(
-            "floor_registry_updated",
-            {"action": action, "floor_id": floor_id},
+        ha_core_rs.fire_registry_event(
+            self._hass.bus, "floor_registry_updated", action, "floor_id", floor_id
         )
 
     def async_create(
@@ -2998,12 +3318,17 @@ class RustFloorRegistry:
 
     @property
     def floors(self) -> dict[str, RustFloorEntry]:
-        # Sort by created_at for deterministic order (DashMap doesn't preserve insertion order)
-        entries = sorted(self._rust_registry.floors.values(), key=lambda e: e.created_at)
-        return {
+        generation = self._rust_registry.generation
+        if self._floors_cache is not None and self._floors_cache_gen == generation:
+            return self._floors_cache
+        # Rust sorts by created_at (DashMap doesn't preserve insertion order)
+        entries = self._rust_registry.sorted_by_created_at()
+        self._floors_cache = {
             entry.floor_id: RustFloorEntry(entry)
             for entry in entries
         }
+        self._floors_cache_gen = generation
+        return self._floors_cache
 
     def __iter__(self):
         return iter(self.floors.values())
@@ -3019,10 +3344,13 @@ class RustFloorRegistry:
 class RustLabelEntry:
     """Wrapper for LabelEntry compatible with homeassistant.helpers.label_registry."""
 
-    __slots__ = ("_rust_entry",)
+    __slots__ = ("_rust_entry", "_label_id", "_created_at", "_modified_at")
 
     def __init__(self, rust_entry):
         self._rust_entry = rust_entry
+        self._label_id = None
+        self._created_at = None
+        self._modified_at = None
 
     @property
     def color(self) -> str | None:
@@ -3030,7 +3358,10 @@ class RustLabelEntry:
 
     @property
     def created_at(self) -> datetime:
-        return _parse_iso_datetime(self._rust_entry.created_at)
+        # Rust hands over a datetime; keep it so repeated reads skip the FFI
+        if self._created_at is None:
+            self._created_at = self._rust_entry.created_at
+        return self._created_at
 
     @property
     def description(self) -> str | None:
@@ -3042,11 +3373,16 @@ class RustLabelEntry:
 
     @property
     def label_id(self) -> str:
-        return self._rust_entry.label_id
+        # __hash__ and __eq__ go through here
+        if self._label_id is None:
+            self._label_id = self._rust_entry.label_id
+        return self._label_id
 
     @property
     def modified_at(self) -> datetime:
-        return _parse_iso_datetime(self._rust_entry.modified_at)
+        if self._modified_at is None:
+            self._modified_at = self._rust_entry.modified_at
+        return self._modified_at
 
     @property
     def name(self) -> str:
@@ -3059,17 +3395,21 @@ class RustLabelEntry:
     def __eq__(self, other: object) -> bool:
         if isinstance(other, RustLabelEntry):
             return self.label_id == other.label_id and self.name == other.name
-        if hasattr(other, 'label_id') and hasattr(other, 'name'):
-            return (
-                self.label_id == getattr(other, 'label_id', None)
-                and self.name == other.name
-                and self.icon == getattr(other, 'icon', None)
-                and self.color == getattr(other, 'color', None)
-                and self.description == getattr(other, 'description', None)
-                and self.created_at == getattr(other, 'created_at', None)
-                and self.modified_at == getattr(other, 'modified_at', None)
+        # Cross-type comparison with HA's LabelEntry dataclass
+        try:
+            other_fields = (
+                other.label_id,
+                other.name,
+                other.icon,
+                other.color,
+                other.description,
+                other.created_at,
+                other.modified_at,
             )
-        return NotImplemented
+        except AttributeError:
+            return NotImplemented
+        # One FFI call for every field, compared as tuples in C
+        return self._rust_entry.snapshot() == other_fields
 
     def __hash__(self) -> int:
         return hash(self.label_id)
@@ -3081,11 +3421,19 @@ class RustLabelEntry:
 class RustLabelRegistry:
     """Wrapper that provides HA-compatible LabelRegistry API backed by Rust."""
 
+    # __dict__ stays so tests can patch.object() the shared instance
+    __slots__ = (
+        "_rust_registry", "_hass", "_labels_cache", "_labels_cache_gen", "__dict__",
+    )
+
     def __init__(self, hass):
         if not _rust_available:
             raise RuntimeError("ha_core_rs not available")
         self._rust_registry = ha_core_rs.LabelRegistry(hass)
         self._hass = hass
+        # Built `labels` view, reused until the Rust generation moves on
+        self._labels_cache = None
+        self._labels_cache_gen = -1
 
     async def async_load(self) -> None:
         # No-op for testing - Rust registries start empty in test context
@@ -3096,9 +3444,8 @@ class RustLabelRegistry:
         pass
 
     def _fire_event(self, action: str, label_id: str) -> None:
-        self._hass.bus.async_fire(
-            "label_registry_updated",
-            {"action": action, "label_id": label_id},
+        ha_core_rs.fire_registry_event(
+            self._hass.bus, "label_registry_updated", action, "label_id", label_id
         )
 
     def async_create(
@@ -3120,12 +3467,12 @@ class RustLabelRegistry:
         return label
 
     def async_delete(self, label_id: str) -> None:
-        self._rust_registry.async_delete(label_id)
-        self._fire_event("remove", label_id)
-        # Cross-registry cleanup: clear label from areas that reference it
+        # Rust deletes the label and clears it from the areas in one call
         area_reg = self._hass.data.get("area_registry")
-        if area_reg is not None:
-            area_reg._rust_registry.async_clear_label_id(label_id)
+        self._rust_registry.async_delete_cascade(
+            label_id, None if area_reg is None else area_reg._rust_registry
+        )
+        self._fire_event("remove", label_id)
 
     def async_get(self, label_id: str) -> RustLabelEntry | None:
         entry = self._rust_registry.async_get_label(label_id)
@@ -3140,7 +3487,8 @@ class RustLabelRegistry:
 
     def async_list_labels(self):
         """Get all labels sorted by creation order."""
-        return sorted(self.labels.values(), key=lambda l: l.created_at)
+        # The labels view is already in creation order
+        return self.labels.values()
 
     def async_update(
         self,
@@ -3154,30 +3502,43 @@ class RustLabelRegistry:
         old = self._rust_registry.async_get_label(label_id)
         if old is None:
             raise ValueError(f"Label not found: {label_id}")
-        # Resolve UNDEFINED: keep old value; None: clear field; str: set value
-        new_name = old.name if name is _UNDEFINED else name
-        new_icon = old.icon if icon is _UNDEFINED else icon
-        new_color = old.color if color is _UNDEFINED else color
-        new_description = old.description if description is _UNDEFINED else description
+        # Resolve UNDEFINED: keep old value; None: clear field; str: set value.
+        # The old values come from one snapshot call rather than four getters
+        _, old_name, old_icon, old_color, old_description, _, _ = old.snapshot()
+        new_name = old_name if name is _UNDEFINED else name
+        new_icon = old_icon if icon is _UNDEFINED else icon
+        new_color = old_color if color is _UNDEFINED else color
+        new_description = old_description if description is _UNDEFINED else description
         # Use async_set_fields which always sets all fields (None = clear)
+        generation = self._rust_registry.generation
         entry = self._rust_registry.async_set_fields(
             label_id, new_name,
             icon=new_icon, color=new_color, description=new_description,
         )
-        label = RustLabelEntry(entry)
-        # Only fire event if data actually changed (Rust updates modified_at only on real changes)
-        if entry.modified_at != old.modified_at:
-            self._fire_event("update", label_id)
-        return label
+        # Rust leaves the generation alone when nothing changed; then the
+        # wrapper from a current labels view is still accurate
+        if self._rust_registry.generation == generation:
+            if self._labels_cache is not None and self._labels_cache_gen == generation:
+                cached = self._labels_cache.get(label_id)
+                if cached is not None:
+                    return cached
+            return RustLabelEntry(entry)
+        self._fire_event("update", label_id)
+        return RustLabelEntry(entry)
 
     @property
     def labels(self) -> dict[str, RustLabelEntry]:
-        # Sort by created_at for deterministic order (DashMap doesn't preserve insertion order)
-        entries = sorted(self._rust_registry.labels.values(), key=lambda e: e.created_at)
-        return {
+        generation = self._rust_registry.generation
+        if self._labels_cache is not None and self._labels_cache_gen == generation:
+            return self._labels_cache
+        # Rust sorts by created_at (DashMap doesn't preserve insertion order)
+        entries = self._rust_registry.sorted_by_created_at()
+        self._labels_cache = {
             entry.label_id: RustLabelEntry(entry)
             for entry in entries
         }
+        self._labels_cache_gen = generation
+        return self._labels_cache
 
     def __iter__(self):
         return iter(self.labels.values())
@@ -3190,20 +3551,38 @@ class RustLabelRegistry:
 # Rust-backed Template wrappers
 # =============================================================================
 
+# Rust Templates by template string, per owner of the state machine they read
+# (a hass or the shared Rust instance); each one sets up a whole environment
+_rust_templates: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _get_rust_template(template: str, owner: Any) -> Any:
+    """Return the Rust Template for `template` over `owner`'s state machine."""
+    try:
+        templates = _rust_templates.setdefault(owner, {})
+    except TypeError:
+        # Owner can't be weakly referenced, so don't cache for it
+        templates = {}
+    rust_template = templates.get(template)
+    if rust_template is None:
+        states = getattr(owner, "_rust_states", None)
+        if states is None:
+            states = owner.states
+        rust_template = templates[template] = ha_core_rs.Template(template, states)
+    return rust_template
+
+
 class RustTemplate:
     """Wrapper that provides HA-compatible Template API backed by Rust."""
 
+    __slots__ = ("_rust_template", "_template_str", "_hass")
+
     def __init__(self, template: str, hass: Any = None):
         if not _rust_available:
             raise RuntimeError("ha_core_rs not available")
         rust_hass = _get_rust_hass() if hass is None else hass
-        # Use the state machine from the hass instance
-        if hasattr(rust_hass, '_rust_states'):
-            self._rust_template = ha_core_rs.Template(template, rust_hass._rust_states)
-        elif hasattr(rust_hass, 'states'):
-            self._rust_template = ha_core_rs.Template(template, rust_hass.states)
-        else:
-            self._rust_template = ha_core_rs.Template(template, rust_hass.states)
+        # Rust Templates are immutable, so equal strings share one
+        self._rust_template = _get_rust_template(template, rust_hass)
         self._template_str = template
         self._hass = hass
 
@@ -3230,6 +3609,8 @@ class RustTemplate:
 class RustTemplateEngine:
     """Wrapper for TemplateEngine for advanced usage."""
 
+    __slots__ = ("_rust_engine",)
+
     def __init__(self, state_machine):
         if not _rust_available:
             raise RuntimeError("ha_core_rs not available")
@@ -3262,18 +3643,28 @@ class RustTemplateEngine:
 class RustConfigEntry:
     """Wrapper for ConfigEntry compatible with homeassistant.config_entries."""
 
-    __slots__ = ("_rust_entry",)
+    __slots__ = ("_rust_entry", "_created_at", "_modified_at", "_data", "_options")
 
     def __init__(self, rust_entry):
         self._rust_entry = rust_entry
+        self._created_at = None
+        self._modified_at = None
+        self._data = None
+        self._options = None
 
     @property
     def created_at(self) -> datetime:
-        return _parse_iso_datetime(self._rust_entry.created_at)
+        if self._created_at is None:
+            self._created_at = _parse_iso_datetime(self._rust_entry.created_at)
+        return self._created_at
 
     @property
-    def data(self) -> dict:
-        return self._rust_entry.data
+    def data(self) -> MappingProxyType:
+        # Rust rebuilds the dict on every read; convert once and hand out a
+        # read-only view, as HA's ConfigEntry does
+        if self._data is None:
+            self._data = MappingProxyType(self._rust_entry.data)
+        return self._data
 
     @property
     def disabled_by(self) -> str | None:
@@ -3293,11 +3684,15 @@ class RustConfigEntry:
 
     @property
     def modified_at(self) -> datetime:
-        return _parse_iso_datetime(self._rust_entry.modified_at)
+        if self._modified_at is None:
+            self._modified_at = _parse_iso_datetime(self._rust_entry.modified_at)
+        return self._modified_at
 
     @property
-    def options(self) -> dict:
-        return self._rust_entry.options
+    def options(self) -> MappingProxyType:
+        if self._options is None:
+            self._options = MappingProxyType(self._rust_entry.options)
+        return self._options
 
     @property
     def pref_disable_new_entities(self) -> bool:
@@ -3355,6 +3750,9 @@ class RustConfigEntry:
 class RustConfigEntries:
     """Wrapper that provides HA-compatible ConfigEntries API backed by Rust."""
 
+    # __dict__ stays so tests can patch.object(hass.config_entries, ...)
+    __slots__ = ("_rust_entries", "_storage", "__dict__")
+
     def __init__(self, storage: RustStorage):
         if not _rust_available:
             raise RuntimeError("ha_core_rs not available")
@@ -3392,10 +3790,9 @@ class RustConfigEntries:
         return RustConfigEntry(entry)
 
     def async_entries(self, domain: str | None = None) -> list[RustConfigEntry]:
-        return [
-            RustConfigEntry(entry)
-            for entry in self._rust_entries.async_entries(domain)
-        ]
+        # HA callers len() and index the result, so it stays a list; map()
+        # wraps the entries without a comprehension frame
+        return list(map(RustConfigEntry, self._rust_entries.async_entries(domain)))
 
     def async_get_entry(self, entry_id: str) -> RustConfigEntry | None:
         entry = self._rust_entries.async_get_entry(entry_id)
@@ -3408,10 +3805,7 @@ class RustConfigEntries:
         return RustConfigEntry(entry) if entry else None
 
     def async_loaded_entries(self, domain: str) -> list[RustConfigEntry]:
-        return [
-            RustConfigEntry(entry)
-            for entry in self._rust_entries.async_loaded_entries(domain)
-        ]
+        return list(map(RustConfigEntry, self._rust_entries.async_loaded_entries(domain)))
 
     async def async_reload(self, entry_id: str) -> None:
         self._rust_entries.async_reload(entry_id)
@@ -3451,10 +3845,11 @@ class RustConfigEntries:
 class RustAutomation:
     """Wrapper for Automation compatible with homeassistant.components.automation."""
 
-    __slots__ = ("_rust_automation",)
+    __slots__ = ("_rust_automation", "_last_triggered")
 
     def __init__(self, rust_automation):
         self._rust_automation = rust_automation
+        self._last_triggered = UNDEFINED
 
     @property
     def actions(self) -> list:
@@ -3486,8 +3881,11 @@ class RustAutomation:
 
     @property
     def last_triggered(self) -> datetime | None:
-        ts = self._rust_automation.last_triggered
-        return _parse_iso_datetime(ts) if ts else None
+        # None is a valid value here, so UNDEFINED marks "not parsed yet"
+        if self._last_triggered is UNDEFINED:
+            ts = self._rust_automation.last_triggered
+            self._last_triggered = _parse_iso_datetime(ts) if ts else None
+        return self._last_triggered
 
     @property
     def mode(self) -> str:
@@ -3519,6 +3917,9 @@ class RustAutomation:
 class RustAutomationManager:
     """Wrapper that provides HA-compatible AutomationManager API backed by Rust."""
 
+    # Shared per hass like the registries, so keep __dict__ for patch.object()
+    __slots__ = ("_rust_manager", "__dict__")
+
     def __init__(self):
         if not _rust_available:
             raise RuntimeError("ha_core_rs not available")
@@ -3572,12 +3973,12 @@ class RustAutomationManager:
 
 # Tests that require the disable_translations_once fixture because they
 # depend on translations NOT being cached at test start
-TESTS_NEEDING_FRESH_TRANSLATIONS = {
+TESTS_NEEDING_FRESH_TRANSLATIONS = frozenset({
     "test_call_service_not_found",
     "test_eventbus_max_length_exceeded",
     "test_parallel_error",
     "test_serviceregistry_service_that_not_exists",
-}
+})
 
 
 def pytest_configure(config):
@@ -3598,8 +3999,9 @@ def pytest_collection_modifyitems(session, config, items):
     session-scoped translations_once fixture caches translations, which can cause
     these tests to fail if other tests ran first and populated the cache.
     """
+    needed = TESTS_NEEDING_FRESH_TRANSLATIONS
     for item in items:
-        if item.name in TESTS_NEEDING_FRESH_TRANSLATIONS:
+        if item.name in needed:
             # Add the disable_translations_once fixture to these tests
             item.fixturenames.append("disable_translations_once")
 
@@ -3613,8 +4015,13 @@ def patch_ha_core():
         yield
         return
 
-    # Reset the shared Rust instance for each test
-    _rust_hass = ha_core_rs.HomeAssistant()
+    # Reuse the shared Rust instance, clearing it in place for each test
+    if _rust_hass is None:
+        _rust_hass = ha_core_rs.HomeAssistant()
+    else:
+        _rust_hass.reset()
+        # The shared instance is never collected, so drop its templates here
+        _rust_templates.pop(_rust_hass, None)
 
     import homeassistant.core as ha_core
 
@@ -3623,9 +4030,6 @@ def patch_ha_core():
          patch.object(ha_core, 'State', RustState):
         yield
 
-    # Clean up
-    _rust_hass = None
-
 
 # NOTE: Condition/trigger patching is NOT enabled by default because:
 # 1. HA's condition tests check specific tracing, error messages, and validation
@@ -3768,15 +4172,25 @@ class RustConditionChecker:
     def __init__(self, rust_hass, condition_config: dict):
         self._rust_hass = rust_hass
         self._config = condition_config
+        # States handed to Rust by the last sync, compared by identity
+        self._synced_states: list = []
 
     def _sync_states_from_ha(self, hass: Any) -> None:
         """Sync states from HA's state machine to Rust."""
-        rust_states = self._rust_hass.states
-
-        # Get all states from HA and set them in Rust
-        for state in hass.states.async_all():
-            attrs = dict(state.attributes) if state.attributes else {}
-            rust_states.set(state.entity_id, state.state, attrs)
+        states = hass.states.async_all()
+        # HA swaps in a new State object whenever an entity's state or
+        # attributes change, so the same objects mean Rust is already current
+        synced = self._synced_states
+        if len(states) == len(synced) and all(map(operator.is_, states, synced)):
+            return
+        # Hand every HA state to Rust in one call; attributes are read as-is
+        self._rust_hass.states.bulk_set(
+            [
+                (state.entity_id, state.state, state.attributes or None)
+                for state in states
+            ]
+        )
+        self._synced_states = states
 
     def __call__(self, hass: Any, variables: dict | None = None) -> bool:
         """Evaluate the condition.
@@ -3937,14 +4351,16 @@ class RustWebSocketClient:
         self.ws = await self.session.ws_connect(RUST_WS_URL)
 
         # Wait for auth_required
-        msg = await self.ws.receive_json()
+        msg = await self.ws.receive_json(loads=_ws_loads)
         assert msg["type"] == "auth_required", f"Expected auth_required, got {msg}"
 
         # Send auth (our test server accepts any token)
-        await self.ws.send_json({"type": "auth", "access_token": "test_token"})
+        await self.ws.send_json(
+            {"type": "auth", "access_token": "test_token"}, dumps=_ws_dumps
+        )
 
         # Wait for auth_ok
-        msg = await self.ws.receive_json()
+        msg = await self.ws.receive_json(loads=_ws_loads)
         assert msg["type"] == "auth_ok", f"Expected auth_ok, got {msg}"
 
     async def close(self) -> None:
@@ -3957,7 +4373,7 @@ class RustWebSocketClient:
         """Send JSON data to the server."""
         if not self.ws:
             raise RuntimeError("Not connected")
-        await self.ws.send_json(data)
+        await self.ws.send_json(data, dumps=_ws_dumps)
 
     async def send_json_auto_id(self, data: dict) -> None:
         """Send JSON with auto-incremented ID."""
@@ -3970,7 +4386,9 @@ class RustWebSocketClient:
         if not self.ws:
             raise RuntimeError("Not connected")
         try:
-            return await asyncio.wait_for(self.ws.receive_json(), timeout=timeout)
+            return await asyncio.wait_for(
+                self.ws.receive_json(loads=_ws_loads), timeout=timeout
+            )
         except asyncio.TimeoutError:
             raise TimeoutError(f"No response from server within {timeout}s")
 
@@ -4376,14 +4794,16 @@ class RustWebSocketClient:
         self.ws = await self.session.ws_connect(RUST_WS_URL)
 
         # Wait for auth_required
-        msg = await self.ws.receive_json()
+        msg = await self.ws.receive_json(loads=_ws_loads)
         assert msg["type"] == "auth_required", f"Expected auth_required, got {msg}"
 
         # Send auth (our test server accepts any token)
-        await self.ws.send_json({"type": "auth", "access_token": "test_token"})
+        await self.ws.send_json(
+            {"type": "auth", "access_token": "test_token"}, dumps=_ws_dumps
+        )
 
         # Wait for auth_ok
-        msg = await self.ws.receive_json()
+        msg = await self.ws.receive_json(loads=_ws_loads)
         assert msg["type"] == "auth_ok", f"Expected auth_ok, got {msg}"
 
     async def close(self) -> None:
@@ -4396,7 +4816,7 @@ class RustWebSocketClient:
         """Send JSON data to the server."""
         if not self.ws:
             raise RuntimeError("Not connected")
-        await self.ws.send_json(data)
+        await self.ws.send_json(data, dumps=_ws_dumps)
 
     async def send_json_auto_id(self, data: dict) -> None:
         """Send JSON with auto-incremented ID."""
@@ -4409,7 +4829,9 @@ class RustWebSocketClient:
         if not self.ws:
             raise RuntimeError("Not connected")
         try:
-            return await asyncio.wait_for(self.ws.receive_json(), timeout=timeout)
+            return await asyncio.wait_for(
+                self.ws.receive_json(loads=_ws_loads), timeout=timeout
+            )
         except asyncio.TimeoutError:
             raise TimeoutError(f"No response from server within {timeout}s")
 
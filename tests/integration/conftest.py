@@ -17,6 +17,7 @@ from typing import Any, AsyncGenerator
 import pytest
 import pytest_asyncio
 import aiohttp
+from pytest_asyncio import is_async_test
 
 
 # Configure pytest-asyncio
@@ -30,6 +31,14 @@ def pytest_configure(config):
     )
 
 
+def pytest_collection_modifyitems(items):
+    """Run async tests on the session loop so they can share session fixtures."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
 def get_repo_root() -> Path:
     """Get the repository root directory."""
     return Path(__file__).parent.parent.parent
@@ -187,17 +196,30 @@ def rust_server(tmp_path_factory) -> RustServerProcess:
     server.stop()
 
 
-@pytest_asyncio.fixture
-async def rust_ws_client(rust_server) -> AsyncGenerator[RustWebSocketClient, None]:
-    """Provide a connected WebSocket client to the Rust server."""
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def rust_client_session(rust_server) -> AsyncGenerator[aiohttp.ClientSession, None]:
+    """Provide one aiohttp session (and connection pool) for the whole run."""
     async with aiohttp.ClientSession() as session:
-        client = RustWebSocketClient(session)
-        await client.connect()
-        yield client
-        await client.close()
+        yield session
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def rust_ws_client(
+    rust_client_session,
+) -> AsyncGenerator[RustWebSocketClient, None]:
+    """Provide a connected WebSocket client to the Rust server.
+
+    Each test still gets its own WebSocket: the server requires message ids to
+    increase per connection and subscriptions would otherwise leak events
+    into the next test.
+    """
+    client = RustWebSocketClient(rust_client_session)
+    await client.connect()
+    yield client
+    await client.close()
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def rust_http_client(rust_server) -> AsyncGenerator[aiohttp.ClientSession, None]:
     """Provide an HTTP client session for REST API tests."""
     async with aiohttp.ClientSession(base_url=RUST_SERVER_URL) as session: